@@ -0,0 +1,432 @@
+import math
+import os
+import random
+import sys
+import tempfile
+import timeit
+import tracemalloc
+import myArray
+from myArray import Array
+from dynamicArray import DynamicArray
+from recordArray import RecordArray
+from matrix import Matrix
+from ringBuffer import RingBuffer
+from chunkedArray import ChunkedArray
+import matrix
+
+
+def bench(label: str, stmt, number: int = 1):
+    """
+    Time `stmt` and print the best of three runs.
+    """
+    best = min(timeit.repeat(stmt, number=number, repeat=3))
+    print(str.format("{:<40}{:>10.3f} s", label, best))
+
+
+def benchArrayAccess(n: int):
+    """
+    Construction, indexed reads/writes and list conversion of an `int` array of size `n`.
+    """
+    print(str.format("--- Array access (n={}) ---", n))
+    values = list(range(n))
+    arr = Array.listToArray(values)
+
+    def readAll():
+        get = arr.get
+        for i in range(n):
+            get(i)
+
+    def writeAll():
+        set = arr.set
+        for i in range(n):
+            set(i, i)
+
+    bench("Array(n, int)", lambda: Array(n, int))
+    bench("Array.listToArray()", lambda: Array.listToArray(values))
+    bench("get() x n", readAll)
+    bench("set() x n", writeAll)
+    bench("toList()", arr.toList)
+    bench("extend()", arr.extend)
+
+
+def benchIteration(n: int):
+    """
+    Full scans of an `int` array: index loops over `get()` against the iteration protocol.
+    """
+    print(str.format("--- Iteration (n={}) ---", n))
+    arr = Array.listToArray(list(range(n)))
+
+    def getLoop():
+        for i in range(arr.size()):
+            arr.get(i)
+
+    def iterate():
+        for item in arr:
+            pass
+
+    bench("for i in range(size): get(i)", getLoop)
+    bench("for item in arr", iterate)
+    bench("str(arr)", lambda: str(arr))
+    bench("n - 1 in arr", lambda: n - 1 in arr)
+
+
+def benchBulkOperations(n: int):
+    """
+    Bulk operations against the equivalent loops over `get()`/`set()`.
+    """
+    print(str.format("--- Bulk operations (n={}) ---", n))
+    a = Array.listToArray([float(i) for i in range(n)])
+    b = Array.listToArray([float(i) for i in range(n)])
+
+    def fillLoop():
+        for i in range(n):
+            a.set(i, 1.0)
+
+    def sumLoop():
+        total = 0.0
+        for i in range(n):
+            total += a.get(i)
+
+    def addLoop():
+        c = Array(n, float)
+        for i in range(n):
+            c.set(i, a.get(i) + b.get(i))
+
+    bench("set() loop", fillLoop)
+    bench("fill()", lambda: a.fill(1.0))
+    bench("get() loop sum", sumLoop)
+    bench("sum()", a.sum)
+    bench("get()/set() loop add", addLoop)
+    bench("add()", lambda: a + b)
+
+
+def benchClone(n: int, snapshots: int = 100):
+    """
+    Taking `snapshots` read-only snapshots of an `int` array of size `n`: full copies against copy-on-write clones, and the cost of the first write to a clone.
+    """
+    print(str.format("--- Clone (n={}, snapshots={}) ---", n, snapshots))
+    arr = Array.listToArray(list(range(n)))
+
+    def firstWrite():
+        arr.clone().set(0, 0)
+
+    bench("getSlice() snapshots", lambda: [arr.getSlice() for i in range(snapshots)])
+    bench("clone() snapshots", lambda: [arr.clone() for i in range(snapshots)])
+    bench("clone() + first write", firstWrite)
+
+
+def benchNulls(n: int):
+    """
+    A `float` column of size `n` with every tenth value missing: a list holding `None` against an `Array` with a validity bitmap.
+    """
+    print(str.format("--- Nulls (n={}) ---", n))
+    values = [None if i % 10 == 0 else float(i) for i in range(n)]
+
+    def allocated(build):
+        tracemalloc.start()
+        column = build()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return column, size
+
+    def build():
+        column = Array(n, float)
+        column.setMany([i for i in range(n) if i % 10], [float(i) for i in range(n) if i % 10])
+        return column
+
+    threshold = myArray._LAZY_BYTES
+    myArray._LAZY_BYTES = float("inf")
+    listed, listBytes = allocated(lambda: list(values))
+    column, columnBytes = allocated(build)
+    myArray._LAZY_BYTES = threshold
+
+    print(str.format("{:<40}{:>10.1f} MB", "list with None (and float objects)", (listBytes + (n - n // 10) * sys.getsizeof(1.0)) / 2**20))
+    print(str.format("{:<40}{:>10.1f} MB", "Array with validity bitmap", columnBytes / 2**20))
+    bench("list count(None)", lambda: listed.count(None))
+    bench("countNulls()", column.countNulls)
+    bench("list sum() skipping None", lambda: sum(x for x in listed if x is not None))
+    bench("sum()", column.sum)
+    bench("fillNulls()", lambda: column.clone().fillNulls(0.0))
+
+
+def benchAppend(n: int):
+    """
+    Appending `n` items one at a time: doubling through `Array.extend()` against `DynamicArray.append()`.
+    """
+    print(str.format("--- Append (n={}) ---", n))
+
+    def extendLoop():
+        arr = Array(1, int)
+        for i in range(n):
+            if i == arr.size():
+                arr = arr.extend()
+            arr.set(i, i)
+
+    def appendLoop():
+        arr = DynamicArray(int, 1)
+        for i in range(n):
+            arr.append(i)
+
+    bench("Array.extend() + set()", extendLoop)
+    bench("DynamicArray.append()", appendLoop)
+    bench("DynamicArray.appendMany()", lambda: DynamicArray(int, 1).appendMany(range(n)))
+
+    full = DynamicArray(int, n)
+    full.appendMany(range(n - 1))
+
+    def boundaryLoop():
+        for i in range(1000):
+            full.append(i)
+            full.pop()
+
+    bench("append() + pop() at capacity x 1000", boundaryLoop)
+
+
+def benchMappedFile(n: int):
+    """
+    Startup cost of a lookup table: rebuilding it through `listToArray()` against opening a memory-mapped file.
+    """
+    print(str.format("--- Mapped file (n={}) ---", n))
+    values = list(range(n))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "table.arr")
+        arr = Array.mapFile(path, int, n)
+        arr.setSlice(0, n, values)
+        arr.close()
+
+        bench("Array.listToArray()", lambda: Array.listToArray(values))
+        bench("Array.mapFile()", lambda: Array.mapFile(path, readonly=True).close())
+
+
+def benchSort(n: int):
+    """
+    Sorting random integers: the `toList()`/`sorted()`/`listToArray()` round-trip against `Array.sort()`.
+    """
+    print(str.format("--- Sort (n={}) ---", n))
+    values = [random.randrange(-2**40, 2**40) for i in range(n)]
+    engine = myArray.numpy
+
+    def roundTrip():
+        arr = Array.listToArray(values)
+        return Array.listToArray(sorted(arr.toList()))
+
+    def inPlace():
+        arr = Array.listToArray(values)
+        arr.sort()
+
+    bench("list round-trip", roundTrip)
+    bench("Array.sort()", inPlace)
+
+    myArray.numpy = None
+    bench("Array.sort() without NumPy", inPlace)
+    myArray.numpy = engine
+
+
+def benchParallel(n: int):
+    """
+    Sequential reductions and maps against their process-pool versions (speedup depends on the number of CPUs).
+    """
+    print(str.format("--- Parallel (n={}, cpus={}) ---", n, os.cpu_count()))
+    ints = Array.listToArray(list(range(n)))
+    floats = Array.listToArray([float(i) for i in range(n)])
+
+    bench("sum()", ints.sum)
+    bench("parallelReduce(\"sum\")", lambda: ints.parallelReduce("sum"))
+    bench("map(math.sqrt)", lambda: floats.map(math.sqrt))
+    bench("parallelMap(math.sqrt)", lambda: floats.parallelMap(math.sqrt))
+
+
+def benchAllocation(n: int):
+    """
+    Short-lived scratch arrays: constructing an `int` array of size `n` and touching a few of its slots, with storage zeroed up front against reserved lazily.
+    """
+    print(str.format("--- Allocation (n={}) ---", n))
+    threshold = myArray._LAZY_BYTES
+
+    def scratch():
+        arr = Array(n, int)
+        for i in range(0, n, max(n // 1000, 1)):
+            arr.set(i, i)
+
+    myArray._LAZY_BYTES = float("inf")
+    bench("Array(n, int) zeroed", lambda: Array(n, int))
+    bench("Array(n, int) zeroed + 1000 writes", scratch)
+
+    myArray._LAZY_BYTES = threshold
+    bench("Array(n, int) lazy", lambda: Array(n, int))
+    bench("Array(n, int) lazy + 1000 writes", scratch)
+
+
+class Trade:
+    """
+    A small record object, the row-oriented alternative to `RecordArray`.
+    """
+
+    def __init__(self, id: int, price: float, quantity: int):
+        self.id = id
+        self.price = price
+        self.quantity = quantity
+
+
+def benchChunkedAppend(n: int, batch: int = 10000):
+    """
+    Growing an `int` array to `n` items in batches: doubling through `Array.extend()`, `DynamicArray.appendMany()` and `ChunkedArray.appendMany()`. Peak memory is traced with lazy allocation turned off, since memory mappings are invisible to `tracemalloc`.
+    """
+    print(str.format("--- Chunked append (n={}, batch={}) ---", n, batch))
+    values = list(range(batch))
+    threshold = myArray._LAZY_BYTES
+
+    def extendLoop():
+        arr = Array(batch, int)
+        for start in range(0, n, batch):
+            if start + batch > arr.size():
+                arr = arr.extend()
+            arr.setSlice(start, start + batch, values)
+
+    def dynamicLoop():
+        arr = DynamicArray(int)
+        for start in range(0, n, batch):
+            arr.appendMany(values)
+
+    def chunkedLoop():
+        arr = ChunkedArray(int)
+        for start in range(0, n, batch):
+            arr.appendMany(values)
+
+    def peak(build):
+        tracemalloc.start()
+        build()
+        size = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return size
+
+    myArray._LAZY_BYTES = float("inf")
+
+    for label, build in (("Array.extend()", extendLoop), ("DynamicArray.appendMany()", dynamicLoop), ("ChunkedArray.appendMany()", chunkedLoop)):
+        bench(label, build)
+        print(str.format("{:<40}{:>10.1f} MB", "  peak memory", peak(build) / 2**20))
+
+    myArray._LAZY_BYTES = threshold
+
+
+def benchRecords(n: int):
+    """
+    `n` three-field records as a list of small objects against a `RecordArray`: memory held and a scan over one field.
+    """
+    print(str.format("--- Records (n={}) ---", n))
+    schema = {"id": int, "price": float, "quantity": int}
+
+    def allocated(build):
+        tracemalloc.start()
+        records = build()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return records, size
+
+    objects, objectBytes = allocated(lambda: [Trade(i, i * 0.5, i % 100) for i in range(n)])
+    records, recordBytes = allocated(lambda: RecordArray.listToArray([(i, i * 0.5, i % 100) for i in range(n)], schema))
+
+    print(str.format("{:<40}{:>10.1f} MB", "list of objects", objectBytes / 2**20))
+    print(str.format("{:<40}{:>10.1f} MB", "RecordArray", recordBytes / 2**20))
+    bench("sum(o.price for o in objects)", lambda: sum(o.price for o in objects))
+    bench("column(\"price\").sum()", records.column("price").sum)
+
+
+def benchMatrix(n: int):
+    """
+    A square matrix of about `n` items as an `Array` of row `Array`s against a `Matrix`: column walks, transpose and multiplication.
+    """
+    side = math.isqrt(n)
+    small = min(side, 200)
+    print(str.format("--- Matrix (side={}, matmul side={}) ---", side, small))
+    rows = [[float(i * side + j) for j in range(side)] for i in range(side)]
+    nested = Array.listToArray([Array.listToArray(row) for row in rows])
+    m = Matrix.listToMatrix(rows)
+    a = Matrix.listToMatrix([row[:small] for row in rows[:small]])
+    nestedSmall = Array.listToArray([Array.listToArray(row[:small]) for row in rows[:small]])
+
+    def columnWalk():
+        for j in range(side):
+            for i in range(side):
+                nested.get(i).get(j)
+
+    def nestedTranspose():
+        result = Array(side, Array)
+        for j in range(side):
+            result.set(j, Array.listToArray([nested.get(i).get(j) for i in range(side)]))
+
+    def nestedMatmul():
+        result = Array(small, Array)
+        for i in range(small):
+            row = Array(small, float)
+            for j in range(small):
+                row.set(j, sum(nestedSmall.get(i).get(k) * nestedSmall.get(k).get(j) for k in range(small)))
+            result.set(i, row)
+
+    def withoutNumPy():
+        engine = matrix.numpy
+        matrix.numpy = None
+        a @ a
+        matrix.numpy = engine
+
+    bench("nested column walk", columnWalk)
+    bench("Matrix.column() walk", lambda: [m.column(j).toList() for j in range(side)])
+    bench("nested transpose", nestedTranspose)
+    bench("Matrix.transpose()", m.transpose)
+    bench("nested matmul", nestedMatmul)
+    bench("Matrix.matmul()", lambda: a @ a)
+    bench("Matrix.matmul() without NumPy", withoutNumPy)
+
+
+def benchRingBuffer(n: int, window: int = 1000):
+    """
+    A sliding window over `n` float samples: a `RingBuffer` in overwrite mode against a `LinkedList` that drops its oldest node.
+    """
+    print(str.format("--- Ring buffer (n={}, window={}) ---", n, window))
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "LinkedList"))
+    from MyLinkedList import LinkedList
+
+    def linkedWindow():
+        samples = LinkedList()
+        for i in range(n):
+            samples.append(float(i))
+            if samples.size() > window:
+                samples.pop()
+        return samples
+
+    def ringWindow():
+        samples = RingBuffer(window, float, overwrite=True)
+        for i in range(n):
+            samples.pushBack(float(i))
+        return samples
+
+    def retained(build):
+        tracemalloc.start()
+        samples = build()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        return size
+
+    bench("LinkedList append() + pop()", linkedWindow)
+    bench("RingBuffer.pushBack()", ringWindow)
+    print(str.format("{:<40}{:>10.1f} KB", "LinkedList window", retained(linkedWindow) / 2**10))
+    print(str.format("{:<40}{:>10.1f} KB", "RingBuffer window", retained(ringWindow) / 2**10))
+
+
+if __name__ == "__main__":
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 1_000_000
+    benchArrayAccess(n)
+    benchAllocation(n)
+    benchIteration(n)
+    benchBulkOperations(n)
+    benchClone(n)
+    benchNulls(n)
+    benchAppend(n)
+    benchChunkedAppend(n)
+    benchRecords(n)
+    benchMatrix(n)
+    benchRingBuffer(n)
+    benchMappedFile(n)
+    benchSort(n)
+    benchParallel(n)
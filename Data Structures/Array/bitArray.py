@@ -0,0 +1,244 @@
+import re
+from itertools import chain
+
+
+# The eight flags packed into every possible byte, least significant bit first.
+_BITS = [tuple(bool(byte >> bit & 1) for bit in range(8)) for byte in range(256)]
+
+# Maps the bytes `0` and `1` to the digits `"0"` and `"1"`, to pack flags through `int(..., 2)`.
+_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+_NONZERO = re.compile(rb"[^\x00]")
+
+
+class BitArray:
+    """
+    A fixed-size array of `bool` flags packed eight to a byte. Slots default to `False`. Bulk operations work on the whole bit string at once instead of flag by flag. Current implementation consists of:\n
+    `get()` - Retreive flag at provided index.\n
+    `set()` - Set flag at provided index.\n
+    `size()` - Return the size of the array.\n
+    `type()` - Return the type of the array elements, i.e. `bool`.\n
+    `listToArray()` - Convert a list of `bool` to a bit array and return its instance.\n
+    `toList()` - Convert the bit array to a list and return it.\n
+    `bitAnd()`, `bitOr()`, `bitXor()`, `bitNot()` - Bitwise operations, also available as `&`, `|`, `^` and `~`.\n
+    `popcount()` - Return the number of set flags.\n
+    `findFirstSet()` - Return the index of the first set flag.\n
+    `rank()` - Return the number of set flags before provided index.
+    """
+
+    # RELATED TESTS
+    #   test_initializeBitArray()
+    def __init__(self, size: int):
+        """
+        Initialize a bit array of `size` flags, all `False`.
+        """
+        self.__size = size
+        self.__bits = bytearray((size + 7) >> 3)
+
+
+    def __str__(self) -> str:
+        return str.format("[{}]", ",".join(map(str, self.toList())))
+
+
+    def __len__(self) -> int:
+        return self.__size
+
+
+    # RELATED TESTS
+    #   test_convertListToBitArray()
+    def __iter__(self):
+        return iter(self.toList())
+
+
+    # RELATED TESTS
+    #   test_setAndGetFlags()
+    #   test_setFlagAtIllegalIndex()
+    def get(self, index: int) -> bool:
+        """
+        Return the flag at provided index.
+        """
+        if 0 <= index < self.__size:
+            return bool(self.__bits[index >> 3] >> (index & 7) & 1)
+
+        raise IndexError("Array index out of range!")
+
+
+    # RELATED TESTS
+    #   test_setAndGetFlags()
+    #   test_setFlagAtIllegalIndex()
+    def set(self, index: int, item: bool):
+        """
+        Set the flag at provided index.
+        """
+        if type(item) != bool:
+            raise TypeError("Illegal type for the array!")
+
+        if not(0 <= index < self.__size):
+            raise IndexError("Array index out of range!")
+
+        if item:
+            self.__bits[index >> 3] |= 1 << (index & 7)
+        else:
+            self.__bits[index >> 3] &= ~(1 << (index & 7))
+
+
+    def size(self) -> int:
+        """
+        Return the size of the array.
+        """
+        return self.__size
+
+
+    def type(self):
+        """
+        Return the type of stored elements.
+        """
+        return bool
+
+
+    # RELATED TESTS
+    #   test_convertListToBitArray()
+    def listToArray(l: list):
+        """
+        Convert a list of `bool` to a bit array and return it.
+        """
+        if not(set(map(type, l)) <= {bool}):
+            raise TypeError("Illegal type for the array!")
+
+        arr = BitArray(len(l))
+
+        if len(l) > 0:
+            value = int(bytes(reversed(l)).translate(_DIGITS), 2)
+            arr.__bits[:] = value.to_bytes(len(arr.__bits), "little")
+
+        return arr
+
+
+    # RELATED TESTS
+    #   test_convertListToBitArray()
+    def toList(self) -> list:
+        """
+        Convert this bit array to a built-in list.
+        """
+        return list(chain.from_iterable(map(_BITS.__getitem__, self.__bits)))[:self.__size]
+
+
+    # RELATED TESTS
+    #   test_bitwiseOperations()
+    #   test_bitwiseOperationsOfDifferentSizes()
+    def bitAnd(self, other):
+        """
+        Return a new bit array of `self[i] and other[i]`.
+        """
+        return self.__combine(self.__value() & self.__operand(other))
+
+
+    def bitOr(self, other):
+        """
+        Return a new bit array of `self[i] or other[i]`.
+        """
+        return self.__combine(self.__value() | self.__operand(other))
+
+
+    def bitXor(self, other):
+        """
+        Return a new bit array of `self[i] != other[i]`.
+        """
+        return self.__combine(self.__value() ^ self.__operand(other))
+
+
+    def bitNot(self):
+        """
+        Return a new bit array of `not self[i]`.
+        """
+        return self.__combine(~self.__value() & ((1 << self.__size) - 1))
+
+
+    __and__ = bitAnd
+    __or__ = bitOr
+    __xor__ = bitXor
+    __invert__ = bitNot
+
+
+    # RELATED TESTS
+    #   test_countAndFindFlags()
+    def popcount(self) -> int:
+        """
+        Return the number of flags that are set.
+        """
+        return self.__value().bit_count()
+
+
+    # RELATED TESTS
+    #   test_countAndFindFlags()
+    def findFirstSet(self, start: int = 0) -> int:
+        """
+        Return the index of the first set flag at or after `start`, or `-1` if there is none.
+        """
+        if start < 0:
+            raise IndexError("Array index out of range!")
+
+        if start >= self.__size:
+            return -1
+
+        # Flags before `start` in its byte are masked out; later bytes are skipped by a C-level scan for non-zero bytes.
+        byte = start >> 3
+        head = self.__bits[byte] >> (start & 7) << (start & 7)
+
+        if head == 0:
+            match = _NONZERO.search(self.__bits, byte + 1)
+
+            if match == None:
+                return -1
+
+            byte = match.start()
+            head = self.__bits[byte]
+
+        return (byte << 3) + (head & -head).bit_length() - 1
+
+
+    # RELATED TESTS
+    #   test_countAndFindFlags()
+    def rank(self, index: int) -> int:
+        """
+        Return the number of set flags before provided index.
+        """
+        if not(0 <= index <= self.__size):
+            raise IndexError("Array index out of range!")
+
+        full = int.from_bytes(self.__bits[:index >> 3], "little").bit_count()
+
+        if index & 7 == 0:
+            return full
+
+        return full + (self.__bits[index >> 3] & ((1 << (index & 7)) - 1)).bit_count()
+
+
+    def __value(self) -> int:
+        """
+        Return the flags as one integer, flag `i` being bit `i`.
+        """
+        return int.from_bytes(self.__bits, "little")
+
+
+    def __operand(self, other) -> int:
+        """
+        Return the flags of another bit array of the same size as one integer.
+        """
+        if type(other) != BitArray:
+            raise TypeError("Bitwise operations require another bit array!")
+
+        if other.__size != self.__size:
+            raise ValueError("Bit arrays must be of the same size!")
+
+        return other.__value()
+
+
+    def __combine(self, value: int):
+        """
+        Return a new bit array of this size holding the flags of `value`.
+        """
+        arr = BitArray(self.__size)
+        arr.__bits[:] = value.to_bytes(len(arr.__bits), "little")
+
+        return arr
@@ -0,0 +1,209 @@
+from bisect import bisect_right
+from itertools import chain, islice
+from myArray import Array
+
+
+class ChunkedArray:
+    """
+    A growable, homogeneous array made of a list of fixed-size `Array` chunks. Growing adds a chunk instead of copying the items, so appending takes constant time and peak memory stays close to the size of the data. Current implementation consists of:\n
+    `get()` - Retreive item from provided index.\n
+    `set()` - Set item at provided index.\n
+    `append()` - Add an item to the end of the array.\n
+    `appendMany()` - Add many items to the end of the array, a chunk at a time.\n
+    `concat()` - Return the concatenation of two chunked arrays, sharing their chunks.\n
+    `size()` - Return the number of stored items.\n
+    `type()` - Return the type of the array elements.\n
+    `chunkCount()` - Return the number of chunks.\n
+    `toList()` - Convert the array to a list and return it.\n
+    `toArray()` - Copy the items into a single `Array`.
+    """
+
+    # RELATED TESTS
+    #   test_initializeChunkedArray()
+    def __init__(self, type: type, chunkSize: int = 1 << 16):
+        """
+        Initialize an empty chunked array of `type` items. New chunks hold `chunkSize` items.
+        """
+        if chunkSize < 1:
+            raise ValueError("Chunk size must be at least 1!")
+
+        self.__type = type
+        self.__chunkSize = chunkSize
+        self.__chunks = []
+        self.__used = []
+        self.__offsets = []
+        self.__size = 0
+        # While every chunk but the last holds exactly `chunkSize` items, an index maps to its chunk by division.
+        self.__uniform = True
+
+
+    def __str__(self) -> str:
+        return str.format("[{}]", ",".join("" if item is None else str(item) for item in self))
+
+
+    def __len__(self) -> int:
+        return self.__size
+
+
+    def __iter__(self):
+        return chain.from_iterable(islice(chunk, used) for chunk, used in zip(self.__chunks, self.__used))
+
+
+    # RELATED TESTS
+    #   test_appendAcrossChunks()
+    #   test_getItemAtIllegalIndex()
+    def get(self, index: int):
+        """
+        Return the item at provided index.
+        """
+        if not(0 <= index < self.__size):
+            raise IndexError("Array index out of range!")
+
+        chunk, offset = self.__locate(index)
+
+        return self.__chunks[chunk].get(offset)
+
+
+    # RELATED TESTS
+    #   test_appendAcrossChunks()
+    #   test_getItemAtIllegalIndex()
+    def set(self, index: int, item):
+        """
+        Set item at provided index.
+        """
+        if not(0 <= index < self.__size):
+            raise IndexError("Array index out of range!")
+
+        chunk, offset = self.__locate(index)
+        self.__chunks[chunk].set(offset, item)
+
+
+    # RELATED TESTS
+    #   test_appendAcrossChunks()
+    def append(self, item):
+        """
+        Add an item to the end of the array, adding a new chunk when the last one is full.
+        """
+        if len(self.__chunks) == 0 or self.__used[-1] == self.__chunks[-1].size():
+            self.__addChunk()
+
+        self.__chunks[-1].set(self.__used[-1], item)
+        self.__used[-1] += 1
+        self.__size += 1
+
+
+    # RELATED TESTS
+    #   test_appendMany()
+    def appendMany(self, items):
+        """
+        Add every item of `items` to the end of the array. Items are written with one slice assignment per chunk.
+        """
+        items = list(items)
+        position = 0
+
+        while position < len(items):
+            if len(self.__chunks) == 0 or self.__used[-1] == self.__chunks[-1].size():
+                self.__addChunk()
+
+            used = self.__used[-1]
+            part = items[position:position + self.__chunks[-1].size() - used]
+
+            self.__chunks[-1].setSlice(used, used + len(part), part)
+            self.__used[-1] += len(part)
+            self.__size += len(part)
+            position += len(part)
+
+
+    # RELATED TESTS
+    #   test_concatChunkedArrays()
+    #   test_concatIncompatibleArrays()
+    def concat(self, other):
+        """
+        Return a new chunked array holding the items of this array followed by the items of `other`. The chunks of both are shared as copy-on-write clones, so no item is copied until a chunk is written.
+        """
+        if type(other) != ChunkedArray:
+            raise TypeError("Only chunked arrays can be concatenated!")
+
+        if other.__type != self.__type:
+            raise TypeError("Chunked arrays must be of the same type!")
+
+        arr = ChunkedArray(self.__type, self.__chunkSize)
+
+        for source in (self, other):
+            for chunk, used in zip(source.__chunks, source.__used):
+                arr.__offsets.append(arr.__size)
+                arr.__chunks.append(chunk.clone())
+                arr.__used.append(used)
+                arr.__size += used
+
+        arr.__uniform = all(used == self.__chunkSize for used in arr.__used[:-1]) and all(chunk.size() == self.__chunkSize for chunk in arr.__chunks)
+
+        return arr
+
+
+    def size(self) -> int:
+        """
+        Return the number of stored items.
+        """
+        return self.__size
+
+
+    def type(self):
+        """
+        Return the type of stored elements.
+        """
+        return self.__type
+
+
+    def chunkCount(self) -> int:
+        """
+        Return the number of chunks.
+        """
+        return len(self.__chunks)
+
+
+    # RELATED TESTS
+    #   test_appendMany()
+    def toList(self) -> list:
+        """
+        Convert this array to a built-in list.
+        """
+        return list(self)
+
+
+    # RELATED TESTS
+    #   test_concatChunkedArrays()
+    def toArray(self) -> Array:
+        """
+        Copy the items into a single `Array`, one slice copy per chunk.
+        """
+        arr = Array(self.__size, self.__type)
+
+        for chunk, used, offset in zip(self.__chunks, self.__used, self.__offsets):
+            arr.setSlice(offset, offset + used, chunk.getSlice(0, used))
+
+        return arr
+
+
+    def __locate(self, index: int) -> tuple:
+        """
+        Return the chunk holding provided index and the offset of the index within it.
+        """
+        if self.__uniform:
+            return divmod(index, self.__chunkSize)
+
+        chunk = bisect_right(self.__offsets, index) - 1
+
+        return chunk, index - self.__offsets[chunk]
+
+
+    def __addChunk(self):
+        """
+        Add an empty chunk of `chunkSize` slots to the end of the array.
+        """
+        if len(self.__chunks) > 0 and self.__used[-1] != self.__chunkSize:
+            self.__uniform = False
+
+        self.__offsets.append(self.__size)
+        self.__chunks.append(Array(self.__chunkSize, self.__type))
+        self.__used.append(0)
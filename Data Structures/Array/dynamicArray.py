@@ -0,0 +1,233 @@
+from myArray import Array
+
+
+class DynamicArray:
+    """
+    A growable, homogeneous array backed by a single `Array`. Capacity grows geometrically in place, which makes appending amortized constant time. Current implementation consists of:\n
+    `get(index)` - Return the item at provided index.\n
+    `set(index, item)` - Set item at provided index.\n
+    `append(item)` - Add an item to the end of the array.\n
+    `appendMany(items)` - Add many items to the end of the array in a single call.\n
+    `insert(index, item)` - Insert an item at provided index, shifting the following items to the right.\n
+    `pop(index)` - Remove and return the last item, or the item at provided index.\n
+    `reserve(capacity)` - Make room for at least `capacity` items.\n
+    `shrinkToFit()` - Release any unused capacity.\n
+    `size()` - Return the number of stored items.\n
+    `capacity()` - Return the number of items that fit before the next growth.\n
+    `type()` - Return the type of the array elements.\n
+    `toList()` - Convert the array to a list and return it.\n
+    `toArray()` - Return the stored items as a fixed-size `Array`.
+    """
+
+    # RELATED TESTS
+    #   test_initializeDynamicArray()
+    #   test_invalidGrowthFactor()
+    def __init__(self, type: type, capacity: int = 8, growthFactor: float = 2.0):
+        """
+        Initialize an empty dynamic array of `type` items. `capacity` is the initial (and minimum) capacity and `growthFactor` is the multiplier applied whenever the array runs out of space.
+        """
+        if growthFactor <= 1:
+            raise ValueError("Growth factor must be greater than 1!")
+
+        self.__array = Array(max(capacity, 1), type)
+        self.__capacity = max(capacity, 1)
+        self.__size = 0
+        self.__minCapacity = max(capacity, 1)
+        self.__growthFactor = growthFactor
+
+
+    def __str__(self) -> str:
+        return str(self.toArray())
+
+
+    # RELATED TESTS
+    #   test_appendGrowsCapacity()
+    #   test_getBeyondSize()
+    def get(self, index: int):
+        """
+        Return the item at provided index.
+        """
+        if 0 <= index < self.__size:
+            return self.__array.get(index)
+
+        raise IndexError("Array index out of range!")
+
+
+    # RELATED TESTS
+    #   test_getBeyondSize()
+    def set(self, index: int, item):
+        """
+        Set item at provided index.
+        """
+        if not(0 <= index < self.__size):
+            raise IndexError("Array index out of range!")
+
+        self.__array.set(index, item)
+
+
+    # RELATED TESTS
+    #   test_appendGrowsCapacity()
+    def append(self, item):
+        """
+        Add an item to the end of the array.
+        """
+        n = self.__size
+
+        if n == self.__capacity:
+            self.__grow(n + 1)
+
+        self.__array.set(n, item)
+        self.__size = n + 1
+
+
+    # RELATED TESTS
+    #   test_appendMany()
+    def appendMany(self, items):
+        """
+        Add every item of `items` to the end of the array, growing at most once.
+        """
+        items = items if type(items) == Array else list(items)
+        n = self.__size
+        count = items.size() if type(items) == Array else len(items)
+
+        if n + count > self.__capacity:
+            self.__grow(n + count)
+
+        self.__array.setSlice(n, n + count, items)
+        self.__size += count
+
+
+    # RELATED TESTS
+    #   test_insertItems()
+    def insert(self, index: int, item):
+        """
+        Insert an item at provided index. Items from `index` onwards are shifted one slot to the right.
+        """
+        n = self.__size
+
+        if not(0 <= index <= n):
+            raise IndexError("Array index out of range!")
+
+        if n == self.__capacity:
+            self.__grow(n + 1)
+
+        if index < n:
+            self.__array.setSlice(index + 1, n + 1, self.__array.getSlice(index, n))
+
+        self.__array.set(index, item)
+        self.__size += 1
+
+
+    # RELATED TESTS
+    #   test_popItems()
+    #   test_popFromEmptyArray()
+    #   test_popShrinksCapacity()
+    def pop(self, index: int = None):
+        """
+        Remove and return the last item, or the item at `index` if provided. Capacity shrinks once the array is sparsely used.
+        """
+        n = self.__size
+
+        if n == 0:
+            raise IndexError("Cannot pop from an empty array!")
+
+        index = n - 1 if index == None else index
+
+        if not(0 <= index < n):
+            raise IndexError("Array index out of range!")
+
+        item = self.__array.get(index)
+
+        if index < n - 1:
+            self.__array.setSlice(index, n - 1, self.__array.getSlice(index + 1, n))
+
+        self.__array.clear(n - 1, n)
+        self.__size -= 1
+        self.__shrink()
+
+        return item
+
+
+    # RELATED TESTS
+    #   test_reserveCapacity()
+    def reserve(self, capacity: int):
+        """
+        Make sure that at least `capacity` items fit without further growth.
+        """
+        if capacity > self.__capacity:
+            self.__resize(capacity)
+
+
+    # RELATED TESTS
+    #   test_reserveCapacity()
+    def shrinkToFit(self):
+        """
+        Reduce the capacity to the number of stored items (but not below the initial capacity).
+        """
+        self.__resize(max(self.__size, self.__minCapacity))
+
+
+    def size(self) -> int:
+        """
+        Return the number of stored items.
+        """
+        return self.__size
+
+
+    def capacity(self) -> int:
+        """
+        Return the number of items that fit before the array has to grow.
+        """
+        return self.__capacity
+
+
+    def type(self):
+        """
+        Return the type of stored elements.
+        """
+        return self.__array.type()
+
+
+    def toList(self) -> list:
+        """
+        Convert this array to a built-in list.
+        """
+        return self.toArray().toList()
+
+
+    def toArray(self) -> Array:
+        """
+        Return a fixed-size copy of the stored items.
+        """
+        return self.__array.getSlice(0, self.__size)
+
+
+    def __grow(self, required: int):
+        """
+        Grow the capacity geometrically until `required` items fit.
+        """
+        capacity = self.__capacity
+
+        while capacity < required:
+            capacity = max(capacity + 1, int(capacity * self.__growthFactor))
+
+        self.__resize(capacity)
+
+
+    def __shrink(self):
+        """
+        Shrink the capacity by the growth factor once it is used below `1 / growthFactor^2`. The gap between the growth and shrink thresholds keeps alternating appends and pops from resizing every time.
+        """
+        capacity = self.__capacity
+        factor = self.__growthFactor
+
+        if capacity > self.__minCapacity and self.__size < capacity / (factor * factor):
+            self.__resize(max(int(capacity / factor), self.__minCapacity))
+
+
+    def __resize(self, capacity: int):
+        """
+        Resize the underlying array in place.
+        """
+        self.__array.resize(capacity)
+        self.__capacity = capacity
@@ -0,0 +1,367 @@
+import operator
+from array import array
+from math import prod
+from myArray import Array, ArrayView
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Number of result columns computed per tile by `matmul()` when NumPy is not installed. A tile of columns
+# of the right operand is reused for every row of the left operand before moving on to the next one.
+_TILE = 64
+
+
+class Matrix:
+    """
+    A fixed-shape, homogeneous N-dimensional array. Items are kept in row-major order in a single `Array`, and an index is turned into a storage offset through the strides of the shape. Current implementation consists of:\n
+    `get()` - Retreive item at provided index tuple.\n
+    `set()` - Set item at provided index tuple.\n
+    `shape()`, `strides()` - Return the shape of the matrix and the strides of its storage.\n
+    `size()` - Return the number of items.\n
+    `type()` - Return the type of the matrix elements.\n
+    `row()`, `column()` - Return a non-copying view of a row or a column of a 2D matrix.\n
+    `transpose()` - Return the transpose of a 2D matrix.\n
+    `matmul()` - Matrix product of two 2D matrices, also available as `@`.\n
+    `reshape()` - Return a matrix of another shape that shares this matrix's storage.\n
+    `listToMatrix()` - Convert nested lists to a matrix and return its instance.\n
+    `toList()` - Convert the matrix to nested lists and return them.\n
+    `toArray()` - Copy the items into a flat `Array` in row-major order.\n
+    `m[i, j]` - Built-in item access.
+    """
+
+    # RELATED TESTS
+    #   test_initializeMatrix()
+    #   test_initializeMatrixWithInvalidShape()
+    def __init__(self, shape: tuple, type: type):
+        """
+        Initialize an empty matrix of `type` items with provided `shape`.
+        """
+        shape = Matrix.__checkShape(shape)
+
+        self.__data = Array(prod(shape), type)
+        self.__shape = shape
+        self.__strides = Matrix.__rowMajor(shape)
+
+
+    def __str__(self) -> str:
+        if self.size() == 0:
+            return "[]"
+
+        items = ["" if item is None else str(item) for item in self.__data]
+
+        for length in reversed(self.__shape):
+            items = [str.format("[{}]", ",".join(items[i:i + length])) for i in range(0, len(items), length)]
+
+        return items[0]
+
+
+    def __len__(self) -> int:
+        return self.__shape[0]
+
+
+    def __getitem__(self, index):
+        return self.get(index if type(index) == tuple else (index,))
+
+
+    def __setitem__(self, index, item):
+        self.set(index if type(index) == tuple else (index,), item)
+
+
+    # RELATED TESTS
+    #   test_setAndGetItems()
+    #   test_getItemAtIllegalIndex()
+    def get(self, index: tuple):
+        """
+        Return the item at provided index tuple, e.g. `(row, column)`.
+        """
+        return self.__data.get(self.__offset(index))
+
+
+    # RELATED TESTS
+    #   test_setAndGetItems()
+    #   test_getItemAtIllegalIndex()
+    def set(self, index: tuple, item):
+        """
+        Set item at provided index tuple, e.g. `(row, column)`.
+        """
+        self.__data.set(self.__offset(index), item)
+
+
+    def shape(self) -> tuple:
+        """
+        Return the shape of the matrix.
+        """
+        return self.__shape
+
+
+    def strides(self) -> tuple:
+        """
+        Return the number of storage slots between consecutive indexes of every dimension.
+        """
+        return self.__strides
+
+
+    def size(self) -> int:
+        """
+        Return the number of items.
+        """
+        return self.__data.size()
+
+
+    def type(self):
+        """
+        Return the type of stored elements.
+        """
+        return self.__data.type()
+
+
+    # RELATED TESTS
+    #   test_rowAndColumnViews()
+    def row(self, index: int) -> ArrayView:
+        """
+        Return an `ArrayView` of the row at provided index of a 2D matrix. The row is contiguous in storage.
+        """
+        rows, columns = self.__checkTwoDimensional()
+
+        if not(0 <= index < rows):
+            raise IndexError("Matrix index out of range!")
+
+        return self.__data.view(index * columns, (index + 1) * columns)
+
+
+    # RELATED TESTS
+    #   test_rowAndColumnViews()
+    def column(self, index: int) -> ArrayView:
+        """
+        Return an `ArrayView` of the column at provided index of a 2D matrix. The column is a strided range of storage.
+        """
+        rows, columns = self.__checkTwoDimensional()
+
+        if not(0 <= index < columns):
+            raise IndexError("Matrix index out of range!")
+
+        return self.__data.view(index, None, columns)
+
+
+    # RELATED TESTS
+    #   test_transposeMatrix()
+    def transpose(self):
+        """
+        Return a new matrix holding the transpose of this 2D matrix. Items are moved a whole row or column per step with strided slice copies, looping over the shorter dimension.
+        """
+        rows, columns = self.__checkTwoDimensional()
+        source = self.__data
+        # Starting from a copy means a full matrix has no empty slots to track while its items are moved.
+        target = source.getSlice()
+        result = Matrix.__wrap(target, (columns, rows))
+
+        if columns <= rows:
+            for j in range(columns):
+                target.setSlice(j * rows, (j + 1) * rows, source.getSlice(j, None, columns))
+        else:
+            for i in range(rows):
+                target.setSlice(i, None, source.getSlice(i * columns, (i + 1) * columns), rows)
+
+        return result
+
+
+    # RELATED TESTS
+    #   test_multiplyMatrices()
+    #   test_multiplyMatricesWithoutNumPy()
+    #   test_multiplyIncompatibleMatrices()
+    def matmul(self, other):
+        """
+        Return the matrix product of this and `other` 2D `int` or `float` matrices. Products involving a `float` matrix run on NumPy when it is installed; `int` products stay exact. Otherwise the product is computed in tiles of `_TILE` columns, each cell being one C-level pass over a row and a column.
+        """
+        if type(other) != Matrix:
+            raise TypeError("Matrix product requires another matrix!")
+
+        m, k = self.__checkTwoDimensional()
+        k_other, n = other.__checkTwoDimensional()
+
+        if k != k_other:
+            raise ValueError(str.format("Cannot multiply matrices of shapes {} and {}!", self.__shape, other.__shape))
+
+        if not({self.type(), other.type()} <= {int, float}):
+            raise TypeError("Only int and float matrices can be multiplied!")
+
+        if None in self.__data or None in other.__data:
+            raise ValueError("Matrix contains empty slots!")
+
+        result_type = float if float in (self.type(), other.type()) else int
+        result = Matrix((m, n), result_type)
+
+        if m * n == 0:
+            return result
+
+        left, right = self.__numeric(), other.__numeric()
+
+        if result_type == float and left is not None and right is not None:
+            product = numpy.matmul(left.astype(float, copy=False), right.astype(float, copy=False))
+            result.__data = Array.listToArray(array('d', product.tobytes()))
+            return result
+
+        rows = self.__data.toList()
+        rows = [rows[i * k:(i + 1) * k] for i in range(m)]
+        columns = other.transpose().__data.toList()
+        columns = [columns[j * k:(j + 1) * k] for j in range(n)]
+        items = [None] * (m * n)
+
+        for start in range(0, n, _TILE):
+            tile = columns[start:start + _TILE]
+            stop = start + len(tile)
+
+            for i, row in enumerate(rows):
+                items[i * n + start:i * n + stop] = [sum(map(operator.mul, row, column)) for column in tile]
+
+        if result_type == float:
+            items = [float(item) for item in items]
+
+        result.__data = Array.listToArray(items, trusted=True)
+
+        return result
+
+
+    __matmul__ = matmul
+
+
+    # RELATED TESTS
+    #   test_reshapeMatrix()
+    def reshape(self, shape: tuple):
+        """
+        Return a matrix of provided `shape` that shares this matrix's storage, so that writes to either are visible in both. The number of items must stay the same.
+        """
+        shape = Matrix.__checkShape(shape)
+
+        if prod(shape) != self.size():
+            raise ValueError(str.format("Cannot reshape a matrix of shape {} into {}!", self.__shape, shape))
+
+        return Matrix.__wrap(self.__data, shape)
+
+
+    # RELATED TESTS
+    #   test_convertNestedListToMatrix()
+    def listToMatrix(l: list):
+        """
+        Convert nested lists of equal lengths to a matrix and return it. The shape is read from the nesting.
+        """
+        shape = []
+        items = l
+
+        while type(items) == list:
+            if len(items) == 0:
+                raise ValueError("Cannot infer the shape of an empty list!")
+
+            shape.append(len(items))
+            items = items[0]
+
+        for depth in range(len(shape) - 1):
+            if any(type(part) != list or len(part) != shape[depth + 1] for part in l):
+                raise ValueError("Nested lists must be of equal lengths!")
+
+            l = [item for part in l for item in part]
+
+        return Matrix.__wrap(Array.listToArray(l), tuple(shape))
+
+
+    # RELATED TESTS
+    #   test_convertNestedListToMatrix()
+    def toList(self) -> list:
+        """
+        Convert this matrix to nested lists.
+        """
+        items = self.__data.toList()
+
+        for length in reversed(self.__shape[1:]):
+            items = [items[i:i + length] for i in range(0, len(items), length)]
+
+        return items
+
+
+    def toArray(self) -> Array:
+        """
+        Copy the items of this matrix into a flat `Array`, in row-major order.
+        """
+        return self.__data.getSlice()
+
+
+    def __offset(self, index: tuple) -> int:
+        """
+        Return the storage offset of an index tuple.
+        """
+        if len(index) != len(self.__shape):
+            raise IndexError(str.format("Matrix index must have {} coordinates!", len(self.__shape)))
+
+        offset = 0
+
+        for i, length, stride in zip(index, self.__shape, self.__strides):
+            if not(0 <= i < length):
+                raise IndexError("Matrix index out of range!")
+
+            offset += i * stride
+
+        return offset
+
+
+    def __checkTwoDimensional(self) -> tuple:
+        """
+        Return the shape of a 2D matrix, or raise a `ValueError` for any other number of dimensions.
+        """
+        if len(self.__shape) != 2:
+            raise ValueError("Operation is only defined for 2D matrices!")
+
+        return self.__shape
+
+
+    def __numeric(self):
+        """
+        Return a NumPy array sharing the storage of a numeric matrix, or `None` if NumPy is not installed or the items are kept in object slots.
+        """
+        if numpy is None:
+            return None
+
+        try:
+            view = self.__data.toMemoryView()
+        except TypeError:
+            return None
+
+        return numpy.frombuffer(view, dtype=view.format).reshape(self.__shape)
+
+
+    def __wrap(data: Array, shape: tuple):
+        """
+        Return a matrix of provided `shape` over existing storage, without copying it.
+        """
+        matrix = Matrix((0,), data.type())
+        matrix.__data = data
+        matrix.__shape = shape
+        matrix.__strides = Matrix.__rowMajor(shape)
+
+        return matrix
+
+
+    def __checkShape(shape) -> tuple:
+        """
+        Return `shape` as a tuple of dimension lengths, or raise a `ValueError` if it is not a valid shape.
+        """
+        shape = (shape,) if type(shape) == int else tuple(shape)
+
+        if len(shape) == 0 or any(type(length) != int or length < 0 for length in shape):
+            raise ValueError("Shape must consist of one or more non-negative integers!")
+
+        return shape
+
+
+    def __rowMajor(shape: tuple) -> tuple:
+        """
+        Return the row-major strides of `shape`: the last index is contiguous.
+        """
+        strides = [1] * len(shape)
+
+        for i in range(len(shape) - 2, -1, -1):
+            strides[i] = strides[i + 1] * shape[i + 1]
+
+        return tuple(strides)
@@ -1,3 +1,63 @@
+import bisect
+import functools
+import mmap
+import operator
+import os
+import re
+import struct
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress, islice, repeat
+from multiprocessing import shared_memory
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Element types with a fixed-width machine representation. Arrays of these types keep their
+# items contiguously in an `array.array`; every other type is kept in a preallocated slot list.
+_TYPECODES = {int: 'q', float: 'd'}
+
+# Element types of `array.array` typecodes, used to copy stdlib arrays without checking every item.
+_ARRAY_TYPES = dict.fromkeys("bBhHiIlLqQ", int) | dict.fromkeys("fd", float)
+
+# Number of items type-checked per step when inferring the type of a list.
+_CHUNK = 1 << 16
+
+# Numeric storage of at least this many bytes is reserved as an anonymous memory mapping instead of
+# being zeroed up front. The OS hands out zeroed pages on first write, so construction takes constant time.
+_LAZY_BYTES = 1 << 20
+
+# Buffer formats that can be shared with a typed array without converting its items.
+_BUFFER_TYPES = {'q': int, 'l': int, 'n': int, 'd': float}
+
+# File header of stored arrays: magic, typecode, flags, padding and length. Sixteen bytes keep the
+# items that follow it 8-byte aligned, so they can be memory-mapped in place.
+_HEADER = struct.Struct("<4scB2xQ")
+_MAGIC = b"ARRY"
+
+# Header flag of numeric files whose items are followed by the validity bitmap of their slots.
+_HAS_MASK = 1
+
+# Header typecodes of `str` and `bytes` arrays, whose items are stored with their lengths.
+_ENCODINGS = {str: b'U', bytes: b'Y'}
+
+# The eight validity flags packed into every possible bitmap byte, least significant bit first, as bytes of `0` and `1`.
+_FLAGS = [bytes(byte >> bit & 1 for bit in range(8)) for byte in range(256)]
+
+# Maps the flags `0` and `1` to the digits `"0"` and `"1"`, to pack them through `int(..., 2)`.
+_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+# Runs of empty slots in unpacked flags.
+_NULLS = re.compile(rb"\x00+")
+
+# NumPy counterparts of the elementwise operators, used when NumPy is installed.
+_UFUNCS = {operator.add: "add", operator.sub: "subtract", operator.mul: "multiply", operator.truediv: "true_divide"}
+
+
 class Array:
     """
     A static, homogeneous and efficient data structure - holds a fixed number of like-data that can be accessed directly via address indexing. Current implementation consists of:\n
@@ -7,8 +67,26 @@ class Array:
     `size()` - Return the size of the array.\n
     `type()` - Return the type of the array elements.\n
     `extend()` - Extend array by doubling its size and returning a new instance.\n
+    `clone()` - Return a copy-on-write copy of the array.\n
+    `view()` - Return a non-copying, strided view over a range of the array.\n
+    `resize()` - Grow or shrink the array in place.\n
+    `clear()` - Empty a range of slots.\n
     `listToArray()` - Convert a provided list to an array and return its instance.\n
     `toList()` - Convert the array to a list and return it.\n
+    `len(arr)`, `arr[i]`, `arr[a:b:c]`, `for x in arr`, `x in arr` - Built-in sequence protocol. Slicing returns an `ArrayView`.\n
+    `toMemoryView()` - Return a zero-copy `memoryview` of a numeric array.\n
+    `fromBuffer()` - Wrap an existing buffer in an array without copying it.\n
+    `mapFile()` - Open a numeric array backed by a memory-mapped file.\n
+    `flush()`, `close()` - Write back and unmap a memory-mapped array.\n
+    `save()`, `load()` - Write an array to a compact binary file and read it back.\n
+    `fill()`, `getSlice()`, `setSlice()`, `setMany()` - Read or write many slots in a single call.\n
+    `isNull()`, `countNulls()`, `fillNulls()` - Inspect or fill the empty slots.\n
+    `map()` - Transform the whole array.\n
+    `sum()`, `min()`, `max()` - Reduce the whole array, skipping empty slots.\n
+    `add()`, `subtract()`, `multiply()`, `divide()` - Elementwise arithmetic with another array or a number.\n
+    `parallelReduce()`, `parallelMap()` - Reduce or map a numeric array on a pool of processes.\n
+    `sort()` - Sort the array in place.\n
+    `bisectLeft()`, `bisectRight()`, `search()` - Binary search a sorted array.\n
     """
     # RELATED TESTS
     #   test_initializeArray()
@@ -16,42 +94,106 @@ class Array:
         """
         Initialize an empty array with a predefined `size` and `type`.
         """
+        self.__shared = None
         self.__size = size
         self.__type = type
-        self.__addresses = self.__assignSpace()
+        self.__typecode = _TYPECODES.get(type)
+        self.__data, self.__mask = self.__assignSpace()
+        # Number of empty slots marked in the bitmap, so that fully populated arrays skip it in constant time.
+        self.__nulls = 0 if self.__mask is None else size
+        self.__mapping = None
+        self.__external = False
+        # Set once the storage has been handed out by `toMemoryView()`, whose writes bypass copy-on-write.
+        self.__exported = False
 
 
     def initDirect(*args):
         """
         Directly initialize an array of arbitrary size. Type will be inferred from the `args`.
         """
-        arr = Array(len(args), Array.__getType(args))
-
-        for i in range(len(args)):
-            arr.set(i, args[i])
-
-        return arr
+        return Array.listToArray(args)
     
 
     def __str__(self) -> str:
-        
-        output = ""
 
-        for i in range(self.__size):
-            item = self.get(i)
-            output += (str(item) if item != None else "") + ("," if i < self.__size - 1 else "")
+        output = ",".join("" if item is None else str(item) for item in self)
 
         return str.format("[{}]", output)
     
 
+    # RELATED TESTS
+    #   test_sequenceProtocol()
+    def __len__(self) -> int:
+        return self.__size
+
+
+    # RELATED TESTS
+    #   test_iterateArray()
+    def __iter__(self):
+        if self.__nulls == 0:
+            return iter(self.__data)
+
+        return (item if filled else None for item, filled in zip(self.__data, _unpackBits(self.__mask, 0, self.__size)))
+
+
+    # RELATED TESTS
+    #   test_iterateArray()
+    def __reversed__(self):
+        if self.__nulls == 0:
+            return reversed(self.__data)
+
+        return (item if filled else None for item, filled in zip(reversed(self.__data), reversed(_unpackBits(self.__mask, 0, self.__size))))
+
+
+    # RELATED TESTS
+    #   test_iterateArray()
+    def __contains__(self, item) -> bool:
+        if item is None:
+            return self.countNulls() > 0
+
+        # Unset slots of numeric arrays hold zeros, so a storage hit has to be confirmed against the mask.
+        return item in self.__data and (self.__nulls == 0 or item in iter(self))
+
+
+    # RELATED TESTS
+    #   test_sequenceProtocol()
+    #   test_sliceArrayIntoView()
+    def __getitem__(self, index):
+        """
+        Return the item at `index` (negative indexes count from the end), or an `ArrayView` for a slice.
+        """
+        if type(index) == slice:
+            return self.view(index.start, index.stop, index.step)
+
+        return self.get(index + self.__size if index < 0 else index)
+
+
+    # RELATED TESTS
+    #   test_sequenceProtocol()
+    #   test_sliceArrayIntoView()
+    def __setitem__(self, index, item):
+        """
+        Set the item at `index` (negative indexes count from the end), or assign many items to a slice.
+        """
+        if type(index) == slice:
+            self.setSlice(index.start, index.stop, item, index.step)
+        else:
+            self.set(index + self.__size if index < 0 else index, item)
+
+
+    # RELATED TESTS
+    #   test_getItemAtIndexEqualToSize()
+    #   test_floatArrayStorage()
     def get(self, index):
         """
         Return the item at provided index.
         """
-        if index >= 0 and index <= self.__size:
-            address = str.format("&arr{}", index)
-            return self.__addresses[address]
-        
+        if 0 <= index < self.__size:
+            if self.__nulls == 0 or self.__mask[index >> 3] >> (index & 7) & 1:
+                return self.__data[index]
+
+            return None
+
         raise IndexError("Array index out of range!")
 
 
@@ -59,14 +201,29 @@ class Array:
     #   test_setItemAtValidIndexWithValidType()
     #   test_setItemAtIllegalIndexWithValidType()
     #   test_setItemAtValidIndexWithInvalidType()
+    #   test_setIntegerLargerThan64Bits()
     def set(self, index, item):
         """
         Set item at provided index.
         """
         if type(item) == self.__type:
-            if index >= 0 and index <= self.__size -1:
-                address = str.format("&arr{}", index)
-                self.__addresses[address] = item
+            if 0 <= index < self.__size:
+                if self.__shared is not None:
+                    self.__unshare()
+
+                try:
+                    self.__data[index] = item
+                except (OverflowError, ValueError):
+                    # Integer does not fit in 64 bits - fall back to object slots.
+                    if self.__external:
+                        raise OverflowError("Integer is too large for the shared buffer!")
+
+                    self.__promote()
+                    self.__data[index] = item
+
+                if self.__nulls and not(self.__mask[index >> 3] >> (index & 7) & 1):
+                    self.__mask[index >> 3] |= 1 << (index & 7)
+                    self.__nulls -= 1
             else:
                 raise IndexError("Array index out of range!")
         else:
@@ -99,27 +256,202 @@ class Array:
         """
         Provides extending operation if the array needs to be larger. Once invoked, the operation returns a copy of itself, extended by double of its own array's size.
         """
-        new_arr = Array(self.__size * 2, self.__type)
-
-        for i in range(self.__size):
-            new_arr.set(i, self.get(i))
+        new_arr = self.getSlice()
+        new_arr.resize(self.__size * 2)
 
         return new_arr
-    
+
+
+    # RELATED TESTS
+    #   test_cloneArray()
+    #   test_cloneSharesStorageUntilWritten()
+    #   test_cloneExternalArray()
+    #   test_cloneExportedArray()
+    def clone(self):
+        """
+        Return a copy of the array that shares its storage until either of them is written. The first write to a shared array copies its whole storage, so taking snapshots of a read-mostly array is constant time and memory. Arrays that share external memory, or whose storage has been exported with `toMemoryView()`, are copied right away, since their storage can change outside of the array.
+        """
+        if self.__external or self.__exported:
+            return self.getSlice()
+
+        arr = Array.__fromStorage(self.__type, self.__data, None)
+        arr.__mask, arr.__nulls = self.__mask, self.__nulls
+
+        if self.__shared is None:
+            self.__shared = [1]
+
+        self.__shared[0] += 1
+        arr.__shared = self.__shared
+
+        return arr
+
+
+    # RELATED TESTS
+    #   test_copyArray()
+    def __copy__(self):
+        # A shallow copy has to be counted as a share of the storage like any other clone.
+        return self.clone()
+
+
+    def __del__(self):
+        # Releases this handle's share of the storage, so that the last remaining clone can write without copying. Instances that never ran `__init__` hold no share.
+        shared = getattr(self, "_Array__shared", None)
+
+        if shared is not None:
+            shared[0] -= 1
+
+
+    # RELATED TESTS
+    #   test_pickleLazyArray()
+    def __getstate__(self) -> dict:
+        """
+        Return the attributes to pickle. Lazily allocated, memory-mapped or external storage cannot be pickled, so it is stored as an `array.array`; the unpickled array owns its storage.
+        """
+        state = self.__dict__.copy()
+
+        if self.__typecode is not None and type(self.__data) != array:
+            items = array(self.__typecode)
+            items.frombytes(self.__data.cast('B'))
+            state["_Array__data"] = items
+
+        state.update({"_Array__shared": None, "_Array__mapping": None, "_Array__external": False, "_Array__exported": False})
+
+        return state
+
+
+    # RELATED TESTS
+    #   test_pickleLazyArray()
+    def __setstate__(self, state: dict):
+        """
+        Restore a pickled array. Large numeric storage is allocated lazily again, as in `__init__`.
+        """
+        self.__dict__.update(state)
+
+        if self.__typecode is not None and self.__size * 8 >= _LAZY_BYTES:
+            self.__data = Array.__allocate(self.__typecode, self.__size)
+
+            with memoryview(self.__data) as view:
+                view[:] = state["_Array__data"]
+
+
+    # RELATED TESTS
+    #   test_viewArray()
+    #   test_chainViews()
+    #   test_viewWithNegativeStep()
+    def view(self, start: int = None, stop: int = None, step: int = None):
+        """
+        Return an `ArrayView` over the slots selected by `start:stop:step` (built-in slicing rules). The view reads and writes this array's storage instead of copying it.
+        """
+        return ArrayView(self, range(self.__size)[start:stop:step])
+
+
+    # RELATED TESTS
+    #   test_resizeArray()
+    #   test_resizeSharedBuffer()
+    def resize(self, size: int):
+        """
+        Grow or shrink the array in place to `size` slots. New slots are empty and items beyond `size` are discarded.
+        """
+        if size < 0:
+            raise ValueError("Array size cannot be negative!")
+
+        if self.__external:
+            raise BufferError("Cannot resize an array that shares external memory!")
+
+        if self.__shared is not None:
+            self.__unshare()
+
+        n = self.__size
+
+        if type(self.__data) == memoryview:
+            # Lazily allocated storage cannot grow or shrink in place, so the kept items are copied to a new reservation.
+            data = Array.__allocate(self.__typecode, size)
+
+            with memoryview(data) as view:
+                view[:min(n, size)] = self.__data[:min(n, size)]
+
+            self.__data = data
+        elif size < n:
+            del self.__data[size:]
+        elif size > n and self.__typecode is None:
+            self.__data.extend([None] * (size - n))
+        elif size > n:
+            self.__data.frombytes(bytes((size - n) * self.__data.itemsize))
+
+        if self.__typecode is not None and size < n:
+            if self.__mask is not None:
+                self.__nulls -= (n - size) - _countBits(_sliceBits(self.__mask, range(size, n)))
+                self.__mask = _sliceBits(self.__mask, range(size))
+        elif self.__typecode is not None and size > n:
+            if self.__mask is None:
+                self.__mask = _fullBits(n)
+
+            self.__mask.extend(bytes(((size + 7) >> 3) - len(self.__mask)))
+            self.__nulls += size - n
+
+        self.__size = size
+
+
+    # RELATED TESTS
+    #   test_clearSlots()
+    #   test_clearMappedArray()
+    def clear(self, start: int = 0, stop: int = None):
+        """
+        Empty every slot from `start` up to (excluding) `stop`, releasing the items held there.
+        """
+        stop = self.__size if stop == None else stop
+
+        if not(0 <= start <= stop <= self.__size):
+            raise IndexError("Array index out of range!")
+
+        if self.__shared is not None:
+            self.__unshare()
+
+        if self.__typecode is None:
+            self.__data[start:stop] = [None] * (stop - start)
+        elif start < stop:
+            if self.__mask is None:
+                self.__addMask()
+
+            # Only the cleared range is counted and rewritten, so emptying the last slot of a full array stays cheap.
+            self.__nulls += _countBits(_sliceBits(self.__mask, range(start, stop)))
+            _setBits(self.__mask, range(start, stop), bytes((stop - start + 7) >> 3))
+
 
     # RELATED TESTS
     #   test_convertHomogeneusListToArray()
     #   test_convertHeterogeneusListToArray()
-    def listToArray(l:list):
+    #   test_convertEmptyListToArray()
+    #   test_convertStdlibArrayToArray()
+    #   test_convertTrustedListToArray()
+    def listToArray(l:list, trusted: bool = False):
         """
-        Convert and a list to an array and return it.
+        Convert a list (or any iterable) to an array and return it. Items are type-checked and copied in a single bulk pass. `array.array` instances and other arrays are known to be homogeneous and are copied without checking their items; pass `trusted=True` to skip the check for other inputs too.
         """
-        arr = Array(len(l), Array.__getType(l))
+        if type(l) == Array:
+            return l.getSlice()
+
+        if type(l) == array and l.typecode in _ARRAY_TYPES:
+            t = _ARRAY_TYPES[l.typecode]
+            trusted = True
+        else:
+            l = l if type(l) in (list, tuple) else list(l)
 
-        for i in range(len(l)):
-            arr.set(i,l[i])
+            if len(l) == 0:
+                raise ValueError("Cannot infer the type of an empty list!")
 
-        return arr
+            t = type(l[0]) if trusted else Array.__getType(l)
+
+        code = _TYPECODES.get(t)
+
+        if code != None:
+            try:
+                return Array.__fromStorage(t, array(code, l), None)
+            except OverflowError:
+                # Integers that do not fit in 64 bits are kept in object slots.
+                pass
+
+        return Array.__fromStorage(t, list(l), None)
     
 
     # RELSTED TESTS
@@ -128,40 +460,1265 @@ class Array:
         """
         Convert this array to a built-in list.
         """
+        data = self.__data
+        mask = self.__mask
+
+        if self.__typecode is None:
+            return list(data)
+
+        if self.__nulls == 0:
+            return data.tolist()
+
+        return [item if filled else None for item, filled in zip(data, _unpackBits(mask, 0, self.__size))]
+
+
+    # RELATED TESTS
+    #   test_exportNumericArrayAsMemoryView()
+    #   test_exportObjectArrayAsMemoryView()
+    #   test_cloneExportedArray()
+    def toMemoryView(self) -> memoryview:
+        """
+        Return a writable, zero-copy `memoryview` over the items of an `int` or `float` array. Slots that have not been set read as `0`. Writes through the view bypass the array, so an array shared with its clones gets storage of its own first, and clones taken afterwards are copied right away.
+        """
+        if self.__typecode is None:
+            raise TypeError("Only int and float arrays can be exported as buffers!")
+
+        if self.__shared is not None:
+            self.__unshare()
+
+        self.__exported = True
+
+        return memoryview(self.__data)
+
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Buffer protocol hook (Python 3.12+), so that `memoryview(arr)` and `numpy.asarray(arr)` share the array's storage.
+        """
+        return self.toMemoryView()
+
+
+    # RELATED TESTS
+    #   test_wrapBufferWithoutCopying()
+    #   test_wrapRawBytesWithType()
+    #   test_wrapIncompatibleBuffer()
+    def fromBuffer(buffer, type: type = None):
+        """
+        Create an array that shares the memory of `buffer` (e.g. an `array.array`, `bytearray`, `mmap` or NumPy array) instead of copying it. The element type is inferred from the buffer format, unless the buffer holds raw bytes - then `type` must be provided.
+        """
+        view = memoryview(buffer)
+        format = view.format.lstrip("@=")
+
+        if format in ('B', 'b', 'c'):
+            if type not in _TYPECODES:
+                raise TypeError("Raw byte buffers require an int or float type!")
+        elif view.itemsize == 8 and _BUFFER_TYPES.get(format) != None and type in (None, _BUFFER_TYPES[format]):
+            type = _BUFFER_TYPES[format]
+        else:
+            raise TypeError(str.format("Buffer format '{}' cannot be shared as an array!", view.format))
+
+        arr = Array.__fromStorage(type, view.cast('B').cast(_TYPECODES[type]), None)
+        arr.__external = True
+
+        return arr
+
+
+    # RELATED TESTS
+    #   test_createMappedArray()
+    #   test_reopenMappedArrayReadOnly()
+    #   test_mapInvalidFile()
+    #   test_clearMappedArray()
+    def mapFile(path: str, type: type = None, size: int = None, readonly: bool = False):
+        """
+        Open an `int` or `float` array whose items live in a memory-mapped file. If `size` is provided, the file is (re)created with `size` zeroed items of `type` and room for a validity bitmap; otherwise an existing file is opened and its type and size are read from its header. Pages are loaded by the OS on first access, writes go straight to the file and several processes mapping the same file share its pages.
+        """
+        if size != None:
+            if type not in _TYPECODES:
+                raise TypeError("Only int and float arrays can be memory-mapped!")
+
+            code = _TYPECODES[type]
+
+            with open(path, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, code.encode(), _HAS_MASK, size))
+                f.truncate(_HEADER.size + size * 8)
+                f.seek(0, os.SEEK_END)
+                f.write(_fullBits(size))
+
+        with open(path, "rb" if readonly else "r+b") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ if readonly else mmap.ACCESS_WRITE)
+
+        try:
+            magic, code, flags, length = _HEADER.unpack_from(mapping)
+        except struct.error:
+            magic = None
+
+        valid = magic == _MAGIC and code in (b'q', b'd') and flags & ~_HAS_MASK == 0
+
+        if valid:
+            end = _HEADER.size + length * 8
+            mask_end = end + (((length + 7) >> 3) if flags & _HAS_MASK else 0)
+
+        if not(valid) or len(mapping) < mask_end:
+            mapping.close()
+            raise ValueError(str.format("'{}' is not a mappable array file!", path))
+
+        code = code.decode()
+        stored_type = int if code == 'q' else float
+
+        if type not in (None, stored_type):
+            mapping.close()
+            raise TypeError(str.format("File holds an array of {}!", stored_type.__name__))
+
+        with memoryview(mapping) as view:
+            data = view[_HEADER.size:end].cast(code)
+
+        # The bitmap of a saved array is small next to its items, so it is kept in memory and written back on `flush()`.
+        arr = Array.__fromStorage(stored_type, data, bytearray(mapping[end:mask_end]) if flags & _HAS_MASK else None)
+        arr.__mapping = mapping
+        arr.__external = True
+
+        return arr
+
+
+    # RELATED TESTS
+    #   test_createMappedArray()
+    def flush(self):
+        """
+        Write changes of a memory-mapped array back to its file. Does nothing for in-memory arrays.
+        """
+        if self.__mapping is not None and not(self.__data.readonly):
+            if self.__mask is not None:
+                end = _HEADER.size + self.__size * 8
+                self.__mapping[end:end + len(self.__mask)] = self.__mask
+
+            self.__mapping.flush()
+
+
+    # RELATED TESTS
+    #   test_createMappedArray()
+    def close(self):
+        """
+        Flush and unmap a memory-mapped array. The array cannot be used afterwards. Does nothing for in-memory arrays.
+        """
+        if self.__mapping is not None:
+            self.flush()
+            self.__data.release()
+            self.__mapping.close()
+            self.__mapping = None
+
+
+    # RELATED TESTS
+    #   test_saveAndLoadNumericArray()
+    #   test_saveAndLoadTextArrays()
+    #   test_saveUnsupportedArray()
+    def save(self, file):
+        """
+        Write the array to `file` (a path or a binary file object). The 16-byte header is followed by the raw items of `int` and `float` arrays (plus their validity bitmap if any slot is empty), or by the lengths and then the encoded items of `str` and `bytes` arrays. Numeric files can be opened directly with `mapFile()`.
+        """
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "wb") as f:
+                return self.save(f)
+
         n = self.__size
-        l = [None]*n
 
-        for i in range(n):
-            l[i] = self.get(i)
+        if self.__typecode is not None:
+            flags = 0 if self.__nulls == 0 else _HAS_MASK
+            file.write(_HEADER.pack(_MAGIC, self.__typecode.encode(), flags, n))
+            file.write(Array.__littleEndian(self.__data))
+
+            if self.__nulls:
+                file.write(self.__mask)
+        elif self.__type in _ENCODINGS and type(self.__data) == list:
+            items = self.__data if self.__type == bytes else [None if item is None else item.encode() for item in self.__data]
+            lengths = array('q', [-1 if item is None else len(item) for item in items])
 
-        return l
+            file.write(_HEADER.pack(_MAGIC, _ENCODINGS[self.__type], 0, n))
+            file.write(Array.__littleEndian(lengths))
+            file.write(b"".join(item for item in items if item is not None))
+        else:
+            raise TypeError("Only arrays of 64-bit int, float, str and bytes items can be saved!")
 
 
-    def __assignSpace(self):
+    # RELATED TESTS
+    #   test_saveAndLoadNumericArray()
+    #   test_saveAndLoadTextArrays()
+    #   test_loadInvalidFile()
+    def load(file):
         """
-        Simulate assignment of space and addresses for the array.
+        Read an array written by `save()` from `file` (a path or a binary file object). Numeric items are read with `readinto()` straight into the storage of the new array.
         """
-        d = dict()
-        
-        for i in range(self.__size):
-            d[str.format("&arr{}",i)] = None
+        if isinstance(file, (str, os.PathLike)):
+            with open(file, "rb") as f:
+                return Array.load(f)
 
-        # print(str.format("{}:{}", self.type(), d))
+        header = file.read(_HEADER.size)
+
+        if len(header) != _HEADER.size or header[:4] != _MAGIC:
+            raise ValueError("Not an array file!")
+
+        magic, code, flags, n = _HEADER.unpack(header)
+
+        if code in (b'q', b'd'):
+            arr = Array(n, int if code == b'q' else float)
+            Array.__readInto(file, arr.__data)
+
+            if flags & _HAS_MASK:
+                Array.__readInto(file, arr.__mask)
+                arr.__nulls = n - _countBits(arr.__mask)
+            else:
+                arr.__mask = None
+                arr.__nulls = 0
+
+            return arr
+
+        if code in _ENCODINGS.values():
+            lengths = array('q', bytes(n * 8))
+            Array.__readInto(file, lengths)
+
+            payload = file.read(sum(length for length in lengths if length > 0))
+            items = [None] * n
+            position = 0
+
+            for i, length in enumerate(lengths):
+                if length >= 0:
+                    items[i] = payload[position:position + length]
+                    position += length
+
+            if position != len(payload):
+                raise ValueError("Array file is truncated!")
+
+            if code == _ENCODINGS[str]:
+                items = [None if item is None else item.decode() for item in items]
+
+            return Array.__fromStorage(str if code == _ENCODINGS[str] else bytes, items, None)
+
+        raise ValueError("Unknown array file type!")
+
+
+    def __littleEndian(data):
+        """
+        Return numeric storage in little-endian byte order, the order used by array files.
+        """
+        if sys.byteorder == "little":
+            return data
+
+        data = array(data.typecode if type(data) == array else data.format, data)
+        data.byteswap()
+
+        return data
+
+
+    def __readInto(file, buffer):
+        """
+        Fill `buffer` with bytes read from `file`, converting them from little-endian byte order if needed.
+        """
+        with memoryview(buffer) as view, view.cast('B') as raw:
+            if file.readinto(raw) != len(raw):
+                raise ValueError("Array file is truncated!")
+
+        if sys.byteorder == "big" and type(buffer) != bytearray:
+            with memoryview(buffer) as view:
+                view[:] = Array.__littleEndian(view)
+
+
+    # --- BULK OPERATIONS ----------------------------------------------------------------------------------------------------
+    # Numeric paths run on NumPy when it is installed and on `array.array` batches otherwise.
+
+    # RELATED TESTS
+    #   test_fillArray()
+    def fill(self, item, start: int = 0, stop: int = None):
+        """
+        Set every slot from `start` up to (excluding) `stop` to `item`.
+        """
+        stop = self.__size if stop == None else stop
+
+        if not(0 <= start <= stop <= self.__size):
+            raise IndexError("Array index out of range!")
+
+        self.__checkItems((item,))
+        self.__write(slice(start, stop), self.__pack([item]) * (stop - start))
+
+
+    # RELATED TESTS
+    #   test_getAndSetSlice()
+    def getSlice(self, start: int = None, stop: int = None, step: int = None):
+        """
+        Return a copy of the slots selected by `start:stop:step` as a new array. Follows the slicing rules of built-in lists.
+        """
+        positions = slice(start, stop, step)
+        data = self.__data[positions]
+
+        if type(data) == memoryview:
+            data = array(self.__typecode, data.tobytes())
+
+        return Array.__fromStorage(self.__type, data, None if self.__nulls == 0 else _sliceBits(self.__mask, range(self.__size)[positions]))
+
+
+    # RELATED TESTS
+    #   test_getAndSetSlice()
+    #   test_setSliceWithWrongLength()
+    def setSlice(self, start: int, stop: int, items, step: int = None):
+        """
+        Assign `items` (an array or any iterable) to the slots selected by `start:stop:step`. The number of items must match the number of selected slots. Empty slots of an array are copied as empty slots.
+        """
+        positions = slice(start, stop, step)
+        count = len(range(*positions.indices(self.__size)))
+
+        if type(items) == Array:
+            if items.__type != self.__type:
+                raise TypeError("Illegal type for the array!")
+
+            length = items.__size
+        else:
+            items = list(items)
+            self.__checkItems(items)
+            length = len(items)
+
+        if length != count:
+            raise ValueError(str.format("Expected {} items, but got {}!", count, length))
+
+        if type(items) == Array:
+            self.__copyFrom(positions, items)
+        else:
+            self.__write(positions, items)
+
+
+    # RELATED TESTS
+    #   test_setMany()
+    def setMany(self, indices, values):
+        """
+        Set `values[k]` at `indices[k]` for every `k`.
+        """
+        indices = list(indices)
+        values = list(values)
+
+        if len(indices) != len(values):
+            raise ValueError("Indices and values must be of the same length!")
+
+        if len(indices) == 0:
+            return
+
+        if min(indices) < 0 or max(indices) >= self.__size:
+            raise IndexError("Array index out of range!")
+
+        self.__checkItems(values)
+
+        if self.__shared is not None:
+            self.__unshare()
+
+        values = self.__pack(values)
+
+        if numpy is not None and self.__typecode is not None:
+            positions = numpy.asarray(indices, dtype=numpy.intp)
+            numpy.frombuffer(self.__data, dtype=self.__typecode)[positions] = numpy.frombuffer(values, dtype=self.__typecode)
+
+            if self.__nulls:
+                bitmap = numpy.frombuffer(self.__mask, dtype=numpy.uint8)
+                # Only the bytes holding written slots are counted, since an index may be written more than once.
+                touched = numpy.unique(positions >> 3)
+                filled = numpy.unpackbits(bitmap[touched]).sum()
+                numpy.bitwise_or.at(bitmap, positions >> 3, numpy.left_shift(1, positions & 7).astype(numpy.uint8))
+                self.__nulls -= int(numpy.unpackbits(bitmap[touched]).sum() - filled)
+        else:
+            data = self.__data
+
+            for i, item in zip(indices, values):
+                data[i] = item
+
+            if self.__nulls:
+                mask = self.__mask
+
+                for i in indices:
+                    if not(mask[i >> 3] >> (i & 7) & 1):
+                        mask[i >> 3] |= 1 << (i & 7)
+                        self.__nulls -= 1
+
+
+    # RELATED TESTS
+    #   test_nullSlots()
+    def isNull(self, index: int) -> bool:
+        """
+        Return `True` if the slot at provided index is empty. Otherwise, return `False`.
+        """
+        if not(0 <= index < self.__size):
+            raise IndexError("Array index out of range!")
+
+        if self.__typecode is None:
+            return self.__data[index] is None
+
+        return self.__nulls != 0 and not(self.__mask[index >> 3] >> (index & 7) & 1)
+
+
+    # RELATED TESTS
+    #   test_nullSlots()
+    def countNulls(self) -> int:
+        """
+        Return the number of empty slots. Numeric arrays keep count of the empty slots in their validity bitmap as it changes.
+        """
+        if self.__typecode is None:
+            return self.__data.count(None)
+
+        return self.__nulls
+
+
+    # RELATED TESTS
+    #   test_fillNulls()
+    #   test_fillNullsWithoutNumPy()
+    #   test_saveAndLoadNumericArray()
+    def fillNulls(self, item):
+        """
+        Set every empty slot to `item`. Numeric arrays write each run of empty slots with one slice assignment, or a single masked assignment on NumPy.
+        """
+        self.__checkItems((item,))
+
+        if self.countNulls() == 0:
+            return
+
+        if self.__shared is not None:
+            self.__unshare()
+
+        self.__pack([item])
+
+        if self.__typecode is None:
+            self.__data = [item if value is None else value for value in self.__data]
+            return
+
+        if numpy is not None:
+            numpy.frombuffer(self.__data, dtype=self.__typecode)[~self.__validity()] = item
+        else:
+            with memoryview(self.__data) as view:
+                for run in _NULLS.finditer(_unpackBits(self.__mask, 0, self.__size)):
+                    view[run.start():run.end()] = array(self.__typecode, [item]) * (run.end() - run.start())
+
+        # The bitmap of a memory-mapped array is written back to its file on `flush()`, so it is filled rather than dropped.
+        if self.__mapping is not None:
+            self.__mask[:] = _fullBits(self.__size)
+        else:
+            self.__mask = None
+
+        self.__nulls = 0
+
+
+    # RELATED TESTS
+    #   test_mapArray()
+    def map(self, fn):
+        """
+        Apply `fn` to every item and return the results as a new array. The type of the new array is inferred from the results.
+        """
+        self.__checkFull()
+
+        if self.__size == 0:
+            return Array(0, self.__type)
+
+        return Array.listToArray(list(map(fn, self.__data)))
+
+
+    # RELATED TESTS
+    #   test_reduceArray()
+    #   test_reduceArrayWithEmptySlots()
+    def sum(self):
+        """
+        Return the sum of all items, skipping empty slots. Sums of `int` arrays are always exact.
+        """
+        if numpy is not None and self.__typecode == 'd':
+            return self.__numericItems().sum().item()
+
+        return sum(self.__items())
+
+
+    # RELATED TESTS
+    #   test_reduceArray()
+    #   test_reduceArrayWithEmptySlots()
+    def min(self):
+        """
+        Return the smallest item, skipping empty slots. Raises a `ValueError` if every slot is empty.
+        """
+        if numpy is not None and self.__typecode is not None and self.__size > self.countNulls():
+            return self.__numericItems().min().item()
+
+        return min(self.__items())
+
+
+    # RELATED TESTS
+    #   test_reduceArray()
+    #   test_reduceArrayWithEmptySlots()
+    def max(self):
+        """
+        Return the largest item, skipping empty slots. Raises a `ValueError` if every slot is empty.
+        """
+        if numpy is not None and self.__typecode is not None and self.__size > self.countNulls():
+            return self.__numericItems().max().item()
+
+        return max(self.__items())
+
+
+    def __items(self):
+        """
+        Return an iterable over the items of the populated slots.
+        """
+        if self.__nulls:
+            return compress(self.__data, _unpackBits(self.__mask, 0, self.__size))
+
+        if self.__typecode is None:
+            return (item for item in self.__data if item is not None)
+
+        return self.__data
+
+
+    def __numericItems(self):
+        """
+        Return the items of the populated slots of a numeric array as a NumPy array.
+        """
+        items = numpy.frombuffer(self.__data, dtype=self.__typecode)
+
+        if self.__nulls == 0:
+            return items
+
+        return items[self.__validity()]
+
+
+    def __validity(self):
+        """
+        Return the validity bitmap of a numeric array unpacked into a NumPy array of `bool`.
+        """
+        return numpy.unpackbits(numpy.frombuffer(self.__mask, dtype=numpy.uint8), count=self.__size, bitorder="little").view(bool)
+
+
+    # RELATED TESTS
+    #   test_elementwiseArithmetic()
+    #   test_elementwiseArithmeticWithoutNumPy()
+    #   test_elementwiseArithmeticOfDifferentSizes()
+    def add(self, other):
+        """
+        Return a new array of `self[i] + other[i]`. `other` may be an array of the same size or a single number.
+        """
+        return self.__elementwise(other, operator.add)
+
+
+    def subtract(self, other):
+        """
+        Return a new array of `self[i] - other[i]`. `other` may be an array of the same size or a single number.
+        """
+        return self.__elementwise(other, operator.sub)
+
+
+    def multiply(self, other):
+        """
+        Return a new array of `self[i] * other[i]`. `other` may be an array of the same size or a single number.
+        """
+        return self.__elementwise(other, operator.mul)
+
+
+    def divide(self, other):
+        """
+        Return a new `float` array of `self[i] / other[i]`. `other` may be an array of the same size or a single number.
+        """
+        return self.__elementwise(other, operator.truediv)
+
+
+    __add__ = add
+    __sub__ = subtract
+    __mul__ = multiply
+    __truediv__ = divide
+
+
+    def __elementwise(self, other, op):
+        """
+        Apply the binary operator `op` between the items of this array and `other`.
+        """
+        n = self.__size
+        self.__checkFull()
+
+        if type(other) == Array:
+            if other.__size != n:
+                raise ValueError("Arrays must be of the same size!")
+
+            other.__checkFull()
+            other_type = other.__type
+            other_typed = other.__typecode is not None
+            operands = other.__data
+        elif type(other) in _TYPECODES:
+            other_type = type(other)
+            other_typed = True
+            operands = repeat(other, n)
+        else:
+            raise TypeError("Unsupported operand for an array!")
+
+        if n == 0:
+            return Array(0, self.__type)
+
+        if self.__typecode is not None and other_typed:
+            result_type = float if float in (self.__type, other_type) or op == operator.truediv else int
+            code = _TYPECODES[result_type]
+
+            if numpy is not None and result_type == float:
+                result = array(code, bytes(n * 8))
+                left = numpy.frombuffer(self.__data, dtype=self.__typecode)
+                right = numpy.frombuffer(operands, dtype=other.__typecode) if type(other) == Array else other
+                errors = "raise" if op == operator.truediv else "warn"
+
+                with numpy.errstate(divide=errors, invalid=errors):
+                    try:
+                        getattr(numpy, _UFUNCS[op])(left, right, out=numpy.frombuffer(result, dtype=code))
+                    except FloatingPointError:
+                        raise ZeroDivisionError("division by zero")
+
+                return Array.__fromStorage(result_type, result, None)
+
+            try:
+                return Array.__fromStorage(result_type, array(code, map(op, self.__data, operands)), None)
+            except OverflowError:
+                # Result does not fit in 64 bits - build it from objects below.
+                operands = other.__data if type(other) == Array else repeat(other, n)
+
+        return Array.listToArray(list(map(op, self.__data, operands)))
+
+
+    # --- PARALLEL OPERATIONS ------------------------------------------------------------------------------------------------
+    # Items are placed in shared memory once; workers attach to it by name, so no item is ever pickled.
+
+    # RELATED TESTS
+    #   test_parallelReduce()
+    #   test_parallelOperationsOnObjectArray()
+    def parallelReduce(self, op="sum", workers: int = None):
+        """
+        Reduce a numeric array on `workers` processes (all CPUs by default). `op` is `"sum"`, `"min"`, `"max"` or an associative binary function that can be pickled, such as `operator.mul`.
+        """
+        self.__checkFull()
+
+        if self.__typecode is None:
+            raise TypeError("Only int and float arrays can be processed in parallel!")
+
+        if self.__size == 0 or not(op in _REDUCTIONS or callable(op)):
+            return _reduce(self, op)
+
+        with _SharedItems(self.__data) as items:
+            bounds = _chunkBounds(self.__size, workers)
+
+            with ProcessPoolExecutor(len(bounds)) as pool:
+                results = list(pool.map(_reduceChunk, repeat(items.name), repeat(self.__typecode), *zip(*bounds), repeat(op)))
+
+        return _reduce(Array.listToArray(results), op)
+
+
+    # RELATED TESTS
+    #   test_parallelMap()
+    #   test_parallelOperationsOnObjectArray()
+    def parallelMap(self, fn, type: type = None, workers: int = None):
+        """
+        Apply `fn` to every item of a numeric array on `workers` processes (all CPUs by default) and return the results as a new array of `type` (the type of this array by default). `fn` must be picklable, i.e. defined at module level.
+        """
+        self.__checkFull()
+        type = self.__type if type == None else type
+
+        if self.__typecode is None or type not in _TYPECODES:
+            raise TypeError("Only int and float arrays can be processed in parallel!")
+
+        n = self.__size
+        result = Array(n, type)
+        result.__mask = None
+        result.__nulls = 0
+
+        if n == 0:
+            return result
+
+        with _SharedItems(self.__data) as items, _SharedItems(result.__data) as output:
+            bounds = _chunkBounds(n, workers)
+
+            with ProcessPoolExecutor(len(bounds)) as pool:
+                list(pool.map(_mapChunk, repeat(items.name), repeat(self.__typecode), repeat(output.name), repeat(_TYPECODES[type]), *zip(*bounds), repeat(fn)))
+
+            output.copyTo(result.__data)
+
+        return result
+
+    # --- PARALLEL OPERATIONS ------------------------------------------------------------------------------------------------
+
+
+    # --- SORT ---------------------------------------------------------------------------------------------------------------
+
+    # RELATED TESTS
+    #   test_sortArray()
+    #   test_sortArrayWithoutNumPy()
+    #   test_sortArrayWithKey()
+    #   test_sortArrayWithEmptySlots()
+    #   test_sortArrayInReverseIsStable()
+    def sort(self, key=None, reverse: bool = False):
+        """
+        Sort the array in place. The sort is stable; `key` and `reverse` behave as in the built-in `sorted()`. Numeric arrays without a `key` are sorted by NumPy directly in their storage when it is installed.
+        """
+        self.__checkFull()
+
+        if self.__shared is not None:
+            self.__unshare()
+
+        if numpy is not None and self.__typecode is not None and key == None:
+            items = numpy.frombuffer(self.__data, dtype=self.__typecode)
+
+            # Equal floats can still differ (`0.0` and `-0.0`), so they are reversed before as well as after an ascending sort to stay stable.
+            if reverse and self.__typecode == 'd':
+                items[:] = items[::-1]
+
+            # Equal integers are indistinguishable, so they can use NumPy's faster unstable sort.
+            items.sort(kind=None if self.__typecode == 'q' else "stable")
+
+            if reverse:
+                items[:] = items[::-1]
+        elif self.__typecode is None:
+            self.__data.sort(key=key, reverse=reverse)
+        else:
+            self.__write(slice(None), sorted(self.__data, key=key, reverse=reverse))
+
+
+    # RELATED TESTS
+    #   test_bisectSortedArray()
+    def bisectLeft(self, item, lo: int = 0, hi: int = None, key=None) -> int:
+        """
+        Return the leftmost index at which `item` could be inserted into a sorted array and keep it sorted.
+        """
+        return bisect.bisect_left(self.__data, item, lo, self.__size if hi == None else hi, key=key)
+
+
+    # RELATED TESTS
+    #   test_bisectSortedArray()
+    def bisectRight(self, item, lo: int = 0, hi: int = None, key=None) -> int:
+        """
+        Return the rightmost index at which `item` could be inserted into a sorted array and keep it sorted.
+        """
+        return bisect.bisect_right(self.__data, item, lo, self.__size if hi == None else hi, key=key)
+
+
+    # RELATED TESTS
+    #   test_bisectSortedArray()
+    def search(self, item, key=None) -> int:
+        """
+        Return the index of the first occurrence of `item` in a sorted array, or `-1` if it is not there. With a `key`, `item` is compared against the keys of the items.
+        """
+        i = bisect.bisect_left(self.__data, item, 0, self.__size, key=key)
+
+        if i < self.__size and (self.__data[i] if key == None else key(self.__data[i])) == item:
+            return i
+
+        return -1
+
+    # --- SORT ---------------------------------------------------------------------------------------------------------------
+
+
+    def __checkItems(self, items):
+        """
+        Raise a `TypeError` unless every item is of the array's type.
+        """
+        if not(set(map(type, items)) <= {self.__type}):
+            raise TypeError("Illegal type for the array!")
+
+
+    def __checkFull(self):
+        """
+        Raise a `ValueError` if any slot of the array has not been set.
+        """
+        if self.countNulls() > 0:
+            raise ValueError("Array contains empty slots!")
+
+
+    def __pack(self, items: list):
+        """
+        Convert type-checked `items` into the storage format of the array. Moves the array into object slots if an `int` does not fit in 64 bits.
+        """
+        if self.__typecode is not None and type(items) == list:
+            try:
+                return array(self.__typecode, items)
+            except OverflowError:
+                if self.__external:
+                    raise OverflowError("Integer is too large for the shared buffer!")
+
+                self.__promote()
+
+        return items
+
+
+    def __write(self, positions: slice, items: list):
+        """
+        Write type-checked `items` into the slots selected by `positions`.
+        """
+        if self.__shared is not None:
+            self.__unshare()
+
+        items = self.__pack(items)
+
+        if self.__typecode is None:
+            self.__data[positions] = items
+        else:
+            with memoryview(self.__data) as view:
+                view[positions] = items
+
+            if self.__nulls:
+                written = range(self.__size)[positions]
+                self.__nulls -= len(written) - _countBits(_sliceBits(self.__mask, written))
+                _setBits(self.__mask, written, None)
+
+
+    def __copyFrom(self, positions: slice, source):
+        """
+        Copy the storage of the array `source` (including its empty slots) into the slots selected by `positions`.
+        """
+        if self.__shared is not None:
+            self.__unshare()
+
+        if self.__typecode is None or self.__typecode != source.__typecode:
+            items = source.toList()
+
+            if self.__typecode is not None and None in items:
+                self.__promote()
+
+            self.__write(positions, items)
+            return
+
+        if source.__nulls and self.__mask is None:
+            self.__addMask()
+
+        with memoryview(self.__data) as view:
+            view[positions] = source.__data
+
+        if self.__nulls or source.__nulls:
+            written = range(self.__size)[positions]
+            self.__nulls += source.__nulls - (len(written) - _countBits(_sliceBits(self.__mask, written)))
+            _setBits(self.__mask, written, source.__mask if source.__nulls else None)
+
+    # --- BULK OPERATIONS ----------------------------------------------------------------------------------------------------
+
+
+    def __fromStorage(type: type, data, mask):
+        """
+        Wrap already populated storage (and its mask) in a new array without copying it.
+        """
+        arr = Array(0, type)
+        arr.__size = len(data)
+        arr.__typecode = None if isinstance(data, list) else _TYPECODES[type]
+        arr.__data = data
+        arr.__mask = mask
+        arr.__nulls = 0 if mask is None else arr.__size - _countBits(mask)
+
+        return arr
+
+
+    def __assignSpace(self):
+        """
+        Allocate contiguous storage for the array. Returns the storage along with a validity bitmap marking
+        which slots have been populated (`None` when the storage itself can represent empty slots).
+        """
+        n = self.__size
+
+        if self.__typecode is None:
+            return [None] * n, None
+
+        return Array.__allocate(self.__typecode, n), bytearray((n + 7) >> 3)
+
+
+    def __allocate(code: str, n: int):
+        """
+        Return zeroed storage for `n` items of typecode `code`. Large storage is an anonymous memory mapping whose pages
+        are only materialized on first write, so untouched slots cost neither time nor memory.
+        """
+        if n * 8 < _LAZY_BYTES:
+            return array(code, bytes(n * 8))
+
+        return memoryview(mmap.mmap(-1, n * 8)).cast(code)
+
+
+    def __addMask(self):
+        """
+        Give a fully populated numeric array a validity bitmap before one of its slots is emptied. A memory-mapped file only has room for one if it was created by `mapFile()` or saved with empty slots.
+        """
+        if self.__mapping is not None:
+            raise BufferError("Cannot empty slots of a mapped array whose file has no validity bitmap!")
+
+        self.__mask = _fullBits(self.__size)
+
+
+    def __unshare(self):
+        """
+        Give an array that was cloned storage of its own before it is written. The storage is copied unless every other clone has been released.
+        """
+        shared = self.__shared
+        self.__shared = None
+
+        if shared[0] == 1:
+            return
+
+        shared[0] -= 1
+
+        if self.__typecode is None:
+            self.__data = list(self.__data)
+        else:
+            data = Array.__allocate(self.__typecode, self.__size)
+
+            with memoryview(data) as view:
+                view[:] = self.__data
+
+            self.__data = data
+
+        if self.__mask is not None:
+            self.__mask = bytearray(self.__mask)
+
+
+    def __promote(self):
+        """
+        Move a typed array into object slots, e.g. when an `int` no longer fits in 64 bits.
+        """
+        self.__data = self.toList()
+        self.__mask = None
+        self.__nulls = 0
+        self.__typecode = None
+    
+    
+    def __getType(l:list):
+        """
+        Return the type shared by all items of `l`. Items are checked a chunk at a time, so a mismatch stops the scan early.
+        """
+        t = type(l[0])
+        items = iter(l)
+
+        for start in range(0, len(l), _CHUNK):
+            if set(map(type, islice(items, _CHUNK))) != {t}:
+                for i in range(start, len(l)):
+                    if type(l[i]) != t:
+                        raise TypeError(str.format("Incompatible type found at index {}!", i))
+
+        return t
+
+
+
+class ArrayView:
+    """
+    A non-copying window over a strided range of an `Array`. Reads and writes go straight to the parent array, and views can be sliced further into views of their own. Current implementation consists of:\n
+    `get()` - Retreive item from provided index of the view.\n
+    `set()` - Set item at provided index of the view.\n
+    `size()` - Return the number of slots in the view.\n
+    `type()` - Return the type of the array elements.\n
+    `view()` - Return a view over a range of this view.\n
+    `toArray()` - Copy the viewed slots into a new array.\n
+    `toList()` - Convert the viewed slots to a list and return it.\n
+    `len(view)`, `view[i]`, `view[a:b:c]`, `for x in view` - Built-in sequence protocol.
+    """
+
+    def __init__(self, array: Array, positions: range):
+        """
+        Initialize a view over the `positions` of `array`.
+        """
+        self.__array = array
+        self.__positions = positions
+
+
+    def __str__(self) -> str:
+        return str(self.toArray())
+
+
+    def __len__(self) -> int:
+        return len(self.__positions)
+
+
+    # RELATED TESTS
+    #   test_sliceArrayIntoView()
+    def __iter__(self):
+        return map(self.__array.get, self.__positions)
+
+
+    # RELATED TESTS
+    #   test_sliceArrayIntoView()
+    def __getitem__(self, index):
+        if type(index) == slice:
+            return self.view(index.start, index.stop, index.step)
+
+        return self.get(index + len(self.__positions) if index < 0 else index)
+
+
+    # RELATED TESTS
+    #   test_sliceArrayIntoView()
+    def __setitem__(self, index, item):
+        """
+        Set the item at `index` (negative indexes count from the end), or assign many items to a slice of the view.
+        """
+        if type(index) != slice:
+            self.set(index + len(self.__positions) if index < 0 else index, item)
+            return
+
+        positions = self.__positions[index]
+
+        if len(positions) == 0:
+            self.__array.setSlice(0, 0, item)
+        else:
+            # A range that runs down to index 0 stops at -1, which a slice would read as the last slot.
+            self.__array.setSlice(positions.start, None if positions.stop < 0 else positions.stop, item, positions.step)
+
+
+    # RELATED TESTS
+    #   test_viewArray()
+    def get(self, index: int):
+        """
+        Return the item at provided index of the view.
+        """
+        if 0 <= index < len(self.__positions):
+            return self.__array.get(self.__positions[index])
+
+        raise IndexError("Array index out of range!")
+
+
+    # RELATED TESTS
+    #   test_viewArray()
+    def set(self, index: int, item):
+        """
+        Set item at provided index of the view.
+        """
+        if not(0 <= index < len(self.__positions)):
+            raise IndexError("Array index out of range!")
+
+        self.__array.set(self.__positions[index], item)
+
+
+    def size(self) -> int:
+        """
+        Return the number of slots in the view.
+        """
+        return len(self.__positions)
+
+
+    def type(self):
+        """
+        Return the type of the array elements.
+        """
+        return self.__array.type()
+
+
+    # RELATED TESTS
+    #   test_chainViews()
+    def view(self, start: int = None, stop: int = None, step: int = None):
+        """
+        Return a view over the slots of this view selected by `start:stop:step`, sharing the same parent array.
+        """
+        return ArrayView(self.__array, self.__positions[start:stop:step])
+
+
+    # RELATED TESTS
+    #   test_viewWithNegativeStep()
+    def toArray(self) -> Array:
+        """
+        Copy the viewed slots into a new array.
+        """
+        positions = self.__positions
+
+        if len(positions) == 0:
+            return Array(0, self.__array.type())
+
+        # A range that runs down to index 0 stops at -1, which a slice would read as the last slot.
+        stop = None if positions.stop < 0 else positions.stop
+
+        return self.__array.getSlice(positions.start, stop, positions.step)
+
+
+    # RELATED TESTS
+    #   test_viewArray()
+    def toList(self) -> list:
+        """
+        Convert the viewed slots to a built-in list.
+        """
+        return self.toArray().toList()
+
+
+
+# ==================================================================================================
+#       VALIDITY BITMAPS
+# ==================================================================================================
+# Numeric arrays mark their populated slots in a bitmap: bit `i % 8` of byte `i // 8` is set once slot `i`
+# holds an item. Bits past the last slot are always clear, so set bits can be counted over whole bytes.
+
+def _fullBits(n: int) -> bytearray:
+    """
+    Return a bitmap of `n` populated slots.
+    """
+    bitmap = bytearray(b"\xff") * (n >> 3)
+
+    if n & 7:
+        bitmap.append((1 << (n & 7)) - 1)
+
+    return bitmap
+
+
+def _countBits(bitmap) -> int:
+    """
+    Return the number of populated slots in `bitmap`.
+    """
+    return int.from_bytes(bitmap, "little").bit_count()
+
+
+def _unpackBits(bitmap, start: int, stop: int) -> bytes:
+    """
+    Return the flags of slots `start` up to (excluding) `stop` as bytes of `0` and `1`.
+    """
+    first = start >> 3
+    flags = b"".join(map(_FLAGS.__getitem__, bitmap[first:(stop + 7) >> 3]))
+
+    return flags[start - (first << 3):stop - (first << 3)]
+
+
+def _packBits(flags) -> bytes:
+    """
+    Pack bytes of `0` and `1` into bitmap bytes. The number of flags must be a multiple of 8.
+    """
+    if len(flags) == 0:
+        return b""
+
+    return int(flags[::-1].translate(_DIGITS), 2).to_bytes(len(flags) >> 3, "little")
+
+
+def _sliceBits(bitmap, positions: range) -> bytearray:
+    """
+    Return the bitmap of the slots in `positions`. Contiguous ranges are shifted out as one integer.
+    """
+    n = len(positions)
+
+    if n == 0:
+        return bytearray()
+
+    if positions.step == 1:
+        value = int.from_bytes(bitmap[positions.start >> 3:(positions.stop + 7) >> 3], "little") >> (positions.start & 7)
+        return bytearray((value & ((1 << n) - 1)).to_bytes((n + 7) >> 3, "little"))
+
+    low = min(positions[0], positions[-1])
+    flags = _unpackBits(bitmap, low, max(positions[0], positions[-1]) + 1)
+    flags = flags[positions[0] - low::positions.step][:n]
+
+    return bytearray(_packBits(flags + bytes(-n % 8)))
+
+
+def _setBits(bitmap: bytearray, positions: range, source):
+    """
+    Copy the flags of the bitmap `source` (`None` if all of its slots are populated) onto the slots in `positions`. Contiguous ranges are written as one integer; strided ones are unpacked over the bytes they span.
+    """
+    n = len(positions)
+
+    if n == 0:
+        return
+
+    if positions.step == 1:
+        first, last = positions.start >> 3, (positions.stop + 7) >> 3
+        shift = positions.start & 7
+        field = (1 << n) - 1
+        value = field if source is None else int.from_bytes(source, "little") & field
+        region = int.from_bytes(bitmap[first:last], "little") & ~(field << shift) | value << shift
+        bitmap[first:last] = region.to_bytes(last - first, "little")
+        return
+
+    flags = b"\x01" * n if source is None else _unpackBits(source, 0, n)
+    first = min(positions[0], positions[-1]) >> 3
+    last = (max(positions[0], positions[-1]) + 8) >> 3
+    base = first << 3
+    region = bytearray(_unpackBits(bitmap, base, last << 3))
+    stop = positions[-1] - base + (1 if positions.step > 0 else -1)
+
+    region[positions[0] - base:stop if stop >= 0 else None:positions.step] = flags
+    bitmap[first:last] = _packBits(region)
+
+
+
+# ==================================================================================================
+#       PARALLEL WORKERS
+# ==================================================================================================
+
+# Reductions that `parallelReduce()` accepts by name.
+_REDUCTIONS = ("sum", "min", "max")
+
+
+class _SharedItems:
+    """
+    Context manager holding a copy of numeric storage in a named shared memory block, which is unlinked on exit.
+    """
+
+    def __init__(self, data):
+        self.__data = data
+
+
+    def __enter__(self):
+        with memoryview(self.__data) as view, view.cast('B') as raw:
+            self.__memory = shared_memory.SharedMemory(create=True, size=max(raw.nbytes, 1))
+            self.__memory.buf[:raw.nbytes] = raw
+
+        self.name = self.__memory.name
+        return self
+
+
+    def __exit__(self, *exc):
+        self.__memory.close()
+        self.__memory.unlink()
+
+
+    def copyTo(self, data):
+        """
+        Copy the shared bytes back into `data`.
+        """
+        with memoryview(data) as view, view.cast('B') as raw:
+            raw[:] = self.__memory.buf[:raw.nbytes]
+
+
+def _chunkBounds(n: int, workers: int = None) -> list:
+    """
+    Split `range(n)` into one contiguous `(start, stop)` chunk per worker.
+    """
+    workers = max(1, min(n, workers or os.cpu_count() or 1))
+    step = -(-n // workers)
+
+    return [(start, min(start + step, n)) for start in range(0, n, step)]
+
+
+def _reduce(arr: Array, op):
+    """
+    Reduce `arr` with a named reduction or a binary function.
+    """
+    if op in _REDUCTIONS:
+        return getattr(arr, op)()
+
+    if callable(op):
+        return functools.reduce(op, arr)
+
+    raise ValueError("Reduction must be \"sum\", \"min\", \"max\" or a binary function!")
+
+
+def _reduceChunk(name: str, code: str, start: int, stop: int, op):
+    """
+    Worker: reduce `start:stop` of the shared items called `name`.
+    """
+    memory = shared_memory.SharedMemory(name=name)
+
+    try:
+        return _reduceView(memory.buf, code, start, stop, op)
+    except Exception as error:
+        # The traceback's frames still hold views of the shared memory, which would block closing it.
+        raise error.with_traceback(None)
+    finally:
+        memory.close()
+
+
+def _reduceView(buffer, code: str, start: int, stop: int, op):
+    # Kept separate so that every view of the shared memory is released before it is closed.
+    return _reduce(Array.fromBuffer(buffer.cast(code)[start:stop]), op)
+
+
+def _mapChunk(name: str, code: str, output: str, output_code: str, start: int, stop: int, fn):
+    """
+    Worker: map `start:stop` of the shared items called `name` into the shared items called `output`.
+    """
+    memory = shared_memory.SharedMemory(name=name)
+    results = shared_memory.SharedMemory(name=output)
+
+    try:
+        _mapView(memory.buf, code, results.buf, output_code, start, stop, fn)
+    except Exception as error:
+        # The traceback's frames still hold views of the shared memory, which would block closing it.
+        raise error.with_traceback(None)
+    finally:
+        memory.close()
+        results.close()
 
-        return d
-    
-    
-    def __getType(l:list):
 
-        prev_t = type(l[0])
-        for i in range(len(l)):
-            
-            t = type(l[i])
-            # print(str.format("{} : {}", prev_t, t))
-            if prev_t != t:
-                
-                raise TypeError(str.format("Incompatible type found at index {}!", i))
-            
-            prev_t = t
-
-        return t
\ No newline at end of file
+def _mapView(buffer, code: str, output, output_code: str, start: int, stop: int, fn):
+    # Kept separate so that every view of the shared memory is released before it is closed.
+    Array.fromBuffer(output.cast(output_code)).setSlice(start, stop, Array.fromBuffer(buffer.cast(code)[start:stop]).map(fn))
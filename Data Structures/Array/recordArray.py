@@ -0,0 +1,219 @@
+from myArray import Array
+
+
+class RecordArray:
+    """
+    A fixed-size array of records that share a schema (field name to type). Every field is kept in its own `Array` column, so numeric fields are stored contiguously and a scan over one field never touches the others. Current implementation consists of:\n
+    `getRecord()` - Return the record at provided index as a dict.\n
+    `setRecord()` - Set the fields of the record at provided index.\n
+    `row()` - Return a non-copying view of the record at provided index.\n
+    `column()` - Return the `Array` that stores a field.\n
+    `size()` - Return the number of records.\n
+    `schema()` - Return the field names and types.\n
+    `listToArray()` - Convert a list of records to a record array and return its instance.\n
+    `toList()` - Convert the record array to a list of dicts and return it.
+    """
+
+    # RELATED TESTS
+    #   test_initializeRecordArray()
+    #   test_initializeRecordArrayWithEmptySchema()
+    def __init__(self, size: int, schema: dict):
+        """
+        Initialize a record array of `size` empty records, with one column per field of `schema`.
+        """
+        if len(schema) == 0:
+            raise ValueError("Schema must have at least one field!")
+
+        self.__size = size
+        self.__schema = dict(schema)
+        self.__columns = {name: Array(size, type) for name, type in self.__schema.items()}
+
+
+    def __str__(self) -> str:
+        return str.format("[{}]", ",".join(map(str, self.toList())))
+
+
+    def __len__(self) -> int:
+        return self.__size
+
+
+    # RELATED TESTS
+    #   test_setAndGetRecords()
+    #   test_setRecordAtIllegalIndex()
+    def getRecord(self, index: int) -> dict:
+        """
+        Return the record at provided index as a dict of its fields. Fields that have not been set are `None`.
+        """
+        if 0 <= index < self.__size:
+            return {name: column.get(index) for name, column in self.__columns.items()}
+
+        raise IndexError("Array index out of range!")
+
+
+    # RELATED TESTS
+    #   test_setAndGetRecords()
+    #   test_setRecordAtIllegalIndex()
+    #   test_setRecordWithInvalidFields()
+    def setRecord(self, index: int, *values, **fields):
+        """
+        Set the record at provided index, either from one value per field in schema order or from keyword arguments naming the fields to change. Every value is checked before any is written.
+        """
+        if not(0 <= index < self.__size):
+            raise IndexError("Array index out of range!")
+
+        if len(values) > 0:
+            if len(fields) > 0 or len(values) != len(self.__schema):
+                raise ValueError(str.format("Expected {} values or keyword fields!", len(self.__schema)))
+
+            fields = dict(zip(self.__schema, values))
+
+        for name, value in fields.items():
+            if name not in self.__schema:
+                raise KeyError(str.format("Unknown field '{}'!", name))
+
+            if type(value) != self.__schema[name]:
+                raise TypeError(str.format("Illegal type for field '{}'!", name))
+
+        for name, value in fields.items():
+            self.__columns[name].set(index, value)
+
+
+    # RELATED TESTS
+    #   test_rowView()
+    def row(self, index: int):
+        """
+        Return a `RecordView` of the record at provided index. Reads and writes go straight to the columns.
+        """
+        if 0 <= index < self.__size:
+            return RecordView(self, index)
+
+        raise IndexError("Array index out of range!")
+
+
+    # RELATED TESTS
+    #   test_columnAccess()
+    def column(self, name: str) -> Array:
+        """
+        Return the `Array` storing field `name`. The column is shared, not copied, so bulk operations such as `sum()` or `setSlice()` work on the records directly.
+        """
+        if name not in self.__columns:
+            raise KeyError(str.format("Unknown field '{}'!", name))
+
+        return self.__columns[name]
+
+
+    def size(self) -> int:
+        """
+        Return the number of records.
+        """
+        return self.__size
+
+
+    def schema(self) -> dict:
+        """
+        Return a copy of the schema, mapping field names to types.
+        """
+        return dict(self.__schema)
+
+
+    # RELATED TESTS
+    #   test_convertRecordsToRecordArray()
+    #   test_convertRecordsOfWrongLength()
+    def listToArray(records: list, schema: dict):
+        """
+        Convert a list of records (dicts or tuples in schema order) to a record array and return it. Each field is converted to its column in a single call.
+        """
+        arr = RecordArray(len(records), schema)
+
+        if len(records) == 0:
+            return arr
+
+        names = list(arr.__schema)
+        rows = [[record[name] for name in names] if type(record) == dict else record for record in records]
+
+        # `zip()` stops at the shortest record, so a record of the wrong length would silently drop fields.
+        if any(len(row) != len(names) for row in rows):
+            raise ValueError(str.format("Expected {} values per record!", len(names)))
+
+        for name, values in zip(names, zip(*rows)):
+            if not(set(map(type, values)) <= {arr.__schema[name]}):
+                raise TypeError(str.format("Illegal type for field '{}'!", name))
+
+            arr.__columns[name] = Array.listToArray(list(values), trusted=True)
+
+        return arr
+
+
+    # RELATED TESTS
+    #   test_convertRecordsToRecordArray()
+    def toList(self) -> list:
+        """
+        Convert this record array to a list of dicts, one per record.
+        """
+        names = list(self.__columns)
+        columns = [column.toList() for column in self.__columns.values()]
+
+        return [dict(zip(names, values)) for values in zip(*columns)]
+
+
+
+class RecordView:
+    """
+    A non-copying view of a single record of a `RecordArray`. Fields are read and written by name, straight through the columns. Current implementation consists of:\n
+    `get()` - Return the value of a field.\n
+    `set()` - Set the value of a field.\n
+    `index()` - Return the index of the viewed record.\n
+    `toDict()` - Copy the record into a dict.\n
+    `view[name]` - Built-in item access to the fields.
+    """
+
+    def __init__(self, records: RecordArray, index: int):
+        """
+        Initialize a view of the record at `index` of `records`.
+        """
+        self.__records = records
+        self.__index = index
+
+
+    def __str__(self) -> str:
+        return str(self.toDict())
+
+
+    def __getitem__(self, name: str):
+        return self.get(name)
+
+
+    def __setitem__(self, name: str, value):
+        self.set(name, value)
+
+
+    # RELATED TESTS
+    #   test_rowView()
+    def get(self, name: str):
+        """
+        Return the value of field `name`.
+        """
+        return self.__records.column(name).get(self.__index)
+
+
+    # RELATED TESTS
+    #   test_rowView()
+    def set(self, name: str, value):
+        """
+        Set the value of field `name`.
+        """
+        self.__records.column(name).set(self.__index, value)
+
+
+    def index(self) -> int:
+        """
+        Return the index of the viewed record.
+        """
+        return self.__index
+
+
+    def toDict(self) -> dict:
+        """
+        Copy the viewed record into a dict.
+        """
+        return self.__records.getRecord(self.__index)
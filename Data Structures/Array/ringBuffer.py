@@ -0,0 +1,263 @@
+from myArray import Array
+
+
+class RingBuffer:
+    """
+    A fixed-capacity, double-ended queue over a single `Array`. The stored items wrap around the end of the array, so pushing and popping at either end takes constant time and never allocates storage. Current implementation consists of:\n
+    `pushBack()`, `pushFront()` - Add an item to the back (newest end) or front (oldest end).\n
+    `popBack()`, `popFront()` - Remove and return the item at the back or front.\n
+    `peekBack()`, `peekFront()` - Return the item at the back or front without removing it.\n
+    `get()` - Retreive item at provided index, counting from the front.\n
+    `last()` - Return the `k` newest items as an `Array`.\n
+    `clear()` - Remove every item.\n
+    `size()` - Return the number of stored items.\n
+    `capacity()` - Return the maximum number of items.\n
+    `type()` - Return the type of the buffer elements.\n
+    `isEmpty()`, `isFull()` - Check if the buffer is empty or full.\n
+    `toList()` - Convert the buffer to a list, front to back, and return it.
+    """
+
+    # RELATED TESTS
+    #   test_initializeRingBuffer()
+    #   test_initializeRingBufferWithoutCapacity()
+    def __init__(self, capacity: int, type: type, overwrite: bool = False):
+        """
+        Initialize an empty ring buffer holding up to `capacity` items of `type`. With `overwrite`, pushing to a full buffer drops the item at the opposite end instead of raising a `FullBufferException`.
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1!")
+
+        self.__data = Array(capacity, type)
+        self.__capacity = capacity
+        self.__head = 0
+        self.__size = 0
+        self.__overwrite = overwrite
+
+
+    def __str__(self) -> str:
+        return str.format("[{}]", ",".join(map(str, self)))
+
+
+    def __len__(self) -> int:
+        return self.__size
+
+
+    def __iter__(self):
+        return map(self.get, range(self.__size))
+
+
+    # RELATED TESTS
+    #   test_pushAndPopAtBothEnds()
+    #   test_pushToFullBuffer()
+    #   test_overwriteOldestItems()
+    def pushBack(self, item):
+        """
+        Add an item to the back of the buffer.
+        """
+        size = self.__size
+
+        if size == self.__capacity:
+            if not(self.__overwrite):
+                raise FullBufferException()
+
+            # The oldest item is overwritten in place and the front moves past it.
+            self.__data.set(self.__head, item)
+            self.__head = (self.__head + 1) % size
+            return
+
+        self.__data.set((self.__head + size) % self.__capacity, item)
+        self.__size = size + 1
+
+
+    # RELATED TESTS
+    #   test_pushAndPopAtBothEnds()
+    #   test_overwriteOldestItems()
+    def pushFront(self, item):
+        """
+        Add an item to the front of the buffer.
+        """
+        head = (self.__head - 1) % self.__capacity
+
+        # In a full buffer the newest item sits just before the front, so it is overwritten in place.
+        if self.__size == self.__capacity:
+            if not(self.__overwrite):
+                raise FullBufferException()
+        else:
+            self.__size += 1
+
+        self.__data.set(head, item)
+        self.__head = head
+
+
+    # RELATED TESTS
+    #   test_pushAndPopAtBothEnds()
+    #   test_popFromEmptyBuffer()
+    def popBack(self):
+        """
+        Remove and return the item at the back of the buffer.
+        """
+        if self.__size == 0:
+            raise EmptyBufferException()
+
+        index = (self.__head + self.__size - 1) % self.__capacity
+        item = self.__data.get(index)
+        self.__data.clear(index, index + 1)
+        self.__size -= 1
+
+        return item
+
+
+    # RELATED TESTS
+    #   test_pushAndPopAtBothEnds()
+    #   test_popFromEmptyBuffer()
+    def popFront(self):
+        """
+        Remove and return the item at the front of the buffer.
+        """
+        if self.__size == 0:
+            raise EmptyBufferException()
+
+        index = self.__head
+        item = self.__data.get(index)
+        self.__data.clear(index, index + 1)
+        self.__head = (index + 1) % self.__capacity
+        self.__size -= 1
+
+        return item
+
+
+    # RELATED TESTS
+    #   test_popFromEmptyBuffer()
+    def peekBack(self):
+        """
+        Return the item at the back of the buffer without removing it.
+        """
+        if self.__size == 0:
+            raise EmptyBufferException()
+
+        return self.__data.get((self.__head + self.__size - 1) % self.__capacity)
+
+
+    # RELATED TESTS
+    #   test_popFromEmptyBuffer()
+    def peekFront(self):
+        """
+        Return the item at the front of the buffer without removing it.
+        """
+        if self.__size == 0:
+            raise EmptyBufferException()
+
+        return self.__data.get(self.__head)
+
+
+    # RELATED TESTS
+    #   test_overwriteOldestItems()
+    def get(self, index: int):
+        """
+        Return the item at provided index, `0` being the front of the buffer.
+        """
+        if 0 <= index < self.__size:
+            return self.__data.get((self.__head + index) % self.__capacity)
+
+        raise IndexError("Buffer index out of range!")
+
+
+    # RELATED TESTS
+    #   test_readLastItems()
+    def last(self, k: int) -> Array:
+        """
+        Return a copy of the `k` newest items as an `Array`, oldest first. The items are copied with at most two slice copies, one per side of the wrap-around.
+        """
+        if not(0 <= k <= self.__size):
+            raise IndexError("Cannot read more items than the buffer holds!")
+
+        start = (self.__head + self.__size - k) % self.__capacity
+
+        if start + k <= self.__capacity:
+            return self.__data.getSlice(start, start + k)
+
+        split = self.__capacity - start
+        items = Array(k, self.__data.type())
+        items.setSlice(0, split, self.__data.getSlice(start, self.__capacity))
+        items.setSlice(split, k, self.__data.getSlice(0, k - split))
+
+        return items
+
+
+    # RELATED TESTS
+    #   test_readLastItems()
+    def clear(self):
+        """
+        Remove every item from the buffer.
+        """
+        self.__data.clear()
+        self.__head = 0
+        self.__size = 0
+
+
+    def size(self) -> int:
+        """
+        Return the number of stored items.
+        """
+        return self.__size
+
+
+    def capacity(self) -> int:
+        """
+        Return the maximum number of stored items.
+        """
+        return self.__capacity
+
+
+    def type(self):
+        """
+        Return the type of stored elements.
+        """
+        return self.__data.type()
+
+
+    # RELATED TESTS
+    #   test_initializeRingBuffer()
+    #   test_pushToFullBuffer()
+    def isEmpty(self) -> bool:
+        """
+        Return `True` if the buffer holds no items. Otherwise, return `False`.
+        """
+        return self.__size == 0
+
+
+    # RELATED TESTS
+    #   test_initializeRingBuffer()
+    #   test_pushToFullBuffer()
+    def isFull(self) -> bool:
+        """
+        Return `True` if the buffer holds `capacity` items. Otherwise, return `False`.
+        """
+        return self.__size == self.__capacity
+
+
+    def toList(self) -> list:
+        """
+        Convert this buffer to a built-in list, front to back.
+        """
+        return list(self)
+
+
+
+class EmptyBufferException(Exception):
+    """
+    Raised when an item is read from or removed from an empty buffer.
+    """
+    def __init__(self, message="This buffer is empty.") -> None:
+        self.message = message
+        super().__init__(self.message)
+
+
+
+class FullBufferException(Exception):
+    """
+    Raised when an item is pushed to a full buffer that does not overwrite.
+    """
+    def __init__(self, message="This buffer is full.") -> None:
+        self.message = message
+        super().__init__(self.message)
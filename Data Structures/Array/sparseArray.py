@@ -0,0 +1,175 @@
+from myArray import Array
+
+
+class SparseArray:
+    """
+    A fixed-size, homogeneous array that only stores its occupied slots, so memory and construction time depend on the number of items rather than the size. Empty slots read as `None`, like in `Array`. Current implementation consists of:\n
+    `get()` - Retreive item from provided index.\n
+    `set()` - Set item at provided index.\n
+    `clear()` - Empty a range of slots.\n
+    `size()` - Return the size of the array.\n
+    `count()` - Return the number of occupied slots.\n
+    `type()` - Return the type of the array elements.\n
+    `extend()` - Extend array by doubling its size and returning a new instance.\n
+    `occupied()` - Iterate over `(index, item)` pairs of occupied slots in index order.\n
+    `toList()` - Convert the array to a list and return it.\n
+    `toArray()` - Convert the array to a dense `Array`.\n
+    `fromArray()` - Convert a dense `Array` to a sparse array.
+    """
+
+    # RELATED TESTS
+    #   test_initializeSparseArray()
+    def __init__(self, size: int, type: type):
+        """
+        Initialize an empty sparse array with a predefined `size` and `type`. No space is allocated for the slots.
+        """
+        self.__size = size
+        self.__type = type
+        self.__items = {}
+        self.__order = []
+
+
+    def __str__(self) -> str:
+        return str(self.toArray())
+
+
+    def __len__(self) -> int:
+        return self.__size
+
+
+    # RELATED TESTS
+    #   test_setAndGetSparseItems()
+    #   test_setSparseItemAtIllegalIndex()
+    def get(self, index: int):
+        """
+        Return the item at provided index, or `None` if the slot is empty.
+        """
+        if 0 <= index < self.__size:
+            return self.__items.get(index)
+
+        raise IndexError("Array index out of range!")
+
+
+    # RELATED TESTS
+    #   test_setAndGetSparseItems()
+    #   test_setSparseItemAtIllegalIndex()
+    def set(self, index: int, item):
+        """
+        Set item at provided index.
+        """
+        if type(item) != self.__type:
+            raise TypeError("Illegal type for the array!")
+
+        if not(0 <= index < self.__size):
+            raise IndexError("Array index out of range!")
+
+        if index not in self.__items:
+            self.__order = None
+
+        self.__items[index] = item
+
+
+    # RELATED TESTS
+    #   test_clearSparseSlots()
+    def clear(self, start: int = 0, stop: int = None):
+        """
+        Empty every slot from `start` up to (excluding) `stop`.
+        """
+        stop = self.__size if stop == None else stop
+
+        if not(0 <= start <= stop <= self.__size):
+            raise IndexError("Array index out of range!")
+
+        for index in [index for index in self.__items if start <= index < stop]:
+            del self.__items[index]
+
+        self.__order = None
+
+
+    def size(self) -> int:
+        """
+        Return the size of the array.
+        """
+        return self.__size
+
+
+    # RELATED TESTS
+    #   test_setAndGetSparseItems()
+    def count(self) -> int:
+        """
+        Return the number of occupied slots.
+        """
+        return len(self.__items)
+
+
+    def type(self):
+        """
+        Return the type of stored elements.
+        """
+        return self.__type
+
+
+    # RELATED TESTS
+    #   test_extendSparseArray()
+    def extend(self):
+        """
+        Return a copy of this array extended to double its size.
+        """
+        arr = SparseArray(self.__size * 2, self.__type)
+        arr.__items = dict(self.__items)
+        arr.__order = None
+
+        return arr
+
+
+    # RELATED TESTS
+    #   test_iterateOccupiedSlots()
+    def occupied(self):
+        """
+        Iterate over the `(index, item)` pairs of occupied slots in index order.
+        """
+        if self.__order == None:
+            self.__order = sorted(self.__items)
+
+        items = self.__items
+
+        return ((index, items[index]) for index in self.__order)
+
+
+    # RELATED TESTS
+    #   test_convertSparseArrayToDense()
+    def toList(self) -> list:
+        """
+        Convert this array to a built-in list, with `None` in the empty slots.
+        """
+        l = [None] * self.__size
+
+        for index, item in self.__items.items():
+            l[index] = item
+
+        return l
+
+
+    # RELATED TESTS
+    #   test_convertSparseArrayToDense()
+    def toArray(self) -> Array:
+        """
+        Convert this array to a dense `Array`.
+        """
+        arr = Array(self.__size, self.__type)
+        arr.setMany(self.__items.keys(), self.__items.values())
+
+        return arr
+
+
+    # RELATED TESTS
+    #   test_convertSparseArrayToDense()
+    def fromArray(arr: Array):
+        """
+        Convert a dense `Array` to a sparse array holding its non-empty slots.
+        """
+        sparse = SparseArray(arr.size(), arr.type())
+        sparse.__items = {index: item for index, item in enumerate(arr) if item is not None}
+        sparse.__order = list(sparse.__items)
+
+        return sparse
@@ -1,5 +1,24 @@
+import copy
+import io
+import mmap
+import operator
+import os
+import pickle
+import random
+import tempfile
+import tracemalloc
 import unittest
+from array import array
+from unittest import mock
 from myArray import *
+from dynamicArray import *
+from bitArray import *
+from sparseArray import *
+from recordArray import *
+from matrix import *
+from ringBuffer import *
+from chunkedArray import *
+import myArray
 
 class TestArray(unittest.TestCase):
     """
@@ -79,6 +98,44 @@ class TestArray(unittest.TestCase):
             arrStr.set(2, [1,2,3])
 
 
+    def test_getItemAtIndexEqualToSize(self):
+        """
+        Attempt to get an item at index equal to the size of the array. An `IndexError` exception should be thrown.
+        """
+        arrInt = Array.initDirect(1,2,3)
+
+        with self.assertRaises(IndexError):
+            arrInt.get(3)
+
+        with self.assertRaises(IndexError):
+            arrInt.get(-1)
+
+
+    def test_floatArrayStorage(self):
+        """
+        Empty slots of a numeric array should read as `None` until they are set.
+        """
+        arrFloat = Array(3, float)
+        arrFloat.set(1, 2.5)
+
+        self.assertIsNone(arrFloat.get(0))
+        self.assertEqual(arrFloat.get(1), 2.5)
+        self.assertEqual(arrFloat.toList(), [None, 2.5, None])
+        self.assertEqual(str(arrFloat), "[,2.5,]")
+
+
+    def test_setIntegerLargerThan64Bits(self):
+        """
+        Attempt to store an integer that does not fit in 64 bits. The array should keep working and retain all of its items.
+        """
+        arrInt = Array(3, int)
+        arrInt.set(0, 1)
+        arrInt.set(1, 2**70)
+
+        self.assertEqual(arrInt.toList(), [1, 2**70, None])
+        self.assertEqual(str(arrInt.extend()), str.format("[1,{},,,,]", 2**70))
+
+
     def test_extensibleArray(self):
         """
         Attempt to extend the array by doubling its size in order to accommodate more elemnts.
@@ -154,6 +211,49 @@ class TestArray(unittest.TestCase):
         with self.assertRaises(TypeError):
             Array.listToArray(l)
 
+        with self.assertRaises(TypeError):
+            Array.listToArray([1.0,2.0,3])
+
+        with self.assertRaises(TypeError):
+            Array.listToArray([1,True])
+
+
+    def test_convertEmptyListToArray(self):
+        """
+        Attempt to convert an empty list to an array. The type cannot be inferred, so a `ValueError` exception should be thrown.
+        """
+        with self.assertRaises(ValueError):
+            Array.listToArray([])
+
+
+    def test_convertStdlibArrayToArray(self):
+        """
+        Convert an `array.array` and another array. Items should be copied, not shared.
+        """
+        source = array('i', [1,2,3])
+        arr = Array.listToArray(source)
+        copy = Array.listToArray(arr)
+
+        source[0] = 10
+        copy.set(1, 20)
+
+        self.assertEqual(arr.type(), int)
+        self.assertEqual(str(arr), "[1,2,3]")
+        self.assertEqual(str(copy), "[1,20,3]")
+        self.assertEqual(Array.listToArray(array('f', [0.5])).type(), float)
+
+
+    def test_convertTrustedListToArray(self):
+        """
+        Convert lists with the type check skipped. Items should still end up in the right storage.
+        """
+        arr = Array.listToArray(["a","b"], trusted=True)
+        big = Array.listToArray([1, 2**64], trusted=True)
+
+        self.assertEqual(arr.type(), str)
+        self.assertEqual(str(arr), "[a,b]")
+        self.assertEqual(big.toList(), [1, 2**64])
+
 
     def test_convertArrayToList(self):
         """
@@ -166,6 +266,1848 @@ class TestArray(unittest.TestCase):
         self.assertEqual(l, [1,2,3,4,5])
 
 
+    def test_exportNumericArrayAsMemoryView(self):
+        """
+        Export an `int` array as a `memoryview`. The view should share the array's memory, so writes through it are visible in the array.
+        """
+        arr = Array.initDirect(1,2,3)
+        view = arr.toMemoryView()
+
+        self.assertEqual(view.format, 'q')
+        self.assertEqual(view.tolist(), [1,2,3])
+
+        view[1] = 20
+
+        self.assertEqual(arr.get(1), 20)
+        self.assertEqual(bytes(view), array('q', [1,20,3]).tobytes())
+
+
+    def test_exportObjectArrayAsMemoryView(self):
+        """
+        Attempt to export an array of strings as a buffer. A `TypeError` exception should be thrown.
+        """
+        arr = Array.initDirect("a","b")
+
+        with self.assertRaises(TypeError):
+            arr.toMemoryView()
+
+
+    def test_wrapBufferWithoutCopying(self):
+        """
+        Wrap an `array.array` in an array. Both objects should share the same memory.
+        """
+        source = array('d', [0.5, 1.5, 2.5])
+        arr = Array.fromBuffer(source)
+
+        self.assertEqual(arr.size(), 3)
+        self.assertEqual(arr.type(), float)
+        self.assertEqual(str(arr), "[0.5,1.5,2.5]")
+
+        arr.set(0, 9.5)
+        source[2] = 7.5
+
+        self.assertEqual(source[0], 9.5)
+        self.assertEqual(arr.get(2), 7.5)
+
+
+    def test_wrapRawBytesWithType(self):
+        """
+        Wrap a `bytearray` holding raw 64-bit integers. The element type has to be passed explicitly.
+        """
+        raw = bytearray(array('q', [4,5,6]).tobytes())
+        arr = Array.fromBuffer(raw, int)
+
+        self.assertEqual(arr.toList(), [4,5,6])
+
+        with self.assertRaises(TypeError):
+            Array.fromBuffer(raw)
+
+
+    def test_wrapIncompatibleBuffer(self):
+        """
+        Attempt to wrap buffers whose items are not 64-bit integers or doubles. A `TypeError` exception should be thrown.
+        """
+        with self.assertRaises(TypeError):
+            Array.fromBuffer(array('i', [1,2,3]))
+
+        with self.assertRaises(TypeError):
+            Array.fromBuffer(array('d', [1.0]), int)
+
+
+
+    def test_fillArray(self):
+        """
+        Fill a range of slots with the same item. Slots outside of the range should stay empty.
+        """
+        arr = Array(5, int)
+        arr.fill(7, 1, 4)
+
+        self.assertEqual(str(arr), "[,7,7,7,]")
+
+        arr.fill(0)
+
+        self.assertEqual(str(arr), "[0,0,0,0,0]")
+
+        with self.assertRaises(TypeError):
+            arr.fill("seven")
+
+        with self.assertRaises(IndexError):
+            arr.fill(1, 0, 6)
+
+
+    def test_getAndSetSlice(self):
+        """
+        Copy a strided slice out of an array and write a slice back. The copy should not share memory with the original.
+        """
+        arr = Array.listToArray([0,1,2,3,4,5,6,7])
+        evens = arr.getSlice(0, None, 2)
+
+        self.assertEqual(evens.type(), int)
+        self.assertEqual(str(evens), "[0,2,4,6]")
+
+        evens.set(0, 100)
+        arr.setSlice(1, None, [10,30,50,70], 2)
+
+        self.assertEqual(arr.get(0), 0)
+        self.assertEqual(str(arr), "[0,10,2,30,4,50,6,70]")
+
+        arr.setSlice(0, 4, evens)
+
+        self.assertEqual(str(arr), "[100,2,4,6,4,50,6,70]")
+
+
+    def test_setSliceWithWrongLength(self):
+        """
+        Attempt to assign fewer items than there are slots in the slice. A `ValueError` exception should be thrown.
+        """
+        arr = Array(4, str)
+
+        with self.assertRaises(ValueError):
+            arr.setSlice(0, 4, ["a", "b"])
+
+        with self.assertRaises(TypeError):
+            arr.setSlice(0, 2, ["a", 2])
+
+
+    def test_setMany(self):
+        """
+        Set items at scattered indexes in a single call, with and without NumPy.
+        """
+        for engine in (myArray.numpy, None):
+            with mock.patch("myArray.numpy", engine):
+                arr = Array(6, int)
+                arr.setMany([5, 0, 3], [50, 0, 30])
+
+                self.assertEqual(str(arr), "[0,,,30,,50]")
+
+                with self.assertRaises(IndexError):
+                    arr.setMany([6], [1])
+
+                with self.assertRaises(TypeError):
+                    arr.setMany([1], [1.5])
+
+
+    def test_mapArray(self):
+        """
+        Map every item of an array through a function. The type of the result should be inferred from the returned values.
+        """
+        arr = Array.initDirect(1,2,3)
+
+        self.assertEqual(str(arr.map(lambda x: x * 2)), "[2,4,6]")
+        self.assertEqual(arr.map(str).type(), str)
+
+
+    def test_reduceArray(self):
+        """
+        Compute the sum, minimum and maximum of numeric arrays, with and without NumPy.
+        """
+        for engine in (myArray.numpy, None):
+            with mock.patch("myArray.numpy", engine):
+                arrInt = Array.initDirect(4, -2, 9, 2**62, 2**62)
+                arrFloat = Array.initDirect(0.5, 1.5, -3.0)
+
+                self.assertEqual(arrInt.sum(), 2**63 + 11)
+                self.assertEqual(arrInt.min(), -2)
+                self.assertEqual(arrInt.max(), 2**62)
+                self.assertEqual(arrFloat.sum(), -1.0)
+                self.assertEqual(arrFloat.min(), -3.0)
+                self.assertEqual(arrFloat.max(), 1.5)
+
+
+    def test_reduceArrayWithEmptySlots(self):
+        """
+        Reduce arrays that have unset slots. Empty slots should be skipped, and `min()`/`max()` of an empty array should raise a `ValueError`.
+        """
+        for engine in (myArray.numpy, None):
+            with mock.patch("myArray.numpy", engine):
+                arrInt = Array(10, int)
+                arrFloat = Array(10, float)
+                arrStr = Array(3, str)
+                arrInt.setSlice(2, 5, [4, -2, 9])
+                arrFloat.setMany([0, 9], [1.5, -0.5])
+                arrStr.set(1, "b")
+
+                self.assertEqual((arrInt.sum(), arrInt.min(), arrInt.max()), (11, -2, 9))
+                self.assertEqual((arrFloat.sum(), arrFloat.min(), arrFloat.max()), (1.0, -0.5, 1.5))
+                self.assertEqual((arrStr.min(), arrStr.max()), ("b", "b"))
+                self.assertEqual(Array(4, float).sum(), 0)
+
+                with self.assertRaises(ValueError):
+                    Array(4, int).min()
+
+
+    def test_nullSlots(self):
+        """
+        Check and count the empty slots of numeric and object arrays, across the bytes of the validity bitmap.
+        """
+        arrInt = Array(20, int)
+        arrInt.setSlice(3, 17, list(range(14)))
+        arrInt.clear(9, 10)
+        arrStr = Array.initDirect("a", "b", "c")
+        arrStr.clear(1, 2)
+
+        self.assertEqual([arrInt.isNull(i) for i in (2, 3, 8, 9, 10, 16, 17)], [True, False, False, True, False, False, True])
+        self.assertEqual(arrInt.countNulls(), 7)
+        self.assertEqual((arrStr.isNull(1), arrStr.countNulls()), (True, 1))
+        self.assertEqual(Array.initDirect(1.0, 2.0).countNulls(), 0)
+        self.assertTrue(None in arrInt)
+
+        with self.assertRaises(IndexError):
+            arrInt.isNull(20)
+
+
+    def test_countNullsAfterWrites(self):
+        """
+        Write, clear, copy and resize slots of a numeric array at random. The number of empty slots should always match a count over its items.
+        """
+        rng = random.Random(7)
+
+        for engine, arr in ((myArray.numpy, Array(40, int)), (None, Array.listToArray(list(range(40))))):
+            with mock.patch("myArray.numpy", engine):
+                for i in range(300):
+                    n = arr.size()
+                    start = rng.randrange(n + 1)
+                    stop = rng.randrange(start, n + 1)
+                    op = rng.randrange(6)
+
+                    if op == 0 and n > 0:
+                        arr.set(rng.randrange(n), i)
+                    elif op == 1:
+                        arr.clear(start, stop)
+                    elif op == 2:
+                        arr.setSlice(start, stop, [i] * (stop - start))
+                    elif op == 3:
+                        arr.setSlice(start, stop, arr.getSlice(n - (stop - start), n))
+                    elif op == 4 and n > 0:
+                        indices = [rng.randrange(n) for k in range(5)]
+                        arr.setMany(indices, [i] * 5)
+                    elif op == 5:
+                        arr.resize(rng.randrange(20, 60))
+
+                    self.assertEqual(arr.countNulls(), arr.toList().count(None))
+
+
+    def test_fillNulls(self):
+        """
+        Fill the empty slots of numeric and object arrays. Populated slots should keep their items.
+        """
+        arrFloat = Array(10, float)
+        arrFloat.setMany([0, 4, 5], [1.0, 2.0, 3.0])
+        arrFloat.fillNulls(0.0)
+        arrStr = Array(3, str)
+        arrStr.set(0, "a")
+        arrStr.fillNulls("-")
+
+        self.assertEqual(arrFloat.toList(), [1.0, 0.0, 0.0, 0.0, 2.0, 3.0, 0.0, 0.0, 0.0, 0.0])
+        self.assertEqual(arrFloat.countNulls(), 0)
+        self.assertEqual(arrStr.toList(), ["a", "-", "-"])
+
+        with self.assertRaises(TypeError):
+            arrFloat.fillNulls(1)
+
+
+    def test_fillNullsWithoutNumPy(self):
+        """
+        Fill runs of empty slots with the standard library alone, including with an integer that does not fit in 64 bits.
+        """
+        with mock.patch("myArray.numpy", None):
+            arr = Array(9, int)
+            arr.setMany([2, 3, 7], [1, 2, 3])
+            arr.fillNulls(-1)
+
+            self.assertEqual(arr.toList(), [-1, -1, 1, 2, -1, -1, -1, 3, -1])
+
+            arr.clear(0, 2)
+            arr.fillNulls(2**64)
+
+            self.assertEqual(arr.toList()[:3], [2**64, 2**64, 1])
+
+
+    def test_elementwiseArithmetic(self):
+        """
+        Add, subtract, multiply and divide arrays elementwise, and by a single number.
+        """
+        a = Array.initDirect(1, 2, 3)
+        b = Array.initDirect(4, 5, 6)
+        c = Array.initDirect(0.5, 0.5, 0.5)
+
+        self.assertEqual(str(a + b), "[5,7,9]")
+        self.assertEqual(str(b - a), "[3,3,3]")
+        self.assertEqual(str(a * 2), "[2,4,6]")
+        self.assertEqual((a + c).type(), float)
+        self.assertEqual(str(a + c), "[1.5,2.5,3.5]")
+        self.assertEqual(str(b / a), "[4.0,2.5,2.0]")
+        self.assertEqual(str(Array.initDirect("a", "b") + Array.initDirect("c", "d")), "[ac,bd]")
+
+        with self.assertRaises(ZeroDivisionError):
+            a / 0
+
+
+    def test_elementwiseArithmeticWithoutNumPy(self):
+        """
+        Elementwise arithmetic should give the same results on the stdlib fallback, including results beyond 64 bits.
+        """
+        with mock.patch("myArray.numpy", None):
+            a = Array.initDirect(1, 2, 3)
+            c = Array.initDirect(0.5, 0.5, 0.5)
+
+            self.assertEqual(str(a + c), "[1.5,2.5,3.5]")
+            self.assertEqual(str(a / 2), "[0.5,1.0,1.5]")
+            self.assertEqual((a * 2**62).toList(), [2**62, 2**63, 3 * 2**62])
+
+            with self.assertRaises(ZeroDivisionError):
+                c / 0
+
+
+    def test_elementwiseArithmeticOfDifferentSizes(self):
+        """
+        Attempt to add arrays of different sizes. A `ValueError` exception should be thrown.
+        """
+        with self.assertRaises(ValueError):
+            Array.initDirect(1, 2) + Array.initDirect(1, 2, 3)
+
+
+
+    def test_resizeArray(self):
+        """
+        Grow and shrink an array in place. Grown slots should be empty and shrinking should discard the trailing items.
+        """
+        arr = Array.initDirect(1,2,3)
+        arr.resize(5)
+
+        self.assertEqual(arr.size(), 5)
+        self.assertEqual(str(arr), "[1,2,3,,]")
+
+        arr.resize(2)
+
+        self.assertEqual(str(arr), "[1,2]")
+
+        with self.assertRaises(ValueError):
+            arr.resize(-1)
+
+
+    def test_resizeSharedBuffer(self):
+        """
+        Attempt to resize an array that wraps an external buffer. A `BufferError` exception should be thrown.
+        """
+        arr = Array.fromBuffer(array('q', [1,2,3]))
+
+        with self.assertRaises(BufferError):
+            arr.resize(6)
+
+        self.assertEqual(str(arr.extend()), "[1,2,3,,,]")
+
+
+    def test_lazyAllocation(self):
+        """
+        Allocate a large numeric array lazily. Untouched slots should read as empty and written slots should behave as usual.
+        """
+        n = (myArray._LAZY_BYTES // 8) * 4
+        arr = Array(n, int)
+
+        self.assertEqual(type(arr.toMemoryView().obj), mmap.mmap)
+        self.assertEqual(arr.get(n - 1), None)
+
+        arr.set(n - 1, 7)
+        arr.fill(1, 0, 3)
+
+        self.assertEqual(arr.get(n - 1), 7)
+        self.assertEqual(arr.getSlice(0, 4).toList(), [1,1,1,None])
+        self.assertEqual(arr.toMemoryView()[n // 2], 0)
+
+        # Lazy storage belongs to the array, so a large integer still moves it into object slots.
+        arr.set(1, 2**70)
+        self.assertEqual(arr.get(1), 2**70)
+        self.assertEqual(arr.get(n - 1), 7)
+
+
+    def test_pickleLazyArray(self):
+        """
+        Pickle and deep-copy a numeric array just above the size of lazy allocation. Items and empty slots should survive, and the copies should own their storage.
+        """
+        n = myArray._LAZY_BYTES // 8 + 1
+        arr = Array(n, int)
+        arr.setSlice(0, n - 2, list(range(n - 2)))
+        arr.set(n - 1, -1)
+
+        for restored in (pickle.loads(pickle.dumps(arr)), copy.deepcopy(arr)):
+            self.assertEqual(restored.toList(), arr.toList())
+            self.assertEqual(restored.countNulls(), 1)
+            self.assertEqual(type(restored.toMemoryView().obj), mmap.mmap)
+
+            restored.set(0, 5)
+            self.assertEqual((restored.get(0), arr.get(0)), (5, 0))
+
+
+    def test_resizeLazyArray(self):
+        """
+        Grow and shrink a lazily allocated array in place.
+        """
+        n = myArray._LAZY_BYTES // 8
+        arr = Array(n, float)
+        arr.set(0, 1.5)
+        arr.set(n - 1, 2.5)
+
+        arr.resize(n * 2)
+        self.assertEqual((arr.size(), arr.get(0), arr.get(n - 1), arr.get(n)), (n * 2, 1.5, 2.5, None))
+
+        arr.resize(2)
+        self.assertEqual(arr.toList(), [1.5, None])
+
+
+    def test_cloneArray(self):
+        """
+        Clone arrays of every storage kind. Writes to a clone should not be visible in the original and vice versa.
+        """
+        for arr in (Array.initDirect(1,2,3), Array.initDirect("a","b","c"), Array(3, float)):
+            clone = arr.clone()
+            original = arr.toList()
+
+            arr.clear(0, 1)
+            clone.setSlice(1, 3, arr.getSlice(0, 2))
+
+            self.assertEqual(clone.toList()[0], original[0])
+            self.assertEqual(arr.toList()[1:], original[1:])
+
+        arr = Array.initDirect(3,1,2)
+        clone = arr.clone()
+        clone.sort()
+        arr.resize(4)
+
+        self.assertEqual(clone.toList(), [1,2,3])
+        self.assertEqual(arr.toList(), [3,1,2,None])
+
+
+    def test_cloneSharesStorageUntilWritten(self):
+        """
+        A clone should allocate no storage until the first write, and the last remaining handle should write without copying.
+        """
+        arr = Array.listToArray(range(100000))
+
+        def allocated(action):
+            tracemalloc.start()
+            action()
+            size = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            return size
+
+        clones = []
+
+        self.assertLess(allocated(lambda: clones.append(arr.clone())), 10000)
+        self.assertGreater(allocated(lambda: clones[0].set(0, -1)), 800000)
+        self.assertLess(allocated(lambda: clones[0].set(1, -1)), 10000)
+
+        clones.append(arr.clone())
+        clones.pop()
+
+        self.assertLess(allocated(lambda: arr.set(0, -2)), 10000)
+        self.assertEqual((arr.get(0), arr.get(1), clones[0].get(0)), (-2, 1, -1))
+
+
+    def test_cloneExternalArray(self):
+        """
+        Clone an array that wraps an external buffer. The clone should be an independent copy.
+        """
+        source = array('q', [1,2,3])
+        arr = Array.fromBuffer(source)
+        clone = arr.clone()
+        source[0] = 10
+
+        self.assertEqual(clone.toList(), [1,2,3])
+        clone.resize(4)
+
+
+    def test_copyArray(self):
+        """
+        Copy a clone with `copy.copy()` and write to every copy in turn. Each copy should keep its own items, and an array created without `__init__` should be collected without errors.
+        """
+        arr = Array.listToArray([1, 2, 3])
+        clone = arr.clone()
+        copied = copy.copy(clone)
+        arr.set(0, 10)
+        clone.set(1, 20)
+        copied.set(2, 30)
+
+        self.assertEqual([arr.toList(), clone.toList(), copied.toList()], [[10, 2, 3], [1, 20, 3], [1, 2, 30]])
+
+        Array.__new__(Array).__del__()
+
+
+    def test_cloneExportedArray(self):
+        """
+        Clone an array whose storage has been exported as a memory view, then write through the view and the array. The clone should keep its items, and the view should keep writing into the array.
+        """
+        arr = Array.listToArray([1.0, 2.0, 3.0])
+        view = arr.toMemoryView()
+        clone = arr.clone()
+        view[0] = 42.0
+        arr.set(1, 5.0)
+        view[2] = 99.0
+
+        self.assertEqual(clone.toList(), [1.0, 2.0, 3.0])
+        self.assertEqual(arr.toList(), [42.0, 5.0, 99.0])
+
+
+    def test_clearSlots(self):
+        """
+        Empty a range of slots in numeric and object arrays.
+        """
+        arrInt = Array.initDirect(1,2,3,4)
+        arrStr = Array.initDirect("a","b","c")
+
+        arrInt.clear(1, 3)
+        arrStr.clear()
+
+        self.assertEqual(str(arrInt), "[1,,,4]")
+        self.assertEqual(arrStr.toList(), [None, None, None])
+
+
+
+    def test_createMappedArray(self):
+        """
+        Create a file-backed array, write to it and reopen the file. Written items should persist without any serialization step.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.arr")
+            arr = Array.mapFile(path, float, 4)
+
+            self.assertEqual(arr.size(), 4)
+            self.assertEqual(arr.type(), float)
+            self.assertEqual(str(arr), "[0.0,0.0,0.0,0.0]")
+
+            arr.set(2, 2.5)
+            arr.fill(1.0, 0, 2)
+            arr.close()
+
+            arr = Array.mapFile(path)
+
+            self.assertEqual(str(arr), "[1.0,1.0,2.5,0.0]")
+            self.assertEqual(os.path.getsize(path), 16 + 4 * 8 + 1)
+            arr.close()
+
+
+    def test_clearMappedArray(self):
+        """
+        Empty slots of mapped arrays, then close them. A created file should keep the empty slots, while a file saved without a bitmap should refuse them with a `BufferError` exception and stay intact.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.arr")
+            arr = Array.mapFile(path, int, 10)
+            arr.fill(5)
+            arr.clear(2, 9)
+            arr.close()
+
+            arr = Array.mapFile(path)
+
+            self.assertEqual(arr.toList(), [5, 5] + [None] * 7 + [5])
+            self.assertEqual(arr.countNulls(), 7)
+
+            arr.close()
+            path = os.path.join(directory, "saved.arr")
+            Array.initDirect(1, 2, 3).save(path)
+            arr = Array.mapFile(path)
+
+            with self.assertRaises(BufferError):
+                arr.clear()
+
+            with self.assertRaises(BufferError):
+                arr.setSlice(0, 3, Array(3, int))
+
+            arr.close()
+
+            self.assertEqual(Array.load(path).toList(), [1, 2, 3])
+
+
+    def test_reopenMappedArrayReadOnly(self):
+        """
+        Open a mapped array read-only. Items should be readable, but writes should fail.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.arr")
+            arr = Array.mapFile(path, int, 3)
+            arr.setMany([0, 1, 2], [7, 8, 9])
+            arr.close()
+
+            arr = Array.mapFile(path, int, readonly=True)
+
+            self.assertEqual(arr.toList(), [7, 8, 9])
+            self.assertEqual(arr.sum(), 24)
+
+            with self.assertRaises(TypeError):
+                arr.set(0, 1)
+
+            arr.close()
+
+
+    def test_mapInvalidFile(self):
+        """
+        Attempt to map a file that is not an array file, or with the wrong type. A `ValueError` or `TypeError` exception should be thrown.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "other.bin")
+
+            with open(path, "wb") as f:
+                f.write(b"not an array file at all")
+
+            with self.assertRaises(ValueError):
+                Array.mapFile(path)
+
+            Array.mapFile(path, int, 1).close()
+
+            with self.assertRaises(TypeError):
+                Array.mapFile(path, float)
+
+            with self.assertRaises(TypeError):
+                Array.mapFile(path, str, 1)
+
+
+    def test_viewArray(self):
+        """
+        Create a strided view over an array. Reads and writes through the view should reach the original array.
+        """
+        arr = Array.listToArray([0,1,2,3,4,5,6,7,8,9])
+        odds = arr.view(1, None, 2)
+
+        self.assertEqual(odds.size(), 5)
+        self.assertEqual(odds.type(), int)
+        self.assertEqual(odds.toList(), [1,3,5,7,9])
+
+        odds.set(0, 100)
+        arr.set(3, 300)
+
+        self.assertEqual(arr.get(1), 100)
+        self.assertEqual(odds.get(1), 300)
+        self.assertEqual(str(odds), "[100,300,5,7,9]")
+
+        with self.assertRaises(IndexError):
+            odds.get(5)
+
+
+    def test_chainViews(self):
+        """
+        Create a view of a view. The chained view should still write to the original array.
+        """
+        arr = Array.listToArray(list(range(20)))
+        window = arr.view(5, 15).view(2, None, 3)
+
+        self.assertEqual(window.toList(), [7,10,13])
+
+        window.set(2, -1)
+
+        self.assertEqual(arr.get(13), -1)
+
+
+    def test_viewWithNegativeStep(self):
+        """
+        Create a reversed view that runs down to the first slot of the array.
+        """
+        arr = Array.initDirect("a","b","c")
+        backwards = arr.view(None, None, -1)
+
+        self.assertEqual(backwards.toList(), ["c","b","a"])
+        self.assertEqual(backwards.view(1).toList(), ["b","a"])
+        self.assertEqual(arr.view(2, 2).toList(), [])
+
+
+    def test_sortArray(self):
+        """
+        Sort numeric and string arrays in place, in both directions.
+        """
+        arrInt = Array.initDirect(5, -3, 9, 0, 9, 2)
+        arrFloat = Array.initDirect(2.5, -1.0, 0.5)
+        arrStr = Array.initDirect("pear", "apple", "fig")
+
+        arrInt.sort()
+        arrFloat.sort(reverse=True)
+        arrStr.sort()
+
+        self.assertEqual(str(arrInt), "[-3,0,2,5,9,9]")
+        self.assertEqual(str(arrFloat), "[2.5,0.5,-1.0]")
+        self.assertEqual(str(arrStr), "[apple,fig,pear]")
+
+
+    def test_sortArrayWithoutNumPy(self):
+        """
+        Sort numeric arrays on the stdlib fallback, including integers beyond 64 bits.
+        """
+        with mock.patch("myArray.numpy", None):
+            arrInt = Array.initDirect(5, -3, 9, 0)
+            arrBig = Array.initDirect(2**70, 1, -2**70)
+
+            arrInt.sort(reverse=True)
+            arrBig.sort()
+
+            self.assertEqual(str(arrInt), "[9,5,0,-3]")
+            self.assertEqual(arrBig.toList(), [-2**70, 1, 2**70])
+
+
+    def test_sortArrayInReverseIsStable(self):
+        """
+        Sort floats that compare equal but differ, such as `0.0` and `-0.0`, in reverse on NumPy and on the stdlib fallback. Both should keep equal items in their original order, like `sorted()`.
+        """
+        values = [0.0, -0.0, 1.5, -0.0, -2.0]
+        expected = sorted(values, reverse=True)
+
+        for engine in (myArray.numpy, None):
+            with mock.patch("myArray.numpy", engine):
+                arr = Array.listToArray(values)
+                arr.sort(reverse=True)
+
+                self.assertEqual([str(item) for item in arr], [str(item) for item in expected])
+
+
+    def test_sortArrayWithKey(self):
+        """
+        Sort with a `key`. Items with equal keys should keep their original order.
+        """
+        arr = Array.initDirect("bb", "a", "cc", "d", "aa")
+        arr.sort(key=len)
+
+        self.assertEqual(str(arr), "[a,d,bb,cc,aa]")
+
+        arrInt = Array.initDirect(3, -1, -3, 1)
+        arrInt.sort(key=abs, reverse=True)
+
+        self.assertEqual(str(arrInt), "[3,-3,-1,1]")
+
+
+    def test_sortArrayWithEmptySlots(self):
+        """
+        Attempt to sort an array with unset slots. A `ValueError` exception should be thrown.
+        """
+        with self.assertRaises(ValueError):
+            Array(3, int).sort()
+
+
+    def test_bisectSortedArray(self):
+        """
+        Binary search a sorted array for present and missing items.
+        """
+        arr = Array.initDirect(1, 3, 3, 3, 7, 9)
+
+        self.assertEqual(arr.bisectLeft(3), 1)
+        self.assertEqual(arr.bisectRight(3), 4)
+        self.assertEqual(arr.bisectLeft(8), 5)
+        self.assertEqual(arr.search(7), 4)
+        self.assertEqual(arr.search(3), 1)
+        self.assertEqual(arr.search(4), -1)
+        self.assertEqual(arr.search(10), -1)
+
+        words = Array.initDirect("a", "bb", "ccc")
+
+        self.assertEqual(words.search(2, key=len), 1)
+
+
+    def test_saveAndLoadNumericArray(self):
+        """
+        Save numeric arrays to a file and load them back. Items and empty slots should survive, and a saved file should be mappable.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "values.arr")
+            arr = Array(5, int)
+            arr.setMany([0, 1, 4], [-1, 2**62, 7])
+            arr.save(path)
+
+            self.assertEqual(os.path.getsize(path), 16 + 5 * 8 + 1)
+
+            loaded = Array.load(path)
+
+            self.assertEqual(loaded.type(), int)
+            self.assertEqual(str(loaded), str.format("[-1,{},,,7]", 2**62))
+
+            mapped = Array.mapFile(path)
+            mapped.set(2, 3)
+            mapped.close()
+
+            self.assertEqual(Array.load(path).toList(), [-1, 2**62, 3, None, 7])
+
+            mapped = Array.mapFile(path)
+            mapped.fillNulls(0)
+            mapped.close()
+
+            self.assertEqual(Array.load(path).toList(), [-1, 2**62, 3, 0, 7])
+
+        buffer = io.BytesIO()
+        Array.initDirect(0.5, 1.5).save(buffer)
+        buffer.seek(0)
+
+        self.assertEqual(str(Array.load(buffer)), "[0.5,1.5]")
+
+
+    def test_saveAndLoadTextArrays(self):
+        """
+        Save `str` and `bytes` arrays, including empty slots and empty items, and load them back.
+        """
+        words = Array(4, str)
+        words.setMany([0, 1, 3], ["héllo", "", "wörld"])
+        blobs = Array.initDirect(b"\x00\x01", b"", b"abc")
+
+        for arr in (words, blobs):
+            buffer = io.BytesIO()
+            arr.save(buffer)
+            buffer.seek(0)
+            loaded = Array.load(buffer)
+
+            self.assertEqual(loaded.type(), arr.type())
+            self.assertEqual(loaded.toList(), arr.toList())
+
+
+    def test_saveUnsupportedArray(self):
+        """
+        Attempt to save arrays whose items have no binary encoding. A `TypeError` exception should be thrown.
+        """
+        with self.assertRaises(TypeError):
+            Array.initDirect([1], [2]).save(io.BytesIO())
+
+        with self.assertRaises(TypeError):
+            Array.initDirect(2**64).save(io.BytesIO())
+
+
+    def test_loadInvalidFile(self):
+        """
+        Attempt to load data that is not an array file, or a truncated one. A `ValueError` exception should be thrown.
+        """
+        with self.assertRaises(ValueError):
+            Array.load(io.BytesIO(b"definitely not an array"))
+
+        buffer = io.BytesIO()
+        Array.initDirect(1, 2, 3).save(buffer)
+
+        with self.assertRaises(ValueError):
+            Array.load(io.BytesIO(buffer.getvalue()[:-1]))
+
+
+    def test_sequenceProtocol(self):
+        """
+        Use `len()`, indexing and item assignment on an array, including negative indexes.
+        """
+        arr = Array.initDirect(1, 2, 3)
+        arr[0] = 10
+        arr[-1] = 30
+
+        self.assertEqual(len(arr), 3)
+        self.assertEqual(arr[0], 10)
+        self.assertEqual(arr[-2], 2)
+        self.assertEqual(str(arr), "[10,2,30]")
+
+        with self.assertRaises(IndexError):
+            arr[3]
+
+        with self.assertRaises(IndexError):
+            arr[-4] = 0
+
+        with self.assertRaises(TypeError):
+            arr[1] = "two"
+
+
+    def test_iterateArray(self):
+        """
+        Iterate an array forwards and backwards and test membership. Empty slots should appear as `None`.
+        """
+        arrInt = Array(4, int)
+        arrInt.setMany([0, 2], [5, 0])
+        arrStr = Array.initDirect("a", "b")
+
+        self.assertEqual(list(arrInt), [5, None, 0, None])
+        self.assertEqual(list(reversed(arrInt)), [None, 0, None, 5])
+        self.assertEqual(list(arrStr), ["a", "b"])
+        self.assertEqual(list(reversed(arrStr)), ["b", "a"])
+        self.assertEqual([x * 2 for x in Array.initDirect(1.5, 2.5)], [3.0, 5.0])
+
+        self.assertIn(5, arrInt)
+        self.assertIn(0, arrInt)
+        self.assertIn(None, arrInt)
+        self.assertNotIn(7, arrInt)
+        self.assertIn("b", arrStr)
+        self.assertNotIn(None, arrStr)
+
+        arrInt.setMany([1, 3], [1, 1])
+        arrInt.set(2, 9)
+
+        self.assertNotIn(0, arrInt)
+        self.assertNotIn(None, arrInt)
+
+
+    def test_sliceArrayIntoView(self):
+        """
+        Slice an array with the built-in syntax. Slices should be views, and slice assignment should write many items.
+        """
+        arr = Array.listToArray(list(range(10)))
+        window = arr[2:8]
+
+        self.assertEqual(type(window), ArrayView)
+        self.assertEqual(len(window), 6)
+        self.assertEqual(list(window[::2]), [2, 4, 6])
+        self.assertEqual(window[-1], 7)
+
+        window[0] = 20
+        arr[8:] = [80, 90]
+
+        self.assertEqual(arr[2], 20)
+        self.assertEqual(list(arr[7:]), [7, 80, 90])
+
+        window[0:2] = [7, 8]
+        window[::-2] = [-7, -5, -3]
+        arr[::-1][8:] = [11, 10]
+        window[4:4] = []
+
+        self.assertEqual(arr.toList(), [10, 11, 7, -3, 4, -5, 6, -7, 80, 90])
+
+        with self.assertRaises(ValueError):
+            window[0:2] = [1]
+
+
+    def test_parallelReduce(self):
+        """
+        Reduce numeric arrays on a pool of processes. Results should match the sequential reductions.
+        """
+        arrInt = Array.listToArray(list(range(1, 1001)))
+        arrFloat = Array.listToArray([i / 4 for i in range(-50, 50)])
+
+        self.assertEqual(arrInt.parallelReduce("sum", workers=3), 500500)
+        self.assertEqual(arrInt.parallelReduce("max", workers=3), 1000)
+        self.assertEqual(arrFloat.parallelReduce("min", workers=2), -12.5)
+        self.assertEqual(arrFloat.parallelReduce(workers=2), arrFloat.sum())
+        self.assertEqual(Array.initDirect(1, 2, 3, 4, 5).parallelReduce(operator.mul, workers=2), 120)
+
+        with self.assertRaises(ValueError):
+            arrInt.parallelReduce("mean", workers=2)
+
+
+    def test_parallelMap(self):
+        """
+        Map numeric arrays on a pool of processes into a new array of the requested type.
+        """
+        arr = Array.listToArray(list(range(-5, 5)))
+
+        self.assertEqual(arr.parallelMap(operator.neg, workers=3).toList(), list(range(5, -5, -1)))
+        self.assertEqual(str(arr.parallelMap(float, float, workers=2)), str(Array.listToArray([float(i) for i in range(-5, 5)])))
+
+        with self.assertRaises(TypeError):
+            arr.parallelMap(str, workers=2)
+
+
+    def test_parallelOperationsOnObjectArray(self):
+        """
+        Attempt to process a `str` array or an array with empty slots in parallel. A `TypeError` or `ValueError` exception should be thrown.
+        """
+        with self.assertRaises(TypeError):
+            Array.initDirect("a", "b").parallelReduce(workers=2)
+
+        with self.assertRaises(TypeError):
+            Array.initDirect("a", "b").parallelMap(str.upper, workers=2)
+
+        with self.assertRaises(ValueError):
+            Array(3, int).parallelReduce(workers=2)
+
+
+
+class TestDynamicArray(unittest.TestCase):
+    """
+    A dynamic array grows and shrinks its capacity in place as items are added and removed.
+    """
+
+    def test_initializeDynamicArray(self):
+        """
+        A new dynamic array should be empty, with the requested capacity and type.
+        """
+        arr = DynamicArray(int, 4)
+
+        self.assertEqual(arr.size(), 0)
+        self.assertEqual(arr.capacity(), 4)
+        self.assertEqual(arr.type(), int)
+        self.assertEqual(str(arr), "[]")
+
+
+    def test_invalidGrowthFactor(self):
+        """
+        Attempt to create a dynamic array that never grows. A `ValueError` exception should be thrown.
+        """
+        with self.assertRaises(ValueError):
+            DynamicArray(int, 4, 1)
+
+
+    def test_appendGrowsCapacity(self):
+        """
+        Append more items than the initial capacity. Capacity should grow geometrically and all items should be kept.
+        """
+        arr = DynamicArray(int, 2)
+
+        for i in range(5):
+            arr.append(i)
+
+        self.assertEqual(arr.size(), 5)
+        self.assertEqual(arr.capacity(), 8)
+        self.assertEqual(str(arr), "[0,1,2,3,4]")
+        self.assertEqual(arr.get(4), 4)
+
+        with self.assertRaises(TypeError):
+            arr.append("5")
+
+
+    def test_getBeyondSize(self):
+        """
+        Attempt to access a slot that is within capacity, but beyond the size. An `IndexError` exception should be thrown.
+        """
+        arr = DynamicArray(int, 8)
+        arr.append(1)
+
+        with self.assertRaises(IndexError):
+            arr.get(1)
+
+        with self.assertRaises(IndexError):
+            arr.set(1, 2)
+
+
+    def test_appendMany(self):
+        """
+        Append a list and an array in single calls.
+        """
+        arr = DynamicArray(str, 2)
+        arr.appendMany(["a", "b", "c"])
+        arr.appendMany(Array.initDirect("d", "e"))
+
+        self.assertEqual(arr.toList(), ["a", "b", "c", "d", "e"])
+
+
+    def test_insertItems(self):
+        """
+        Insert items at the start, middle and end of the array.
+        """
+        arr = DynamicArray(int, 2)
+        arr.appendMany([1, 3])
+        arr.insert(0, 0)
+        arr.insert(2, 2)
+        arr.insert(4, 4)
+
+        self.assertEqual(str(arr), "[0,1,2,3,4]")
+
+        with self.assertRaises(IndexError):
+            arr.insert(6, 6)
+
+
+    def test_popItems(self):
+        """
+        Pop the last item and an item from the middle of the array.
+        """
+        arr = DynamicArray(int)
+        arr.appendMany([1, 2, 3, 4])
+
+        self.assertEqual(arr.pop(), 4)
+        self.assertEqual(arr.pop(0), 1)
+        self.assertEqual(str(arr), "[2,3]")
+
+
+    def test_popFromEmptyArray(self):
+        """
+        Attempt to pop from an empty array. An `IndexError` exception should be thrown.
+        """
+        with self.assertRaises(IndexError):
+            DynamicArray(int).pop()
+
+
+    def test_popShrinksCapacity(self):
+        """
+        Pop most of the items of a large array. Capacity should shrink, but never below the initial capacity.
+        """
+        arr = DynamicArray(int, 4)
+        arr.appendMany(range(64))
+
+        for i in range(62):
+            arr.pop()
+
+        self.assertEqual(str(arr), "[0,1]")
+        self.assertLess(arr.capacity(), 64)
+        self.assertGreaterEqual(arr.capacity(), 4)
+
+
+    def test_appendAndPopAtCapacity(self):
+        """
+        Append to and pop from an array one item short of its capacity. Neither should count or rebuild the validity bitmap of the whole array.
+        """
+        arr = DynamicArray(int, 1 << 12)
+        arr.appendMany(range((1 << 12) - 1))
+        counted = []
+        countBits = myArray._countBits
+
+        def countSmallBitmaps(bitmap):
+            counted.append(len(bitmap))
+            return countBits(bitmap)
+
+        with mock.patch("myArray._countBits", countSmallBitmaps), mock.patch("myArray._fullBits", side_effect=AssertionError):
+            for i in range(4):
+                arr.append(i)
+                self.assertEqual(arr.pop(), i)
+
+        self.assertLessEqual(max(counted), 1)
+        self.assertEqual(arr.toArray().countNulls(), 0)
+        self.assertEqual(arr.get((1 << 12) - 2), (1 << 12) - 2)
+
+
+    def test_reserveCapacity(self):
+        """
+        Reserve capacity up front and release it again.
+        """
+        arr = DynamicArray(float, 4)
+        arr.reserve(100)
+
+        self.assertEqual(arr.capacity(), 100)
+
+        arr.append(1.0)
+        arr.shrinkToFit()
+
+        self.assertEqual(arr.capacity(), 4)
+        self.assertEqual(str(arr), "[1.0]")
+
+
+
+
+
+class TestBitArray(unittest.TestCase):
+    """
+    A bit array packs eight `bool` flags into every byte and supports bitwise operations over the whole array.
+    """
+
+    def test_initializeBitArray(self):
+        """
+        A new bit array should have every flag cleared.
+        """
+        arr = BitArray(10)
+
+        self.assertEqual(arr.size(), 10)
+        self.assertEqual(len(arr), 10)
+        self.assertEqual(arr.type(), bool)
+        self.assertEqual(arr.toList(), [False] * 10)
+
+
+    def test_setAndGetFlags(self):
+        """
+        Set and clear flags across byte boundaries.
+        """
+        arr = BitArray(20)
+        arr.set(0, True)
+        arr.set(9, True)
+        arr.set(19, True)
+        arr.set(9, False)
+
+        self.assertTrue(arr.get(0))
+        self.assertFalse(arr.get(9))
+        self.assertTrue(arr.get(19))
+        self.assertEqual(arr.popcount(), 2)
+
+
+    def test_setFlagAtIllegalIndex(self):
+        """
+        Attempt to set flags at illegal indexes or of illegal types. An `IndexError` or `TypeError` exception should be thrown.
+        """
+        arr = BitArray(8)
+
+        with self.assertRaises(IndexError):
+            arr.set(8, True)
+
+        with self.assertRaises(IndexError):
+            arr.get(-1)
+
+        with self.assertRaises(TypeError):
+            arr.set(0, 1)
+
+
+    def test_convertListToBitArray(self):
+        """
+        Convert a list of `bool` to a bit array and back.
+        """
+        flags = [True, False, False, True, True, False, True, False, False, True, True]
+        arr = BitArray.listToArray(flags)
+
+        self.assertEqual(arr.toList(), flags)
+        self.assertEqual(list(arr), flags)
+        self.assertEqual(str(BitArray.listToArray([True, False])), "[True,False]")
+        self.assertEqual(BitArray.listToArray([]).size(), 0)
+
+        with self.assertRaises(TypeError):
+            BitArray.listToArray([True, 0])
+
+
+    def test_bitwiseOperations(self):
+        """
+        Combine two bit arrays with `and`, `or`, `xor` and `not`. Padding bits of the last byte should stay cleared.
+        """
+        a = BitArray.listToArray([True, True, False, False, True, False, True, False, True, True])
+        b = BitArray.listToArray([True, False, True, False, True, True, False, False, False, True])
+
+        self.assertEqual((a & b).toList(), [True, False, False, False, True, False, False, False, False, True])
+        self.assertEqual((a | b).toList(), [True, True, True, False, True, True, True, False, True, True])
+        self.assertEqual((a ^ b).toList(), [False, True, True, False, False, True, True, False, True, False])
+        self.assertEqual((~a).toList(), [False, False, True, True, False, True, False, True, False, False])
+        self.assertEqual((~a).popcount(), 4)
+
+
+    def test_bitwiseOperationsOfDifferentSizes(self):
+        """
+        Attempt to combine bit arrays of different sizes. A `ValueError` exception should be thrown.
+        """
+        with self.assertRaises(ValueError):
+            BitArray(8) & BitArray(9)
+
+        with self.assertRaises(TypeError):
+            BitArray(8) | Array(8, bool)
+
+
+    def test_countAndFindFlags(self):
+        """
+        Count set flags, find the first set flag and rank indexes.
+        """
+        arr = BitArray(100)
+
+        for i in (3, 17, 64, 99):
+            arr.set(i, True)
+
+        self.assertEqual(arr.popcount(), 4)
+        self.assertEqual(arr.findFirstSet(), 3)
+        self.assertEqual(arr.findFirstSet(4), 17)
+        self.assertEqual(arr.findFirstSet(17), 17)
+        self.assertEqual(arr.findFirstSet(65), 99)
+        self.assertEqual(BitArray(50).findFirstSet(), -1)
+        self.assertEqual(arr.rank(0), 0)
+        self.assertEqual(arr.rank(4), 1)
+        self.assertEqual(arr.rank(64), 2)
+        self.assertEqual(arr.rank(100), 4)
+
+        with self.assertRaises(IndexError):
+            arr.rank(101)
+
+
+
+
+class TestSparseArray(unittest.TestCase):
+    """
+    A sparse array has the same contract as an array, but only stores the slots that are occupied.
+    """
+
+    def test_initializeSparseArray(self):
+        """
+        A huge sparse array should be created instantly and hold no items.
+        """
+        arr = SparseArray(10**12, int)
+
+        self.assertEqual(arr.size(), 10**12)
+        self.assertEqual(arr.type(), int)
+        self.assertEqual(arr.count(), 0)
+        self.assertIsNone(arr.get(10**12 - 1))
+
+
+    def test_setAndGetSparseItems(self):
+        """
+        Set a few items of a large sparse array. Only the set slots should be occupied.
+        """
+        arr = SparseArray(10**9, str)
+        arr.set(5, "five")
+        arr.set(10**8, "hundred million")
+        arr.set(5, "FIVE")
+
+        self.assertEqual(arr.get(5), "FIVE")
+        self.assertEqual(arr.get(10**8), "hundred million")
+        self.assertIsNone(arr.get(6))
+        self.assertEqual(arr.count(), 2)
+
+
+    def test_setSparseItemAtIllegalIndex(self):
+        """
+        Attempt to set items at illegal indexes or of illegal types. An `IndexError` or `TypeError` exception should be thrown.
+        """
+        arr = SparseArray(3, int)
+
+        with self.assertRaises(IndexError):
+            arr.set(3, 1)
+
+        with self.assertRaises(IndexError):
+            arr.get(-1)
+
+        with self.assertRaises(TypeError):
+            arr.set(0, "1")
+
+
+    def test_clearSparseSlots(self):
+        """
+        Empty a range of slots. Items outside of the range should stay.
+        """
+        arr = SparseArray(10, int)
+
+        for i in (1, 4, 7):
+            arr.set(i, i)
+
+        arr.clear(2, 8)
+
+        self.assertEqual(list(arr.occupied()), [(1, 1)])
+
+
+    def test_extendSparseArray(self):
+        """
+        Extend a sparse array. The copy should be twice as large and independent of the original.
+        """
+        arr = SparseArray(3, int)
+        arr.set(2, 2)
+        bigger = arr.extend()
+        bigger.set(5, 5)
+
+        self.assertEqual(bigger.size(), 6)
+        self.assertEqual(bigger.toList(), [None, None, 2, None, None, 5])
+        self.assertEqual(arr.count(), 1)
+
+
+    def test_iterateOccupiedSlots(self):
+        """
+        Iterate over occupied slots. Pairs should come in index order regardless of insertion order.
+        """
+        arr = SparseArray(1000, float)
+
+        for i in (900, 3, 450, 0):
+            arr.set(i, i / 2)
+
+        self.assertEqual(list(arr.occupied()), [(0, 0.0), (3, 1.5), (450, 225.0), (900, 450.0)])
+
+        arr.set(10, 5.0)
+
+        self.assertEqual([index for index, item in arr.occupied()], [0, 3, 10, 450, 900])
+
+
+    def test_convertSparseArrayToDense(self):
+        """
+        Convert a sparse array to a dense array and back.
+        """
+        sparse = SparseArray(6, int)
+        sparse.set(4, 40)
+        sparse.set(1, 10)
+
+        dense = sparse.toArray()
+
+        self.assertEqual(str(dense), "[,10,,,40,]")
+        self.assertEqual(str(sparse), "[,10,,,40,]")
+        self.assertEqual(sparse.toList(), dense.toList())
+
+        back = SparseArray.fromArray(dense)
+
+        self.assertEqual(back.size(), 6)
+        self.assertEqual(back.type(), int)
+        self.assertEqual(list(back.occupied()), [(1, 10), (4, 40)])
+
+class TestRecordArray(unittest.TestCase):
+    """
+    A record array holds records of a fixed schema, storing every field in its own column.
+    """
+
+    SCHEMA = {"id": int, "price": float, "name": str}
+
+    def test_initializeRecordArray(self):
+        """
+        A new record array should hold empty records, with one column per field of the schema.
+        """
+        arr = RecordArray(3, self.SCHEMA)
+
+        self.assertEqual(arr.size(), 3)
+        self.assertEqual(arr.schema(), self.SCHEMA)
+        self.assertEqual(arr.getRecord(2), {"id": None, "price": None, "name": None})
+        self.assertEqual(arr.column("price").type(), float)
+
+
+    def test_initializeRecordArrayWithEmptySchema(self):
+        """
+        Attempt to create a record array without fields. A `ValueError` exception should be thrown.
+        """
+        with self.assertRaises(ValueError):
+            RecordArray(3, {})
+
+
+    def test_setAndGetRecords(self):
+        """
+        Set records positionally and by field name. Only the named fields should change.
+        """
+        arr = RecordArray(2, self.SCHEMA)
+        arr.setRecord(0, 1, 9.5, "apple")
+        arr.setRecord(0, price=8.0)
+        arr.setRecord(1, name="pear")
+
+        self.assertEqual(arr.getRecord(0), {"id": 1, "price": 8.0, "name": "apple"})
+        self.assertEqual(arr.getRecord(1), {"id": None, "price": None, "name": "pear"})
+
+
+    def test_setRecordAtIllegalIndex(self):
+        """
+        Attempt to read or write a record at an illegal index. An `IndexError` exception should be thrown.
+        """
+        arr = RecordArray(2, self.SCHEMA)
+
+        with self.assertRaises(IndexError):
+            arr.setRecord(2, 1, 1.0, "a")
+
+        with self.assertRaises(IndexError):
+            arr.getRecord(-1)
+
+
+    def test_setRecordWithInvalidFields(self):
+        """
+        Attempt to set records with unknown fields, wrong types or a wrong number of values. Nothing should be written.
+        """
+        arr = RecordArray(1, self.SCHEMA)
+
+        with self.assertRaises(KeyError):
+            arr.setRecord(0, id=1, colour="red")
+
+        with self.assertRaises(TypeError):
+            arr.setRecord(0, 1, 1, "one")
+
+        with self.assertRaises(ValueError):
+            arr.setRecord(0, 1, 1.0)
+
+        self.assertEqual(arr.getRecord(0), {"id": None, "price": None, "name": None})
+
+
+    def test_rowView(self):
+        """
+        Read and write a record through its row view. Changes should be visible in the columns.
+        """
+        arr = RecordArray.listToArray([(1, 2.0, "a"), (2, 3.0, "b")], self.SCHEMA)
+        row = arr.row(1)
+        row["price"] = 4.5
+        row.set("name", "c")
+
+        self.assertEqual((row.index(), row.get("id"), row["price"]), (1, 2, 4.5))
+        self.assertEqual(arr.column("name").toList(), ["a", "c"])
+        self.assertEqual(row.toDict(), {"id": 2, "price": 4.5, "name": "c"})
+
+        with self.assertRaises(IndexError):
+            arr.row(2)
+
+
+    def test_columnAccess(self):
+        """
+        Run bulk operations on a column. The column should be shared with the record array.
+        """
+        arr = RecordArray.listToArray([{"id": i, "price": i / 2, "name": str(i)} for i in range(4)], self.SCHEMA)
+        arr.column("id").fill(7, 2)
+
+        self.assertEqual(arr.column("price").sum(), 3.0)
+        self.assertEqual(arr.getRecord(3)["id"], 7)
+
+        with self.assertRaises(KeyError):
+            arr.column("colour")
+
+
+    def test_convertRecordsToRecordArray(self):
+        """
+        Convert a list of dicts and tuples to a record array and back. Fields of the wrong type should raise a `TypeError`.
+        """
+        records = [{"id": 1, "price": 0.5, "name": "a"}, (2, 1.5, "b")]
+        arr = RecordArray.listToArray(records, self.SCHEMA)
+
+        self.assertEqual(arr.toList(), [{"id": 1, "price": 0.5, "name": "a"}, {"id": 2, "price": 1.5, "name": "b"}])
+        self.assertEqual(RecordArray.listToArray([], self.SCHEMA).size(), 0)
+
+        with self.assertRaises(TypeError):
+            RecordArray.listToArray([(1, 2, "c")], self.SCHEMA)
+
+
+    def test_convertRecordsOfWrongLength(self):
+        """
+        Attempt to convert tuple records with fewer or more values than the schema has fields. Should raise a `ValueError` exception.
+        """
+        with self.assertRaises(ValueError):
+            RecordArray.listToArray([(1, 0.5, "a"), (2, 1.5)], self.SCHEMA)
+
+        with self.assertRaises(ValueError):
+            RecordArray.listToArray([(1, 0.5, "a", "extra")], self.SCHEMA)
+
+
+
+class TestMatrix(unittest.TestCase):
+    """
+    A matrix is an N-dimensional array whose items are kept in row-major order in a single array.
+    """
+
+    def test_initializeMatrix(self):
+        """
+        A new matrix should report its shape, strides, size and type, and hold empty slots.
+        """
+        m = Matrix((2, 3, 4), int)
+
+        self.assertEqual(m.shape(), (2, 3, 4))
+        self.assertEqual(m.strides(), (12, 4, 1))
+        self.assertEqual((m.size(), m.type(), len(m)), (24, int, 2))
+        self.assertIsNone(m.get((1, 2, 3)))
+        self.assertEqual(str(Matrix((2, 2), float)), "[[,],[,]]")
+
+
+    def test_initializeMatrixWithInvalidShape(self):
+        """
+        Attempt to create matrices with invalid shapes. A `ValueError` exception should be thrown.
+        """
+        with self.assertRaises(ValueError):
+            Matrix((), int)
+
+        with self.assertRaises(ValueError):
+            Matrix((2, -1), int)
+
+
+    def test_setAndGetItems(self):
+        """
+        Set and get items through index tuples and built-in item access.
+        """
+        m = Matrix((2, 3), str)
+        m.set((0, 2), "a")
+        m[1, 0] = "b"
+
+        self.assertEqual(m[0, 2], "a")
+        self.assertEqual(m.get((1, 0)), "b")
+        self.assertEqual(str(m), "[[,,a],[b,,]]")
+
+
+    def test_getItemAtIllegalIndex(self):
+        """
+        Attempt to access items out of range or with the wrong number of coordinates. An `IndexError` exception should be thrown.
+        """
+        m = Matrix((2, 3), int)
+
+        with self.assertRaises(IndexError):
+            m.get((0, 3))
+
+        with self.assertRaises(IndexError):
+            m.set((2, 0), 1)
+
+        with self.assertRaises(IndexError):
+            m[1]
+
+
+    def test_rowAndColumnViews(self):
+        """
+        Rows and columns should be views that write through to the matrix.
+        """
+        m = Matrix.listToMatrix([[1,2,3],[4,5,6]])
+        m.column(1)[0] = 20
+        m.row(1).set(2, 60)
+
+        self.assertEqual(m.row(0).toList(), [1,20,3])
+        self.assertEqual(m.column(2).toList(), [3,60])
+
+        with self.assertRaises(IndexError):
+            m.column(3)
+
+        with self.assertRaises(ValueError):
+            Matrix((2, 2, 2), int).row(0)
+
+
+    def test_transposeMatrix(self):
+        """
+        Transpose tall, wide and partially filled matrices.
+        """
+        tall = Matrix.listToMatrix([[1,2],[3,4],[5,6]])
+        wide = Matrix((2, 3), float)
+        wide[0, 1] = 1.5
+
+        self.assertEqual(tall.transpose().toList(), [[1,3,5],[2,4,6]])
+        self.assertEqual(tall.transpose().shape(), (2, 3))
+        self.assertEqual(wide.transpose().toList(), [[None,None],[1.5,None],[None,None]])
+
+
+    def test_multiplyMatrices(self):
+        """
+        Multiply `int` and `float` matrices. `int` products should stay exact.
+        """
+        a = Matrix.listToMatrix([[1,2,3],[4,5,6]])
+        b = Matrix.listToMatrix([[7.0,8.0],[9.0,10.0],[11.0,12.0]])
+        big = Matrix.listToMatrix([[2**62, 2**62]])
+
+        self.assertEqual((a @ b).toList(), [[58.0,64.0],[139.0,154.0]])
+        self.assertEqual(a.matmul(a.transpose()).toList(), [[14,32],[32,77]])
+        self.assertEqual((big @ big.transpose()).toList(), [[2**125]])
+
+
+    def test_multiplyMatricesWithoutNumPy(self):
+        """
+        Multiply matrices larger than a tile with the standard library alone. Results should match the NumPy path.
+        """
+        a = Matrix.listToMatrix([[float(i * j % 7) for j in range(70)] for i in range(3)])
+        b = Matrix.listToMatrix([[float(i + j) for j in range(130)] for i in range(70)])
+        expected = (a @ b).toList()
+
+        with mock.patch("matrix.numpy", None):
+            self.assertEqual((a @ b).toList(), expected)
+
+
+    def test_multiplyIncompatibleMatrices(self):
+        """
+        Attempt to multiply matrices of incompatible shapes or types, or with empty slots.
+        """
+        a = Matrix.listToMatrix([[1,2],[3,4]])
+
+        with self.assertRaises(ValueError):
+            a @ Matrix.listToMatrix([[1,2,3]])
+
+        with self.assertRaises(TypeError):
+            a @ Matrix.listToMatrix([["a"],["b"]])
+
+        with self.assertRaises(ValueError):
+            a @ Matrix((2, 2), int)
+
+
+    def test_reshapeMatrix(self):
+        """
+        Reshape a matrix. The reshaped matrix should share the original's storage.
+        """
+        m = Matrix.listToMatrix([[1,2,3],[4,5,6]])
+        flat = m.reshape(6)
+        cube = m.reshape((3, 1, 2))
+        flat[5] = 60
+
+        self.assertEqual(cube.toList(), [[[1,2]],[[3,4]],[[5,60]]])
+        self.assertEqual(m[1, 2], 60)
+
+        with self.assertRaises(ValueError):
+            m.reshape((4, 2))
+
+
+    def test_convertNestedListToMatrix(self):
+        """
+        Convert nested lists to a matrix and back. Ragged lists should raise a `ValueError`.
+        """
+        l = [[[1,2],[3,4]],[[5,6],[7,8]]]
+        m = Matrix.listToMatrix(l)
+
+        self.assertEqual(m.shape(), (2, 2, 2))
+        self.assertEqual(m.toList(), l)
+        self.assertEqual(m.toArray().toList(), [1,2,3,4,5,6,7,8])
+
+        with self.assertRaises(ValueError):
+            Matrix.listToMatrix([[1,2],[3]])
+
+class TestRingBuffer(unittest.TestCase):
+    """
+    A ring buffer is a fixed-capacity double-ended queue whose items wrap around the end of its storage.
+    """
+
+    def test_initializeRingBuffer(self):
+        """
+        A new ring buffer should be empty and report its capacity and type.
+        """
+        buffer = RingBuffer(3, float)
+
+        self.assertEqual((buffer.size(), buffer.capacity(), buffer.type()), (0, 3, float))
+        self.assertTrue(buffer.isEmpty())
+        self.assertFalse(buffer.isFull())
+
+
+    def test_initializeRingBufferWithoutCapacity(self):
+        """
+        Attempt to create a ring buffer with no capacity. A `ValueError` exception should be thrown.
+        """
+        with self.assertRaises(ValueError):
+            RingBuffer(0, int)
+
+
+    def test_pushAndPopAtBothEnds(self):
+        """
+        Push and pop items at both ends across the wrap-around of the storage.
+        """
+        buffer = RingBuffer(4, int)
+        buffer.pushBack(1)
+        buffer.pushBack(2)
+        buffer.pushFront(0)
+        buffer.pushFront(-1)
+
+        self.assertEqual(buffer.toList(), [-1,0,1,2])
+        self.assertEqual((buffer.popFront(), buffer.popBack()), (-1, 2))
+
+        buffer.pushBack(3)
+        buffer.pushBack(4)
+
+        self.assertEqual(str(buffer), "[0,1,3,4]")
+        self.assertEqual((buffer.peekFront(), buffer.peekBack(), len(buffer)), (0, 4, 4))
+
+
+    def test_pushToFullBuffer(self):
+        """
+        Attempt to push to a full buffer that does not overwrite. A `FullBufferException` should be thrown and the items kept.
+        """
+        buffer = RingBuffer(2, str)
+        buffer.pushBack("a")
+        buffer.pushBack("b")
+
+        self.assertTrue(buffer.isFull())
+
+        with self.assertRaises(FullBufferException):
+            buffer.pushBack("c")
+
+        with self.assertRaises(FullBufferException):
+            buffer.pushFront("c")
+
+        self.assertEqual(buffer.toList(), ["a","b"])
+
+
+    def test_popFromEmptyBuffer(self):
+        """
+        Attempt to pop or peek from an empty buffer. An `EmptyBufferException` should be thrown.
+        """
+        buffer = RingBuffer(2, int)
+
+        for method in (buffer.popBack, buffer.popFront, buffer.peekBack, buffer.peekFront):
+            with self.assertRaises(EmptyBufferException):
+                method()
+
+
+    def test_overwriteOldestItems(self):
+        """
+        Push to a full buffer in overwrite mode. The item at the opposite end should be dropped.
+        """
+        buffer = RingBuffer(3, int, overwrite=True)
+
+        for i in range(5):
+            buffer.pushBack(i)
+
+        self.assertEqual(buffer.toList(), [2,3,4])
+        self.assertEqual(buffer.get(0), 2)
+
+        buffer.pushFront(1)
+
+        self.assertEqual(buffer.toList(), [1,2,3])
+
+        with self.assertRaises(IndexError):
+            buffer.get(3)
+
+
+    def test_readLastItems(self):
+        """
+        Read the newest items in bulk, with and without crossing the wrap-around.
+        """
+        buffer = RingBuffer(4, float, overwrite=True)
+
+        for i in range(6):
+            buffer.pushBack(float(i))
+
+        self.assertEqual(buffer.last(2).toList(), [4.0,5.0])
+        self.assertEqual(buffer.last(3).toList(), [3.0,4.0,5.0])
+        self.assertEqual(buffer.last(4).sum(), 14.0)
+        self.assertEqual(buffer.last(0).size(), 0)
+
+        with self.assertRaises(IndexError):
+            buffer.last(5)
+
+        buffer.clear()
+
+        self.assertTrue(buffer.isEmpty())
+
+class TestChunkedArray(unittest.TestCase):
+    """
+    A chunked array grows by adding fixed-size chunks instead of copying its items.
+    """
+
+    def test_initializeChunkedArray(self):
+        """
+        A new chunked array should be empty and hold no chunks.
+        """
+        arr = ChunkedArray(int, 4)
+
+        self.assertEqual((arr.size(), arr.type(), arr.chunkCount()), (0, int, 0))
+        self.assertEqual(str(arr), "[]")
+
+        with self.assertRaises(ValueError):
+            ChunkedArray(int, 0)
+
+
+    def test_appendAcrossChunks(self):
+        """
+        Append items beyond the first chunk. Items should be readable and writable across chunks.
+        """
+        arr = ChunkedArray(int, 4)
+
+        for i in range(10):
+            arr.append(i)
+
+        arr.set(5, 50)
+
+        self.assertEqual((arr.size(), arr.chunkCount(), len(arr)), (10, 3, 10))
+        self.assertEqual((arr.get(3), arr.get(4), arr.get(5), arr.get(9)), (3, 4, 50, 9))
+
+        with self.assertRaises(TypeError):
+            arr.append("ten")
+
+
+    def test_getItemAtIllegalIndex(self):
+        """
+        Attempt to access items out of range. An `IndexError` exception should be thrown.
+        """
+        arr = ChunkedArray(str, 2)
+        arr.append("a")
+
+        with self.assertRaises(IndexError):
+            arr.get(1)
+
+        with self.assertRaises(IndexError):
+            arr.set(-1, "b")
+
+
+    def test_appendMany(self):
+        """
+        Append many items at once, filling the last chunk before adding new ones.
+        """
+        arr = ChunkedArray(float, 4)
+        arr.append(0.0)
+        arr.appendMany(float(i) for i in range(1, 11))
+
+        self.assertEqual(arr.toList(), [float(i) for i in range(11)])
+        self.assertEqual(arr.chunkCount(), 3)
+
+
+    def test_concatChunkedArrays(self):
+        """
+        Concatenate partially filled chunked arrays. Indexing should follow the spliced chunks and the operands should stay unchanged.
+        """
+        a = ChunkedArray(int, 4)
+        b = ChunkedArray(int, 4)
+        a.appendMany(range(6))
+        b.appendMany(range(10, 15))
+
+        c = a.concat(b)
+        c.set(0, -1)
+        c.append(15)
+        c.append(16)
+        c.append(17)
+
+        self.assertEqual(c.toList(), [-1,1,2,3,4,5,10,11,12,13,14,15,16,17])
+        self.assertEqual([c.get(i) for i in (5, 6, 10, 13)], [5, 10, 14, 17])
+        self.assertEqual(c.toArray().toList(), c.toList())
+        self.assertEqual(a.toList(), [0,1,2,3,4,5])
+        self.assertEqual(b.toList(), [10,11,12,13,14])
+
+
+    def test_concatIncompatibleArrays(self):
+        """
+        Attempt to concatenate arrays of different types. A `TypeError` exception should be thrown.
+        """
+        with self.assertRaises(TypeError):
+            ChunkedArray(int).concat(ChunkedArray(float))
+
+        with self.assertRaises(TypeError):
+            ChunkedArray(int).concat(Array.initDirect(1))
+
 
 
 if __name__ == "__main__":
@@ -1,3 +1,15 @@
+import operator
+import random
+
+
+# Highest number of express levels in a `PositionIndex`. With a promotion chance of 1/4 this is enough for
+# any list that fits in memory.
+_MAX_LEVELS = 32
+
+# Chance of a node reaching each next express level of a `PositionIndex`.
+_PROMOTION = 0.25
+
+
 # ==================================================================================================
 #       NODE
 # ==================================================================================================
@@ -8,15 +20,17 @@ class Node:
     the `next` node. If `next` is null, then this node is the last on the list.
     """
 
-    def __init__(self, item=None, previous=None, next=None):
+    def __init__(self, item=None, previous=None, next=None, owner=None):
         """
         Intilaize node with provided parameters:
         :param `item`: inferred type - item to be stored on the node.
         :param `previous_node`: Node - reference to the previous node.
+        :param `owner`: LinkedList - the list holding the node, `None` once the node has been removed from it.
         """
         self.next = next
         self.previous = previous
         self.item = item
+        self.owner = owner
 
         if not(previous == None):
             previous.next = self
@@ -40,6 +54,179 @@ class Node:
         
 
 
+# ==================================================================================================
+#       POSITIONAL INDEX
+# ==================================================================================================
+
+class SkipNode:
+    """
+    A tower of express links above a single list node. On every level, `next` is the following tower of at least that
+    height and `width` is the number of list positions between the two. The last tower of a level links to `None`,
+    one position past the end of the list.
+    """
+    __slots__ = ("node", "next", "width")
+
+    def __init__(self, node: Node, height: int):
+        self.node = node
+        self.next = [None] * height
+        self.width = [0] * height
+
+
+class PositionIndex:
+    """
+    Indexable skip list over the nodes of a linked list. The list itself is the bottom level, and every node
+    reaches each next express level above it with a chance of `_PROMOTION`. Since every express link knows how many
+    positions it skips, a position is found by walking down the levels and adding up widths, in expected O(log n)
+    steps. The index does not link or unlink list nodes itself; the list reports every insertion and removal.
+    """
+
+    def __init__(self, first: Node = None):
+        """
+        Build the index over the list starting at node `first`, in a single pass.
+        """
+        self.__head = SkipNode(None, 0)
+        size = 0
+
+        # Last tower of every level and its position; the head stands before the first position.
+        last = []
+        positions = []
+        node = first
+
+        while node != None:
+            # Most nodes stay on the bottom level, so the promotion draw is inlined for them.
+            if random.random() < _PROMOTION:
+                height = PositionIndex.__height(1)
+                tower = SkipNode(node, height)
+
+                while len(last) < height:
+                    self.__head.next.append(None)
+                    self.__head.width.append(0)
+                    last.append(self.__head)
+                    positions.append(-1)
+
+                for level in range(height):
+                    last[level].next[level] = tower
+                    last[level].width[level] = size - positions[level]
+                    last[level] = tower
+                    positions[level] = size
+
+            size += 1
+            node = node.next
+
+        for level in range(len(last)):
+            last[level].width[level] = size - positions[level]
+
+        self.__size = size
+
+
+    def size(self) -> int:
+        """
+        Return the number of indexed nodes.
+        """
+        return self.__size
+
+
+    def node(self, index: int, first: Node) -> Node:
+        """
+        Return the node at provided position of the list starting at node `first`.
+        """
+        tower, position = self.__descend(index)
+
+        if tower is self.__head:
+            node, position = first, 0
+        else:
+            node = tower.node
+
+        for i in range(index - position):
+            node = node.next
+
+        return node
+
+
+    def insert(self, index: int, node: Node):
+        """
+        Record that `node` has been linked into the list at provided position.
+        """
+        head = self.__head
+        height = PositionIndex.__height()
+
+        while len(head.next) < height:
+            head.next.append(None)
+            head.width.append(self.__size + 1)
+
+        new_tower = SkipNode(node, height) if height > 0 else None
+        tower, position = head, -1
+
+        # Each level is updated as soon as the descent has found the last tower before the new node on it.
+        for level in range(len(head.next) - 1, -1, -1):
+            while position + tower.width[level] < index:
+                position += tower.width[level]
+                tower = tower.next[level]
+
+            if level < height:
+                new_tower.next[level] = tower.next[level]
+                new_tower.width[level] = position + tower.width[level] + 1 - index
+                tower.next[level] = new_tower
+                tower.width[level] = index - position
+            else:
+                tower.width[level] += 1
+
+        self.__size += 1
+
+
+    def remove(self, index: int):
+        """
+        Record that the node at provided position has been unlinked from the list.
+        """
+        head = self.__head
+        tower, position = head, -1
+
+        for level in range(len(head.next) - 1, -1, -1):
+            while position + tower.width[level] < index:
+                position += tower.width[level]
+                tower = tower.next[level]
+
+            # The removed node has a tower on this level exactly when the link ends at its position.
+            if position + tower.width[level] == index:
+                removed = tower.next[level]
+                tower.width[level] += removed.width[level] - 1
+                tower.next[level] = removed.next[level]
+            else:
+                tower.width[level] -= 1
+
+        self.__size -= 1
+
+        while len(head.next) > 0 and head.next[-1] == None:
+            head.next.pop()
+            head.width.pop()
+
+
+    def __descend(self, index: int) -> tuple:
+        """
+        Return the last tower at or before provided position together with its position, `-1` being the head.
+        """
+        tower, position = self.__head, -1
+
+        for level in range(len(self.__head.next) - 1, -1, -1):
+            while position + tower.width[level] <= index:
+                position += tower.width[level]
+                tower = tower.next[level]
+
+        return tower, position
+
+
+    def __height(height: int = 0) -> int:
+        """
+        Return the number of express levels of a new tower that already reaches `height` levels.
+        """
+
+        while height < _MAX_LEVELS and random.random() < _PROMOTION:
+            height += 1
+
+        return height
+
+
+
 
 # ==================================================================================================
 #       LIST
@@ -48,51 +235,98 @@ class Node:
 class LinkedList:
     """
     Two-way (doubly) linked list consisting of an arbitrary amount of nodes, dependent on the number of elements stored. This version currently consists of the following operations:\n
-    `append(item)` - Add a new element to the end of the list.\n
-    `prepend(item)` - Add a new element to the start of the list.\n
+    `append(item)` - Add a new element to the end of the list and return its node.\n
+    `prepend(item)` - Add a new element to the start of the list and return its node.\n
     `pop()` - Removes and returns the head element from the list.\n
     `drop()` - Removes and returns the tail element from the list.\n
     `remove(item)` - Removes and returns specified item from the list.\n
     `getAt(index)` - Returns element at specified index.\n
+    `insertAt(index, item)` - Inserts a new element at specified index.\n
+    `removeAt(index)` - Removes and returns the element at specified index.\n
+    `insertBefore(node, item)`, `insertAfter(node, item)` - Inserts a new element next to provided node.\n
+    `removeNode(node)` - Removes provided node from the list and returns its element.\n
+    `moveToFront(node)`, `moveToBack(node)` - Moves provided node to the start or the end of the list.\n
+    `cursor(index)` - Returns a `Cursor` at specified index.\n
     `size()` - Returns the size of the list.\n
     `head()` - Returns the head element of the list.\n
     `tail()` - Returns the tail element of the list.\n
     `isEmpty()` - Returns `True` if the list is empty. Otherwise `False`.\n
     `equals(other_list)` - Compares this list with `other_list` and returns `True` if they are identical (order-dependent).\n
     `buildFrom(list)` - Generates a linked list from a built-in list.\n
-    `sort(order)` - Sorts the list in ascending order by default. Set `order="dec"` to order in decending order.\n
+    `sort(order, key, reverse)` - Sorts the list in ascending order by default. Set `order="dec"` to order in decending order.\n
     `clone()` - Deep copies the entire list and return the copy.\n
-    `sublist(start, end)` - Finds and returns a sublist from the `start` index to the `end` index.
+    `sublist(start, end)` - Finds and returns a sublist from the `start` index to the `end` index.\n
+    `for item in list`, `reversed(list)`, `len(list)`, `item in list` - Built-in iteration, length and membership.\n
+    Nodes returned by `append()`, `prepend()` and `insertAt()` are stable handles: they stay valid until their element is removed, and the node-level operations take constant time.\n
+    A list created with `indexed=True` keeps a `PositionIndex` over its nodes, so that `getAt()`, `insertAt()` and `removeAt()` take O(log n) instead of O(n) steps.
     """
 
     # RELATED TESTS
     #   test_initializeList()
     #   test_initialListSizeIsZero()
-    def __init__(self):
+    #   test_indexedListMatchesPlainList()
+    def __init__(self, indexed: bool = False):
         """
-        Initialize empty list with empty head and empty tail.
+        Initialize empty list with empty head and empty tail. With `indexed`, positional operations go through a `PositionIndex`.
         """
         self.__size: int = 0
         self.__head: Node = None
         self.__tail: Node = None
+        self.__indexed: bool = indexed
+        # Built by the first positional lookup and kept up to date from then on. `None` until it is needed.
+        self.__index: PositionIndex = None
 
 
     def __str__(self) -> str:
         """
         Return the string representation of the list, starting from its head.
         """
-        output = ""
+        return str.format("[{}]", ",".join(map(str, self)))
 
-        if self.__head != None:
-            this_node = self.__head
-            # output = str.format("[{}]", self.__head.__str__() if self.__head != None else "")
 
-            while this_node != None:
-                output += str.format("{}{}",this_node.item,("," if this_node.next != None else ""))
-                # print(this_node.next().get())
-                this_node = this_node.next
+    # RELATED TESTS
+    #   test_iterateList()
+    #   test_removeWhileIterating()
+    def __iter__(self):
+        """
+        Yield the elements of the list, from head to tail. The following node is looked up before an element is
+        yielded, so the node just visited may be removed during the iteration.
+        """
+        this_node = self.__head
+
+        while this_node != None:
+            next_node = this_node.next
+            yield this_node.item
+            this_node = next_node
+
+
+    # RELATED TESTS
+    #   test_iterateList()
+    def __reversed__(self):
+        """
+        Yield the elements of the list, from tail to head.
+        """
+        this_node = self.__tail
+
+        while this_node != None:
+            previous_node = this_node.previous
+            yield this_node.item
+            this_node = previous_node
+
+
+    def __len__(self) -> int:
+        return self.__size
+
+
+    # RELATED TESTS
+    #   test_iterateList()
+    def __contains__(self, item) -> bool:
+        for this_item in self:
+            if this_item == item:
+                return True
+
+        return False
 
-        return str.format("[{}]", output)
 
     # RELATED TESTS
     #   test_buildListOfTenNumbers()
@@ -100,10 +334,10 @@ class LinkedList:
     #   test_buildEmptyList()
     def buildFrom(self, l:list):
         """
-        Builds a singly linked list from the given built-in list.
+        Builds a singly linked list from the given built-in list, or any other iterable.
         """
-        for i in range(len(l)):
-            self.append(l[i])
+        for item in l:
+            self.append(item)
 
 
     # RELATED TESTS
@@ -111,41 +345,50 @@ class LinkedList:
     #   test_AppendMany()
     #   test_alternateAppendAndPrepend()
     #   test_AppendPrependPopAndDrop()
-    def append(self, item):
+    #   test_nodeHandles()
+    def append(self, item) -> Node:
         """
-        Add item to the end of the list.
+        Add item to the end of the list. Return its node, which can be used as a handle for the node-level operations.
         """
-        new_node = Node(item)
-
         if self.__head == None:
-            self.__head = self.__tail = Node(item)
+            self.__head = self.__tail = Node(item, owner=self)
 
         else:
-            self.__tail.next = Node(item, self.__tail, None)
+            self.__tail.next = Node(item, self.__tail, None, self)
             self.__tail = self.__tail.next
 
+        if self.__index != None:
+            self.__index.insert(self.__size, self.__tail)
 
         self.__size += 1
 
+        return self.__tail
+
 
     # RELATED TESTS
     #   test_prependOne()
     #   test_prependMany()
     #   test_alternateAppendAndPrepend()
     #   test_AppendPrependPopAndDrop()
-    def prepend(self, item):
+    #   test_nodeHandles()
+    def prepend(self, item) -> Node:
         """
-        Add item to the start of the list.
+        Add item to the start of the list. Return its node, which can be used as a handle for the node-level operations.
         """
         if self.__head == None:
-            self.__head = self.__tail = Node(item)
+            self.__head = self.__tail = Node(item, owner=self)
 
         else:
-            self.__head.previous = Node(item, None, self.__head)
+            self.__head.previous = Node(item, None, self.__head, self)
             self.__head = self.__head.previous
 
+        if self.__index != None:
+            self.__index.insert(0, self.__head)
+
         self.__size += 1
 
+        return self.__head
+
     # RELATED TESTS
     #   test_popOne()
     #   test_popMany()
@@ -158,12 +401,18 @@ class LinkedList:
         """
         if not(self.isEmpty()):
             pop = self.__head.item
+            self.__head.owner = None
 
             if (self.__head == self.__tail):
                 self.__head = self.__tail = None
             else:
-                self.__head = self.__head.next
+                old_head = self.__head
+                self.__head = old_head.next
                 self.__head.previous = None
+                old_head.next = None
+
+            if self.__index != None:
+                self.__index.remove(0)
         
             self.__size -= 1
         else:
@@ -184,12 +433,18 @@ class LinkedList:
         """
         if not(self.isEmpty()):
             drop = self.__tail.item
+            self.__tail.owner = None
 
             if (self.__head == self.__tail):
                 self.__head = self.__tail = None
             else:
-                self.__tail = self.__tail.previous
+                old_tail = self.__tail
+                self.__tail = old_tail.previous
                 self.__tail.next = None
+                old_tail.previous = None
+
+            if self.__index != None:
+                self.__index.remove(self.__size - 1)
         
             self.__size -= 1
         else:
@@ -203,6 +458,7 @@ class LinkedList:
     #   test_removeNonExistentItemFromTheList()
     #   test_removeElementAtValidIndex()
     #   test_removeElmentAtInvalidIndex()
+    #   test_removeHeadAndTail()
     def remove(self, item):
         """
         Remove and return the given element.
@@ -210,17 +466,16 @@ class LinkedList:
         if (not(self.isEmpty())):
             this_node = self.__head
             remove = this_node.item
+            index = 0
 
             while remove != item:
                 this_node = this_node.next
                 if this_node == None:
                     raise RuntimeError("Element does not exist within the list!")
                 remove = this_node.item
-                
-            previous_node = this_node.previous
-            next_node = this_node.next
-            previous_node.next = next_node
-            self.__size -= 1
+                index += 1
+
+            self.__unlink(this_node, index)
         else:
             raise EmptyListException()
         
@@ -234,17 +489,224 @@ class LinkedList:
     #   test_getElementAtIndexGreaterThanSize()
     #   test_removeElementAtValidIndex()
     #   test_removeElmentAtInvalidIndex()
+    #   test_indexedListMatchesPlainList()
     def getAt(self, index: int) -> Node:
         """
         Return element at provided index.
         """
         if index >= 0 and index <= self.__size - 1:
+            return self.__nodeAt(index).item
+        else:
+            raise IndexError("Index out of bounds!")
+
+
+    # RELATED TESTS
+    #   test_insertAtIndex()
+    #   test_insertAtInvalidIndex()
+    #   test_indexedListMatchesPlainList()
+    def insertAt(self, index: int, item) -> Node:
+        """
+        Insert item at provided index, moving the element there and all following elements one place back. Index equal to the size of the list appends the item. Return the node of the new element.
+        """
+        if not(0 <= index <= self.__size):
+            raise IndexError("Index out of bounds!")
+
+        if index == 0:
+            return self.prepend(item)
+
+        if index == self.__size:
+            return self.append(item)
+
+        next_node = self.__nodeAt(index)
+        new_node = Node(item, next_node.previous, next_node, self)
+
+        if self.__index != None:
+            self.__index.insert(index, new_node)
+
+        self.__size += 1
+
+        return new_node
+
+
+    # RELATED TESTS
+    #   test_removeAtIndex()
+    #   test_removeAtInvalidIndex()
+    #   test_indexedListMatchesPlainList()
+    def removeAt(self, index: int):
+        """
+        Remove and return the element at provided index.
+        """
+        if not(0 <= index < self.__size):
+            raise IndexError("Index out of bounds!")
+
+        this_node = self.__nodeAt(index)
+        self.__unlink(this_node, index)
+
+        return this_node.item
+
+
+    def __nodeAt(self, index: int) -> Node:
+        """
+        Return the node at provided valid index. Indexed lists look it up in the `PositionIndex`, building it first if needed; other lists walk from whichever end is closer.
+        """
+        if self.__indexed:
+            if self.__index == None:
+                self.__index = PositionIndex(self.__head)
+
+            return self.__index.node(index, self.__head)
+
+        if index < self.__size // 2:
             this_node = self.__head
 
             for i in range(index):
                 this_node = this_node.next
+        else:
+            this_node = self.__tail
+
+            for i in range(self.__size - 1 - index):
+                this_node = this_node.previous
+
+        return this_node
+
+
+    def __unlink(self, this_node: Node, index: int):
+        """
+        Unlink provided node, found at `index`, from the list.
+        """
+        self.__detach(this_node)
+        this_node.owner = None
+
+        if self.__index != None:
+            self.__index.remove(index)
+
+        self.__size -= 1
+
+
+    # RELATED TESTS
+    #   test_insertNextToNode()
+    #   test_cursorEdits()
+    def insertBefore(self, node: Node, item) -> Node:
+        """
+        Insert item just before provided node of this list, and return the new node. Takes constant time; the positional index of an indexed list is rebuilt on its next use.
+        """
+        self.__checkNode(node)
+
+        if node.previous == None:
+            self.prepend(item)
+            return self.__head
+
+        new_node = Node(item, node.previous, node, self)
+        self.__index = None
+        self.__size += 1
+
+        return new_node
 
-            return this_node.item
+
+    # RELATED TESTS
+    #   test_insertNextToNode()
+    #   test_cursorEdits()
+    def insertAfter(self, node: Node, item) -> Node:
+        """
+        Insert item just after provided node of this list, and return the new node. Takes constant time; the positional index of an indexed list is rebuilt on its next use.
+        """
+        self.__checkNode(node)
+
+        if node.next == None:
+            self.append(item)
+            return self.__tail
+
+        new_node = Node(item, node, node.next, self)
+        self.__index = None
+        self.__size += 1
+
+        return new_node
+
+
+    # RELATED TESTS
+    #   test_cursorEdits()
+    #   test_nodeHandles()
+    #   test_removeNodeAmongDuplicates()
+    #   test_useRemovedNode()
+    def removeNode(self, node: Node):
+        """
+        Remove provided node from this list and return its element. Takes constant time; the positional index of an indexed list is rebuilt on its next use.
+        """
+        self.__checkNode(node)
+        self.__index = None
+        self.__unlink(node, None)
+
+        return node.item
+
+
+    # RELATED TESTS
+    #   test_moveNodes()
+    #   test_useRemovedNode()
+    def moveToFront(self, node: Node):
+        """
+        Move provided node of this list to the start of the list, in constant time.
+        """
+        self.__checkNode(node)
+
+        if node != self.__head:
+            self.__index = None
+            self.__detach(node)
+            node.next = self.__head
+            self.__head.previous = node
+            self.__head = node
+
+
+    # RELATED TESTS
+    #   test_moveNodes()
+    #   test_useRemovedNode()
+    def moveToBack(self, node: Node):
+        """
+        Move provided node of this list to the end of the list, in constant time.
+        """
+        self.__checkNode(node)
+
+        if node != self.__tail:
+            self.__index = None
+            self.__detach(node)
+            node.previous = self.__tail
+            self.__tail.next = node
+            self.__tail = node
+
+
+    def __detach(self, node: Node):
+        """
+        Take provided node out of the chain of nodes, fixing the ends of the list. Size and positional index are left to the caller.
+        """
+        if node.previous == None:
+            self.__head = node.next
+        else:
+            node.previous.next = node.next
+
+        if node.next == None:
+            self.__tail = node.previous
+        else:
+            node.next.previous = node.previous
+
+        node.previous = node.next = None
+
+
+    def __checkNode(self, node: Node):
+        """
+        Raise a `ValueError` if provided node is not linked into this list. Every node records the list holding it, so removed nodes and nodes of other lists are caught in constant time.
+        """
+        if node.owner != self:
+            raise ValueError("Node is not part of this list!")
+
+
+    # RELATED TESTS
+    #   test_cursorTraversal()
+    #   test_cursorEdits()
+    #   test_cursorAtInvalidIndex()
+    def cursor(self, index: int = 0):
+        """
+        Return a `Cursor` on the node at provided index.
+        """
+        if index >= 0 and index <= self.__size - 1:
+            return Cursor(self, self.__nodeAt(index))
         else:
             raise IndexError("Index out of bounds!")
 
@@ -340,65 +802,161 @@ class LinkedList:
     #   test_sortEmptyList()
     #   test_sortSortedList()
     #   test_sortInvalidOrder()
-    def sort(self, order="asc"):
+    #   test_sortIsStable()
+    #   test_sortWithKeyAndReverse()
+    #   test_sortLongRuns()
+    #   test_sortKeepsNodeHandles()
+    #   test_sortFailureKeepsList()
+    def sort(self, order="asc", key=None, reverse=False):
         """
-        Sort the linked list using quick-sort algorithm. `sort()` will arrange list elements in ascending order by default, unless otherwise stated by `order="dec"`.\n
-        For a list of strings, all strings will be arranged by their sizes.
+        Sort the linked list using a stable, bottom-up merge sort. `sort()` will arrange list elements in ascending order by default, unless otherwise stated by `order="dec"`. `key` is applied to every element once before comparing, and `reverse=True` flips the order.\n
+        For a list of strings, all strings will be arranged by their sizes, unless a `key` is given.\n
+        Nodes are relinked rather than having their elements swapped, so node handles and cursors stay on their elements.
         """
         if order == "asc" or order == "dec":
-            self.__quickSort(order)
+            descending = (order == "dec") != reverse
+            self.__mergeSort(key if key != None else LinkedList.__defaultKey, descending)
         else:
             raise ValueError("Illegal sort order!")
 
 
-    def __quickSort(self, order: str):
-        # print("__quickSort()")
-        head = self.__head
-        tail = self.__tail
-        self.__quickSortRec(head, tail, order)
-        
+    def __defaultKey(item):
+        return len(item) if type(item) == str else item
 
-    def __quickSortRec(self, low: Node, high: Node, order: str):
-        # print("__quickSortRec()")
 
-        if high != None and low != high and low != high.next:
-            pivot = self.__partition(low, high, order)
-            self.__quickSortRec(low, pivot.previous, order)
-            self.__quickSortRec(pivot.next, high, order)
+    def __mergeSort(self, key, descending: bool):
+        """
+        Split the list into runs that are already in order, then merge neighbouring runs pass by pass until one is left.
+        """
+        if self.__size < 2:
+            return
 
+        nodes = []
+        node = self.__head
 
-    def __partition(self, low: Node, high: Node, order: str) -> Node:
-        # print("__partition()")
+        while node != None:
+            nodes.append(node)
+            node = node.next
 
-        # set pivot to the last element
-        last = len(high.item) if type(high.item) == str else high.item
+        # Keys are computed before any link is touched, so a failing `key` leaves the list as it was.
+        keys = [key(node.item) for node in nodes]
 
-        # set i to the previous node of low (similar to i = -1)
-        i = low.previous
+        # While sorting, the nodes are only linked forwards and the `previous` field of every node holds its key.
+        for node, node_key in zip(nodes, keys):
+            node.previous = node_key
 
-        j = low
+        try:
+            runs = LinkedList.__splitRuns(self.__head, operator.gt if descending else operator.lt)
 
-        while (j != high):
-            j_item = len(j.item) if type(j.item) == str else j.item
+            while len(runs) > 1:
+                merged = [LinkedList.__merge(runs[i], runs[i + 1], descending) for i in range(0, len(runs) - 1, 2)]
 
-            if (j_item <= last and order == "asc") or (j_item >= last and order == "dec"):
+                if len(runs) % 2 == 1:
+                    merged.append(runs[-1])
 
-                i = low if i == None else i.next
+                runs = merged
+        except Exception:
+            # Keys that cannot be compared stop the sort halfway, so the nodes are relinked in their original order.
+            previous_node = None
 
-                temp = i.item
-                i.item = j.item
-                j.item = temp
+            for node in nodes:
+                node.previous = previous_node
 
-            j = j.next
-            
+                if previous_node != None:
+                    previous_node.next = node
 
-        i = low if i == None else i.next
-        
-        temp = i.item
-        i.item = j.item
-        j.item = temp
-        
-        return i
+                previous_node = node
+
+            previous_node.next = None
+            raise
+
+        previous_node = None
+        node = runs[0]
+
+        while node != None:
+            node.previous = previous_node
+            previous_node = node
+            node = node.next
+
+        self.__head = runs[0]
+        self.__tail = previous_node
+        self.__index = None
+
+
+    def __splitRuns(head: Node, before) -> list:
+        """
+        Cut the forward-linked nodes starting at `head` into runs in order, and return the first node of every run. `before(a, b)` tells whether key `a` strictly belongs before key `b`. A run strictly against the order is reversed, so sorted and reversed lists both make a single run.
+        """
+        runs = []
+        node = head
+
+        while node != None:
+            next_node = node.next
+
+            if next_node != None and before(next_node.previous, node.previous):
+                reversed_run = None
+
+                while True:
+                    next_node = node.next
+                    node.next = reversed_run
+                    reversed_run = node
+
+                    if next_node == None or not(before(next_node.previous, node.previous)):
+                        break
+
+                    node = next_node
+
+                runs.append(reversed_run)
+            else:
+                runs.append(node)
+
+                while next_node != None and not(before(next_node.previous, node.previous)):
+                    node = next_node
+                    next_node = node.next
+
+                node.next = None
+
+            node = next_node
+
+        return runs
+
+
+    def __merge(a: Node, b: Node, descending: bool) -> Node:
+        """
+        Merge two forward-linked runs and return the first node of the result. On equal keys the node of run `a` goes first, which keeps the sort stable. Each order gets its own loop so that keys are compared inline.
+        """
+        if (b.previous > a.previous) if descending else (b.previous < a.previous):
+            head = tail = b
+            b = b.next
+        else:
+            head = tail = a
+            a = a.next
+
+        # The loops test for `None` by identity: `!=` would go through the rich comparison of `Node` on every step.
+        if descending:
+            while a is not None and b is not None:
+                if b.previous > a.previous:
+                    tail.next = b
+                    tail = b
+                    b = b.next
+                else:
+                    tail.next = a
+                    tail = a
+                    a = a.next
+        else:
+            while a is not None and b is not None:
+                if b.previous < a.previous:
+                    tail.next = b
+                    tail = b
+                    b = b.next
+                else:
+                    tail.next = a
+                    tail = a
+                    a = a.next
+
+        tail.next = a if a != None else b
+
+        return head
     
     # --- SORT ---------------------------------------------------------------------------------------------------------------
 
@@ -413,7 +971,7 @@ class LinkedList:
         # Worst case runtinme - linear for any list size
         head = self.__head
 
-        nl = LinkedList()   # new list
+        nl = LinkedList(self.__indexed)   # new list
         node = head
 
         while node != None:
@@ -445,12 +1003,10 @@ class LinkedList:
 
         if head != None:
             ll = LinkedList()
-            node = head
-
-            for i in range(self.__size):
-                if i >= start and i <= end:
-                    ll.append(node.item)
+            node = self.__nodeAt(start)
 
+            for i in range(start, end + 1):
+                ll.append(node.item)
                 node = node.next
 
         else:
@@ -460,6 +1016,131 @@ class LinkedList:
 
 
 
+# ==================================================================================================
+#       CURSOR
+# ==================================================================================================
+
+class Cursor:
+    """
+    Bidirectional position within a `LinkedList`, held as a reference to one of its nodes. Moving the cursor and editing the list around it take constant time, instead of walking from the head to an index. This version currently consists of the following operations:\n
+    `item()` - Returns the element under the cursor.\n
+    `next()`, `prev()` - Moves to the following or preceding node and returns its element.\n
+    `hasNext()`, `hasPrev()` - Returns `True` if there is a following or preceding node.\n
+    `insertBefore(item)`, `insertAfter(item)` - Inserts a new element just before or after the cursor, which stays in place.\n
+    `remove()` - Removes and returns the element under the cursor, moving to the following node, or the preceding one at the tail.\n
+    A cursor should not be used once its node has been removed from the list by other means.
+    """
+
+    def __init__(self, list: LinkedList, node: Node):
+        """
+        Initialize cursor on provided node of `list`.
+        """
+        self.__list = list
+        self.__node = node
+
+
+    def __str__(self) -> str:
+        return str(self.__node)
+
+
+    # RELATED TESTS
+    #   test_cursorTraversal()
+    #   test_cursorEdits()
+    def item(self):
+        """
+        Return the element under the cursor.
+        """
+        return self.__current().item
+
+
+    # RELATED TESTS
+    #   test_cursorTraversal()
+    def next(self):
+        """
+        Move to the following node and return its element.
+        """
+        if not(self.hasNext()):
+            raise IndexError("Cursor is at the tail of the list!")
+
+        self.__node = self.__node.next
+
+        return self.__node.item
+
+
+    # RELATED TESTS
+    #   test_cursorTraversal()
+    def prev(self):
+        """
+        Move to the preceding node and return its element.
+        """
+        if not(self.hasPrev()):
+            raise IndexError("Cursor is at the head of the list!")
+
+        self.__node = self.__node.previous
+
+        return self.__node.item
+
+
+    # RELATED TESTS
+    #   test_cursorTraversal()
+    def hasNext(self) -> bool:
+        """
+        Return `True` if the cursor is followed by another node.
+        """
+        return self.__current().next != None
+
+
+    # RELATED TESTS
+    #   test_cursorTraversal()
+    def hasPrev(self) -> bool:
+        """
+        Return `True` if the cursor is preceded by another node.
+        """
+        return self.__current().previous != None
+
+
+    # RELATED TESTS
+    #   test_cursorEdits()
+    def insertBefore(self, item):
+        """
+        Insert item just before the cursor.
+        """
+        self.__list.insertBefore(self.__current(), item)
+
+
+    # RELATED TESTS
+    #   test_cursorEdits()
+    def insertAfter(self, item):
+        """
+        Insert item just after the cursor.
+        """
+        self.__list.insertAfter(self.__current(), item)
+
+
+    # RELATED TESTS
+    #   test_cursorEdits()
+    #   test_removeLastItemWithCursor()
+    def remove(self):
+        """
+        Remove and return the element under the cursor. The cursor moves to the following node, or to the preceding one if the tail was removed.
+        """
+        node = self.__current()
+        self.__node = node.next if node.next != None else node.previous
+
+        return self.__list.removeNode(node)
+
+
+    def __current(self) -> Node:
+        """
+        Return the node under the cursor, or raise an `EmptyListException` if the list has been emptied through it.
+        """
+        if self.__node == None:
+            raise EmptyListException("Cursor is not on a node!")
+
+        return self.__node
+
+
+
 # ==================================================================================================
 #       Exceptions
 # ==================================================================================================
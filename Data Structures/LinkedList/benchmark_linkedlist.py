@@ -0,0 +1,192 @@
+import functools
+import random
+import sys
+import timeit
+from collections import OrderedDict
+from MyLinkedList import LinkedList
+from cache import Cache
+
+
+def bench(label: str, stmt, number: int = 1, repeat: int = 3):
+    """
+    Time `stmt` and print the best of `repeat` runs.
+    """
+    best = min(timeit.repeat(stmt, number=number, repeat=repeat))
+    print(str.format("{:<40}{:>10.3f} s", label, best))
+
+
+def benchPositionalAccess(n: int, pages: int = 100, pageSize: int = 100):
+    """
+    Reading `pages` random pages of `pageSize` items with `getAt()`, and inserting and removing in the middle, for a plain and an indexed list of size `n`.
+    """
+    print(str.format("--- Positional access (n={}, pages={}x{}) ---", n, pages, pageSize))
+    items = list(range(n))
+    starts = [random.randrange(n - pageSize) for i in range(pages)]
+
+    def build(indexed: bool) -> LinkedList:
+        ll = LinkedList(indexed)
+        ll.buildFrom(items)
+        ll.getAt(0)
+        return ll
+
+    for indexed in (False, True):
+        name = "indexed" if indexed else "plain"
+        ll = build(indexed)
+
+        def readPages():
+            getAt = ll.getAt
+            for start in starts:
+                for i in range(start, start + pageSize):
+                    getAt(i)
+
+        def editMiddle():
+            for start in starts:
+                ll.insertAt(start, -1)
+                ll.removeAt(start)
+
+        bench(str.format("{} build + first getAt()", name), lambda: build(indexed))
+        # A plain list walks up to half of its nodes per read, so its pages are timed once.
+        bench(str.format("{} getAt() pages", name), readPages, repeat=3 if indexed else 1)
+        bench(str.format("{} insertAt() + removeAt()", name), editMiddle)
+
+
+def benchIteration(n: int, loopSize: int = 10_000):
+    """
+    Full scans and edits of a list of size `n`: the iteration protocol and cursors, against index loops over the first `loopSize` items.
+    """
+    print(str.format("--- Iteration (n={}) ---", n))
+    ll = LinkedList()
+    ll.buildFrom(range(n))
+
+    def getAtLoop():
+        for i in range(loopSize):
+            ll.getAt(i)
+
+    def removeAtLoop():
+        evens = LinkedList()
+        evens.buildFrom(range(loopSize))
+        for i in range(loopSize // 2):
+            evens.removeAt(i + 1)
+
+    def cursorRemove():
+        evens = LinkedList()
+        evens.buildFrom(range(n))
+        cursor = evens.cursor()
+        while cursor.hasNext():
+            cursor.next()
+            cursor.remove()
+
+    bench(str.format("getAt() loop over {} items", loopSize), getAtLoop)
+    bench("for item in list", lambda: sum(1 for item in ll))
+    bench("str(list)", lambda: str(ll))
+    bench(str.format("removeAt() every other of {}", loopSize), removeAtLoop)
+    bench("Cursor.remove() every other", cursorRemove)
+
+
+def benchHandles(n: int, operations: int = 1000):
+    """
+    Removing `operations` random elements from a list of size `n` by value against through their node handles, and moving nodes to the front as an LRU cache does on a hit.
+    """
+    print(str.format("--- Node handles (n={}, operations={}) ---", n, operations))
+    victims = random.sample(range(n), operations)
+
+    def build():
+        ll = LinkedList()
+        return ll, [ll.append(i) for i in range(n)]
+
+    def removeByValue():
+        ll, nodes = build()
+        for victim in victims:
+            ll.remove(victim)
+
+    def removeByHandle():
+        ll, nodes = build()
+        for victim in victims:
+            ll.removeNode(nodes[victim])
+
+    def touch():
+        for victim in victims:
+            ll.moveToFront(nodes[victim])
+
+    ll, nodes = build()
+    bench("build with handles", build)
+    bench("remove() by value", removeByValue, repeat=1)
+    bench("removeNode() by handle (incl. build)", removeByHandle)
+    bench("moveToFront()", touch)
+
+
+def benchCache(n: int, capacity: int = 1000):
+    """
+    `n` cached lookups over skewed keys: `Cache` with each policy, against an LRU cache hand-written on `OrderedDict` and `functools.lru_cache`.
+    """
+    print(str.format("--- Cache (n={}, capacity={}) ---", n, capacity))
+    keys = [int(random.paretovariate(0.5)) for i in range(n)]
+
+    def cached(*args, **kwargs):
+        def run():
+            cache = Cache(*args, **kwargs)
+            for key in keys:
+                if cache.get(key) is None:
+                    cache.put(key, key)
+            return cache
+        return run
+
+    def orderedDict():
+        cache = OrderedDict()
+        for key in keys:
+            if key in cache:
+                cache.move_to_end(key)
+            else:
+                cache[key] = key
+                if len(cache) > capacity:
+                    cache.popitem(last=False)
+
+    def lruCache():
+        lookup = functools.lru_cache(maxsize=capacity)(lambda key: key)
+        for key in keys:
+            lookup(key)
+
+    for policy in ("lru", "lfu"):
+        bench(str.format("Cache({})", policy), cached(capacity, policy))
+
+    bench("Cache(ttl)", cached(capacity, "ttl", ttl=60.0))
+    bench("OrderedDict LRU", orderedDict)
+    bench("functools.lru_cache", lruCache)
+
+    stats = cached(capacity, "lru")().stats()
+    print(str.format("{:<40}{:>10.1%}", "LRU hit rate", stats["hits"] / n))
+
+
+def benchSort(n: int):
+    """
+    `sort()` of lists of size `n` holding sorted, reversed, random and duplicate-heavy integers, against `sorted()` of a built-in list.
+    """
+    print(str.format("--- Sort (n={}) ---", n))
+    inputs = {
+        "sorted": list(range(n)),
+        "reversed": list(range(n, 0, -1)),
+        "random": [random.randrange(n) for i in range(n)],
+        "duplicates": [random.randrange(10) for i in range(n)],
+    }
+
+    for name, items in inputs.items():
+        def sortList():
+            ll = LinkedList()
+            ll.buildFrom(items)
+            ll.sort()
+
+        def buildList():
+            LinkedList().buildFrom(items)
+
+        bench(str.format("build {}", name), buildList)
+        bench(str.format("build + sort() {}", name), sortList)
+        bench(str.format("sorted() {}", name), lambda: sorted(items))
+
+
+if __name__ == "__main__":
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 1_000_000
+    benchPositionalAccess(n)
+    benchIteration(n)
+    benchHandles(n)
+    benchCache(n)
+    benchSort(n)
@@ -0,0 +1,457 @@
+import functools
+import time
+from MyLinkedList import LinkedList, Node
+
+
+# ==================================================================================================
+#       EVICTION POLICIES
+# ==================================================================================================
+
+class EvictionPolicy:
+    """
+    Order in which a `Cache` gives up its keys once it is full. A policy only tracks keys; the cached values are
+    kept by the cache, which reports every event through the following methods.
+    """
+
+    def insert(self, key) -> None:
+        """
+        Start tracking a newly cached `key`.
+        """
+        pass
+
+
+    def access(self, key) -> None:
+        """
+        Record a hit on `key`.
+        """
+        pass
+
+
+    def update(self, key) -> None:
+        """
+        Record that the value of `key` has been replaced.
+        """
+        pass
+
+
+    def remove(self, key) -> None:
+        """
+        Stop tracking `key`, which has been deleted or has expired.
+        """
+        pass
+
+
+    def evict(self):
+        """
+        Stop tracking the key that should leave the cache next, and return it.
+        """
+        pass
+
+
+
+class LRUPolicy(EvictionPolicy):
+    """
+    Evict the least recently used key. Keys are kept in a linked list from the least to the most recently used one,
+    and every hit moves a key to the back through its node handle, in constant time.
+    """
+
+    def __init__(self):
+        self.__order = LinkedList()
+        self.__nodes = {}
+
+
+    def insert(self, key) -> None:
+        self.__nodes[key] = self.__order.append(key)
+
+
+    def access(self, key) -> None:
+        self.__order.moveToBack(self.__nodes[key])
+
+
+    def update(self, key) -> None:
+        self.access(key)
+
+
+    def remove(self, key) -> None:
+        self.__order.removeNode(self.__nodes.pop(key))
+
+
+    def evict(self):
+        key = self.__order.pop()
+        del self.__nodes[key]
+
+        return key
+
+
+
+class FrequencyBucket:
+    """
+    Keys of an `LFUPolicy` that have been used `frequency` times, from the least to the most recently used one.
+    """
+
+    def __init__(self, frequency: int):
+        self.frequency = frequency
+        self.keys = LinkedList()
+
+
+
+class LFUPolicy(EvictionPolicy):
+    """
+    Evict the least frequently used key, and the least recently used one among equally used keys. Keys are grouped
+    into `FrequencyBucket`s, themselves kept in a linked list of increasing frequencies, so that a hit moves a key
+    to the next bucket and an eviction takes a key from the first bucket, both in constant time.
+    """
+
+    def __init__(self):
+        self.__buckets = LinkedList()
+        # Node of the bucket of lowest frequency, `None` while no key is tracked.
+        self.__first: Node = None
+        # Every key maps to the node of its bucket and to its own node within that bucket.
+        self.__nodes = {}
+
+
+    def insert(self, key) -> None:
+        if self.__first == None or self.__first.item.frequency != 1:
+            self.__first = self.__buckets.prepend(FrequencyBucket(1))
+
+        self.__nodes[key] = (self.__first, self.__first.item.keys.append(key))
+
+
+    def access(self, key) -> None:
+        bucket_node, key_node = self.__nodes[key]
+        frequency = bucket_node.item.frequency + 1
+        next_node = bucket_node.next
+
+        # A key alone in its bucket takes the bucket along, unless the next bucket already has its new frequency.
+        if bucket_node.item.keys.size() == 1 and (next_node == None or next_node.item.frequency != frequency):
+            bucket_node.item.frequency = frequency
+            return
+
+        if next_node == None or next_node.item.frequency != frequency:
+            next_node = self.__buckets.insertAfter(bucket_node, FrequencyBucket(frequency))
+
+        self.__nodes[key] = (next_node, next_node.item.keys.append(key))
+        self.__removeFromBucket(bucket_node, key_node)
+
+
+    def update(self, key) -> None:
+        self.access(key)
+
+
+    def remove(self, key) -> None:
+        self.__removeFromBucket(*self.__nodes.pop(key))
+
+
+    def evict(self):
+        bucket_node = self.__first
+        key = bucket_node.item.keys.head()
+        self.__removeFromBucket(*self.__nodes.pop(key))
+
+        return key
+
+
+    def __removeFromBucket(self, bucket_node: Node, key_node: Node):
+        """
+        Remove a key from its bucket, and the bucket itself once it is empty.
+        """
+        bucket_node.item.keys.removeNode(key_node)
+
+        if bucket_node.item.keys.isEmpty():
+            if bucket_node == self.__first:
+                self.__first = bucket_node.next
+
+            self.__buckets.removeNode(bucket_node)
+
+
+
+class TTLPolicy(EvictionPolicy):
+    """
+    Evict the key written longest ago. Since every entry of a cache lives for the same `ttl`, that is the entry
+    closest to expiry. Hits do not change the order, but replacing a value moves its key to the back.
+    """
+
+    def __init__(self):
+        self.__order = LinkedList()
+        self.__nodes = {}
+
+
+    def insert(self, key) -> None:
+        self.__nodes[key] = self.__order.append(key)
+
+
+    def update(self, key) -> None:
+        self.__order.moveToBack(self.__nodes[key])
+
+
+    def remove(self, key) -> None:
+        self.__order.removeNode(self.__nodes.pop(key))
+
+
+    def evict(self):
+        key = self.__order.pop()
+        del self.__nodes[key]
+
+        return key
+
+
+
+_POLICIES = {"lru": LRUPolicy, "lfu": LFUPolicy, "ttl": TTLPolicy}
+
+# Marks a missing entry, so that a cached `None` is still a hit.
+_MISSING = object()
+
+
+
+# ==================================================================================================
+#       CACHE
+# ==================================================================================================
+
+class Cache:
+    """
+    Bounded key to value cache. Values are kept in a dict, while the order in which keys are given up is kept by an
+    `EvictionPolicy` on top of linked lists. This version currently consists of the following operations:\n
+    `get(key, default)` - Returns the value cached for `key`, or `default` on a miss.\n
+    `put(key, value)` - Caches a value, evicting a key first if the cache is full.\n
+    `delete(key)` - Removes a key from the cache. Returns `True` if it was cached.\n
+    `clear()` - Removes every key and resets the statistics.\n
+    `size()` - Returns the number of cached keys.\n
+    `capacity()` - Returns the maximum number of cached keys.\n
+    `stats()` - Returns the number of hits, misses, evictions and expirations.\n
+    `key in cache`, `len(cache)` - Built-in membership and length.
+    """
+
+    # RELATED TESTS
+    #   test_initializeCache()
+    #   test_initializeCacheWithInvalidArguments()
+    def __init__(self, capacity: int, policy="lru", ttl: float = None, clock=time.monotonic):
+        """
+        Initialize an empty cache of up to `capacity` keys. `policy` is either an `EvictionPolicy` or one of
+        `"lru"`, `"lfu"` and `"ttl"`. With `ttl`, entries expire `ttl` seconds of `clock` after they were written.
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1!")
+
+        if ttl != None and ttl <= 0:
+            raise ValueError("Time to live must be positive!")
+
+        if type(policy) == str:
+            if policy not in _POLICIES:
+                raise ValueError(str.format("Unknown eviction policy '{}'!", policy))
+
+            if policy == "ttl" and ttl == None:
+                raise ValueError("The ttl policy requires a time to live!")
+
+            policy = _POLICIES[policy]()
+
+        self.__capacity = capacity
+        self.__policy: EvictionPolicy = policy
+        self.__ttl = ttl
+        self.__clock = clock
+        self.__entries = {}
+        # With a `ttl`, keys in the order they were written, which is also the order in which they expire.
+        self.__writes = LinkedList()
+        self.__writeNodes = {}
+        self.__deadlines = {}
+        self.__resetStats()
+
+
+    def __str__(self) -> str:
+        return str(self.__entries)
+
+
+    def __len__(self) -> int:
+        self.__expire()
+
+        return len(self.__entries)
+
+
+    def __contains__(self, key) -> bool:
+        self.__expire()
+
+        return key in self.__entries
+
+
+    # RELATED TESTS
+    #   test_getAndPut()
+    #   test_evictLeastRecentlyUsed()
+    #   test_expireEntries()
+    def get(self, key, default=None):
+        """
+        Return the value cached for `key` and record a hit, or return `default` and record a miss.
+        """
+        self.__expire()
+        value = self.__entries.get(key, _MISSING)
+
+        if value is _MISSING:
+            self.__misses += 1
+            return default
+
+        self.__hits += 1
+        self.__policy.access(key)
+
+        return value
+
+
+    # RELATED TESTS
+    #   test_getAndPut()
+    #   test_evictLeastRecentlyUsed()
+    #   test_evictLeastFrequentlyUsed()
+    def put(self, key, value):
+        """
+        Cache `value` for `key`. If the cache is full, the key chosen by the eviction policy is removed first.
+        """
+        self.__expire()
+
+        if key in self.__entries:
+            self.__entries[key] = value
+            self.__policy.update(key)
+
+            if self.__ttl != None:
+                self.__deadlines[key] = self.__clock() + self.__ttl
+                self.__writes.moveToBack(self.__writeNodes[key])
+
+            return
+
+        if len(self.__entries) >= self.__capacity:
+            self.__discard(self.__policy.evict())
+            self.__evictions += 1
+
+        self.__entries[key] = value
+        self.__policy.insert(key)
+
+        if self.__ttl != None:
+            self.__deadlines[key] = self.__clock() + self.__ttl
+            self.__writeNodes[key] = self.__writes.append(key)
+
+
+    # RELATED TESTS
+    #   test_deleteKey()
+    #   test_countExpiredEntries()
+    def delete(self, key) -> bool:
+        """
+        Remove `key` from the cache. Return `True` if it was cached. Otherwise, return `False`.
+        """
+        self.__expire()
+
+        if key not in self.__entries:
+            return False
+
+        self.__policy.remove(key)
+        self.__discard(key)
+
+        return True
+
+
+    # RELATED TESTS
+    #   test_deleteKey()
+    def clear(self):
+        """
+        Remove every key from the cache and reset the statistics.
+        """
+        for key in list(self.__entries):
+            self.delete(key)
+
+        self.__resetStats()
+
+
+    # RELATED TESTS
+    #   test_countExpiredEntries()
+    def size(self) -> int:
+        """
+        Return the number of cached keys.
+        """
+        self.__expire()
+
+        return len(self.__entries)
+
+
+    def capacity(self) -> int:
+        """
+        Return the maximum number of cached keys.
+        """
+        return self.__capacity
+
+
+    # RELATED TESTS
+    #   test_getAndPut()
+    #   test_evictLeastRecentlyUsed()
+    #   test_expireEntries()
+    def stats(self) -> dict:
+        """
+        Return the number of hits, misses, evictions and expirations since the cache was created or cleared.
+        """
+        return {
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "evictions": self.__evictions,
+            "expirations": self.__expirations,
+        }
+
+
+    def __discard(self, key):
+        """
+        Remove the value and the expiry of a key the policy no longer tracks.
+        """
+        del self.__entries[key]
+
+        if self.__ttl != None:
+            del self.__deadlines[key]
+            self.__writes.removeNode(self.__writeNodes.pop(key))
+
+
+    def __expire(self):
+        """
+        Remove every entry whose time to live has passed. Entries expire in the order they were written, so only the
+        expired ones at the front of the write order are visited.
+        """
+        if self.__ttl == None or self.__writes.isEmpty():
+            return
+
+        now = self.__clock()
+
+        while not(self.__writes.isEmpty()) and self.__deadlines[self.__writes.head()] <= now:
+            key = self.__writes.head()
+            self.__policy.remove(key)
+            self.__discard(key)
+            self.__expirations += 1
+
+
+    def __resetStats(self):
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__expirations = 0
+
+
+
+# ==================================================================================================
+#       MEMOIZE
+# ==================================================================================================
+
+# RELATED TESTS
+#   test_memoize()
+#   test_memoizeWithExpiry()
+def memoize(capacity: int = 128, policy="lru", ttl: float = None, clock=time.monotonic):
+    """
+    Decorator caching the results of a function in a `Cache`, keyed by its positional and keyword arguments, which
+    must be hashable. The cache is available as the `cache` attribute of the decorated function.
+    """
+    def decorator(function):
+        cache = Cache(capacity, policy, ttl, clock)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            result = cache.get(key, _MISSING)
+
+            if result is _MISSING:
+                result = function(*args, **kwargs)
+                cache.put(key, result)
+
+            return result
+
+        wrapper.cache = cache
+
+        return wrapper
+
+    return decorator
@@ -1,3 +1,4 @@
+import random
 import unittest
 from MyLinkedList import *
 
@@ -439,6 +440,358 @@ class TestLinkedList(unittest.TestCase):
             ll.remove(ll.getAt(7))
 
 
+    def test_removeHeadAndTail(self):
+        """
+        Attempt to remove the items at the head and the tail of the list. Both ends should move and stay linked.
+        """
+        self.ll.buildFrom([1,2,3,4,5])
+
+        self.assertEqual(self.ll.remove(1), 1)
+        self.assertEqual(self.ll.remove(5), 5)
+
+        TestLinkedList.__listSate(self, 3, "[2,3,4]")
+        self.assertEqual(self.ll.head(), 2)
+        self.assertEqual(self.ll.tail(), 4)
+        self.assertEqual(self.ll.drop(), 4)
+        self.assertEqual(self.ll.pop(), 2)
+        TestLinkedList.__listSate(self, 1, "[3]")
+
+
+    def test_insertAtIndex(self):
+        """
+        Attempt to insert items at the start, the middle and the end of the list.
+        """
+        self.ll.buildFrom([2,3,5])
+
+        self.ll.insertAt(0, 1)
+        self.ll.insertAt(3, 4)
+        self.ll.insertAt(5, 6)
+
+        TestLinkedList.__listSate(self, 6, "[1,2,3,4,5,6]")
+        self.assertEqual(self.ll.head(), 1)
+        self.assertEqual(self.ll.tail(), 6)
+
+
+    def test_insertAtInvalidIndex(self):
+        """
+        Attempt to insert an item below zero or past the size of the list. Should raise an `IndexError` exception.
+        """
+        self.ll.buildFrom([1,2,3])
+
+        with self.assertRaises(IndexError):
+            self.ll.insertAt(-1, 0)
+
+        with self.assertRaises(IndexError):
+            self.ll.insertAt(4, 0)
+
+
+    def test_removeAtIndex(self):
+        """
+        Attempt to remove items at the start, the middle and the end of the list. The removed items should be returned.
+        """
+        self.ll.buildFrom([1,2,3,4,5,6])
+
+        self.assertEqual(self.ll.removeAt(5), 6)
+        self.assertEqual(self.ll.removeAt(2), 3)
+        self.assertEqual(self.ll.removeAt(0), 1)
+
+        TestLinkedList.__listSate(self, 3, "[2,4,5]")
+        self.assertEqual(self.ll.head(), 2)
+        self.assertEqual(self.ll.tail(), 5)
+
+
+    def test_removeAtInvalidIndex(self):
+        """
+        Attempt to remove an item at an index out of the list range. Should raise an `IndexError` exception.
+        """
+        with self.assertRaises(IndexError):
+            self.ll.removeAt(0)
+
+        self.ll.buildFrom([1,2,3])
+
+        with self.assertRaises(IndexError):
+            self.ll.removeAt(3)
+
+
+    def test_indexedListMatchesPlainList(self):
+        """
+        Apply the same random positional operations to an indexed linked list, a plain one and a built-in list. Every element should be found at the same index in all three.
+        """
+        rng = random.Random(7)
+        indexed = LinkedList(indexed=True)
+        indexed.buildFrom(list(range(200)))
+        plain = self.ll
+        plain.buildFrom(list(range(200)))
+        expected = list(range(200))
+
+        for i in range(2000):
+            operation = rng.randrange(7)
+            item = 1000 + i
+
+            if operation == 0:
+                index = rng.randint(0, len(expected))
+                expected.insert(index, item)
+                indexed.insertAt(index, item)
+                plain.insertAt(index, item)
+            elif operation == 1 and len(expected) > 0:
+                index = rng.randrange(len(expected))
+                self.assertEqual(indexed.removeAt(index), expected.pop(index))
+                plain.removeAt(index)
+            elif operation == 2:
+                expected.append(item)
+                indexed.append(item)
+                plain.append(item)
+            elif operation == 3:
+                expected.insert(0, item)
+                indexed.prepend(item)
+                plain.prepend(item)
+            elif operation == 4 and len(expected) > 0:
+                self.assertEqual(indexed.pop(), expected.pop(0))
+                plain.pop()
+            elif operation == 5 and len(expected) > 0:
+                self.assertEqual(indexed.drop(), expected.pop())
+                plain.drop()
+            elif operation == 6 and len(expected) > 0:
+                value = rng.choice(expected)
+                expected.remove(value)
+                self.assertEqual(indexed.remove(value), value)
+                plain.remove(value)
+
+            if len(expected) > 0:
+                index = rng.randrange(len(expected))
+                self.assertEqual(indexed.getAt(index), expected[index])
+                self.assertEqual(plain.getAt(index), expected[index])
+
+        self.assertEqual(indexed.size(), len(expected))
+        self.assertEqual(str(indexed), str(plain))
+        self.assertEqual([indexed.getAt(i) for i in range(len(expected))], expected)
+
+
+    def test_iterateList(self):
+        """
+        Iterate over the list forwards and backwards, and check its length and membership. Should follow the order of the list.
+        """
+        self.ll.buildFrom([4,8,15,16,23,42])
+
+        self.assertEqual(list(self.ll), [4,8,15,16,23,42])
+        self.assertEqual(list(reversed(self.ll)), [42,23,16,15,8,4])
+        self.assertEqual(len(self.ll), 6)
+        self.assertIn(15, self.ll)
+        self.assertNotIn(7, self.ll)
+        self.assertEqual(list(LinkedList()), [])
+
+
+    def test_removeWhileIterating(self):
+        """
+        Remove every visited element with a cursor while iterating over the list. Iteration should still reach every element.
+        """
+        self.ll.buildFrom([1,2,3,4])
+        cursor = self.ll.cursor()
+        visited = []
+
+        for item in self.ll:
+            visited.append(item)
+            cursor.remove()
+
+        self.assertEqual(visited, [1,2,3,4])
+        TestLinkedList.__listSate(self, 0, "[]")
+
+
+    def test_insertNextToNode(self):
+        """
+        Insert elements with cursors at both ends and in the middle of an indexed list. The head, the tail and positional lookups should follow.
+        """
+        ll = LinkedList(indexed=True)
+        ll.buildFrom([2,4])
+        self.assertEqual(ll.getAt(1), 4)
+
+        ll.cursor(0).insertBefore(1)
+        ll.cursor(2).insertAfter(5)
+        ll.cursor(2).insertBefore(3)
+
+        self.assertEqual(str(ll), "[1,2,3,4,5]")
+        self.assertEqual(ll.head(), 1)
+        self.assertEqual(ll.tail(), 5)
+        self.assertEqual([ll.getAt(i) for i in range(5)], [1,2,3,4,5])
+
+
+    def test_cursorTraversal(self):
+        """
+        Move a cursor along the list in both directions. Moving past either end should raise an `IndexError` exception.
+        """
+        self.ll.buildFrom(['a','b','c'])
+        cursor = self.ll.cursor()
+
+        self.assertEqual(cursor.item(), 'a')
+        self.assertFalse(cursor.hasPrev())
+        self.assertEqual(cursor.next(), 'b')
+        self.assertEqual(cursor.next(), 'c')
+        self.assertFalse(cursor.hasNext())
+
+        with self.assertRaises(IndexError):
+            cursor.next()
+
+        self.assertEqual(cursor.prev(), 'b')
+        self.assertTrue(cursor.hasPrev())
+        self.assertEqual(self.ll.cursor(2).item(), 'c')
+
+
+    def test_cursorAtInvalidIndex(self):
+        """
+        Attempt to place a cursor outside of the list. Should raise an `IndexError` exception.
+        """
+        with self.assertRaises(IndexError):
+            self.ll.cursor()
+
+        self.ll.buildFrom([1,2,3])
+
+        with self.assertRaises(IndexError):
+            self.ll.cursor(3)
+
+
+    def test_cursorEdits(self):
+        """
+        Insert and remove elements around a cursor. The cursor should stay on its node and the ends of the list should follow.
+        """
+        self.ll.buildFrom([1,3,5])
+        cursor = self.ll.cursor(1)
+
+        cursor.insertBefore(2)
+        cursor.insertAfter(4)
+        TestLinkedList.__listSate(self, 5, "[1,2,3,4,5]")
+        self.assertEqual(cursor.item(), 3)
+
+        self.assertEqual(cursor.remove(), 3)
+        self.assertEqual(cursor.item(), 4)
+        TestLinkedList.__listSate(self, 4, "[1,2,4,5]")
+
+        cursor.next()
+        cursor.insertAfter(6)
+        self.assertEqual(self.ll.tail(), 6)
+        self.assertEqual(self.ll.getAt(4), 6)
+
+        cursor = self.ll.cursor()
+        cursor.insertBefore(0)
+        self.assertEqual(cursor.remove(), 1)
+        self.assertEqual(self.ll.head(), 0)
+        TestLinkedList.__listSate(self, 5, "[0,2,4,5,6]")
+
+
+    def test_removeLastItemWithCursor(self):
+        """
+        Remove every element through a single cursor, starting from the tail. Using the cursor afterwards should raise an `EmptyListException`.
+        """
+        self.ll.buildFrom([1,2,3])
+        cursor = self.ll.cursor(2)
+
+        self.assertEqual([cursor.remove() for i in range(3)], [3,2,1])
+        TestLinkedList.__listSate(self, 0, "[]")
+        self.assertIsNone(self.ll.head())
+        self.assertIsNone(self.ll.tail())
+
+        with self.assertRaises(EmptyListException):
+            cursor.item()
+
+
+    def test_nodeHandles(self):
+        """
+        Keep the nodes returned by `append()`, `prepend()` and `insertAt()` and remove elements through them. The list should stay linked at both ends.
+        """
+        middle = self.ll.append(2)
+        tail = self.ll.append(3)
+        head = self.ll.prepend(1)
+        inserted = self.ll.insertAt(2, 2.5)
+
+        self.assertEqual(str(self.ll), "[1,2,2.5,3]")
+        self.assertEqual(self.ll.removeNode(inserted), 2.5)
+        self.assertEqual(self.ll.removeNode(tail), 3)
+        self.assertEqual(self.ll.removeNode(head), 1)
+
+        TestLinkedList.__listSate(self, 1, "[2]")
+        self.assertEqual(self.ll.head(), 2)
+        self.assertEqual(self.ll.tail(), 2)
+        self.assertEqual(self.ll.removeNode(middle), 2)
+        TestLinkedList.__listSate(self, 0, "[]")
+
+
+    def test_removeNodeAmongDuplicates(self):
+        """
+        Remove the second of three equal elements through its node. Unlike `remove()`, the first match should stay.
+        """
+        first = self.ll.append('x')
+        second = self.ll.append('x')
+        self.ll.append('x')
+        self.ll.append('y')
+
+        self.ll.removeNode(second)
+
+        TestLinkedList.__listSate(self, 3, "[x,x,y]")
+        self.assertEqual(self.ll.cursor(0).item(), first.item)
+        self.ll.removeNode(first)
+        TestLinkedList.__listSate(self, 2, "[x,y]")
+
+
+    def test_moveNodes(self):
+        """
+        Move nodes from the middle and both ends of an indexed list to its front and back. The order, the ends and positional lookups should follow.
+        """
+        ll = LinkedList(indexed=True)
+        nodes = [ll.append(i) for i in range(5)]
+        self.assertEqual(ll.getAt(4), 4)
+
+        ll.moveToFront(nodes[2])
+        self.assertEqual(str(ll), "[2,0,1,3,4]")
+        ll.moveToBack(nodes[0])
+        self.assertEqual(str(ll), "[2,1,3,4,0]")
+        ll.moveToFront(nodes[0])
+        ll.moveToBack(nodes[2])
+        ll.moveToFront(nodes[0])
+
+        self.assertEqual(str(ll), "[0,1,3,4,2]")
+        self.assertEqual(list(reversed(ll)), [2,4,3,1,0])
+        self.assertEqual(ll.head(), 0)
+        self.assertEqual(ll.tail(), 2)
+        self.assertEqual([ll.getAt(i) for i in range(5)], [0,1,3,4,2])
+
+
+    def test_useRemovedNode(self):
+        """
+        Attempt to use a node after its element has been removed from the list, or a node of another list. Should raise a `ValueError` exception and leave both lists intact.
+        """
+        node = self.ll.append(1)
+        popped = self.ll.append(2)
+        self.ll.append(3)
+        other = LinkedList()
+        foreign = other.append(4)
+        middle = other.append(5)
+        other.append(6)
+
+        self.ll.removeNode(node)
+        self.ll.pop()
+
+        for operation in (self.ll.removeNode, self.ll.moveToFront, self.ll.moveToBack):
+            with self.assertRaises(ValueError):
+                operation(node)
+
+            with self.assertRaises(ValueError):
+                operation(popped)
+
+        for operation in (self.ll.removeNode, self.ll.moveToFront, self.ll.moveToBack):
+            with self.assertRaises(ValueError):
+                operation(foreign)
+
+            with self.assertRaises(ValueError):
+                operation(middle)
+
+        with self.assertRaises(ValueError):
+            self.ll.insertAfter(middle, 7)
+
+        TestLinkedList.__listSate(self, 1, "[3]")
+        self.assertEqual(str(other), "[4,5,6]")
+        self.assertEqual(other.size(), 3)
+        self.assertEqual(other.removeNode(middle), 5)
+
+
     def test_unpopulatedListIsEmpty(self):
         """
         Check if an unpopulated list is empty. Should be empty.
@@ -544,6 +897,106 @@ class TestLinkedList(unittest.TestCase):
             self.ll.sort("MyOrder")
 
 
+    def test_sortIsStable(self):
+        """
+        Sort records by one of their fields in both orders. Records with equal fields should keep their original order.
+        """
+        records = [(3,'a'),(1,'b'),(3,'c'),(2,'d'),(1,'e'),(3,'f')]
+        self.ll.buildFrom(records)
+
+        self.ll.sort(key=lambda record: record[0])
+        self.assertEqual(list(self.ll), sorted(records, key=lambda record: record[0]))
+
+        self.ll.sort("dec", key=lambda record: record[0])
+        self.assertEqual(list(self.ll), [(3,'a'),(3,'c'),(3,'f'),(2,'d'),(1,'b'),(1,'e')])
+        self.assertEqual(list(reversed(self.ll)), [(1,'e'),(1,'b'),(2,'d'),(3,'f'),(3,'c'),(3,'a')])
+
+
+    def test_sortWithKeyAndReverse(self):
+        """
+        Sort strings by their sizes, by a key, and in reverse. `reverse=True` should flip the order given by `order`.
+        """
+        self.ll.buildFrom(["ccc","a","BB","dddd"])
+
+        self.ll.sort()
+        self.assertEqual(str(self.ll), "[a,BB,ccc,dddd]")
+
+        self.ll.sort(key=str.lower)
+        self.assertEqual(str(self.ll), "[a,BB,ccc,dddd]")
+
+        self.ll.sort(key=str.lower, reverse=True)
+        self.assertEqual(str(self.ll), "[dddd,ccc,BB,a]")
+
+        self.ll.sort("dec", reverse=True)
+        self.assertEqual(str(self.ll), "[a,BB,ccc,dddd]")
+        self.assertEqual(self.ll.head(), "a")
+        self.assertEqual(self.ll.tail(), "dddd")
+
+
+    def test_sortLongRuns(self):
+        """
+        Sort long sorted, reversed, random and duplicate-heavy lists. Should match the built-in `sorted()` without hitting the recursion limit.
+        """
+        rng = random.Random(11)
+        n = 20000
+        inputs = [
+            list(range(n)),
+            list(range(n, 0, -1)),
+            [rng.randrange(n) for i in range(n)],
+            [rng.randrange(5) for i in range(n)],
+        ]
+
+        for items in inputs:
+            for order in ("asc", "dec"):
+                ll = LinkedList(indexed=True)
+                ll.buildFrom(items)
+                ll.getAt(0)
+                ll.sort(order)
+                expected = sorted(items, reverse=order == "dec")
+
+                self.assertEqual(list(ll), expected)
+                self.assertEqual(list(reversed(ll)), expected[::-1])
+                self.assertEqual(ll.size(), n)
+                self.assertEqual(ll.getAt(n // 2), expected[n // 2])
+
+
+    def test_sortKeepsNodeHandles(self):
+        """
+        Sort a list while holding node handles. Each handle should still hold its element and be usable afterwards.
+        """
+        nodes = [self.ll.append(i) for i in [5,1,4,2,3]]
+        self.ll.sort()
+
+        self.assertEqual([node.item for node in nodes], [5,1,4,2,3])
+
+        self.ll.removeNode(nodes[2])
+        self.ll.moveToFront(nodes[0])
+        TestLinkedList.__listSate(self, 4, "[5,1,2,3]")
+
+
+    def test_sortFailureKeepsList(self):
+        """
+        Sort a list whose elements cannot be compared, and one whose key fails. Both sorts should raise, leaving the list in its original order and usable.
+        """
+        self.ll.buildFrom([3,1,None,2,5])
+
+        with self.assertRaises(TypeError):
+            self.ll.sort()
+
+        TestLinkedList.__listSate(self, 5, "[3,1,None,2,5]")
+        self.assertEqual(list(reversed(self.ll)), [5,2,None,1,3])
+
+        with self.assertRaises(TypeError):
+            self.ll.sort(key=lambda item: item + 1)
+
+        TestLinkedList.__listSate(self, 5, "[3,1,None,2,5]")
+
+        self.ll.append(4)
+        self.ll.sort(key=lambda item: -1 if item == None else item)
+        TestLinkedList.__listSate(self, 6, "[None,1,2,3,4,5]")
+        self.assertEqual(self.ll.tail(), 5)
+
+
     def test_clonePrepopulatedList(self):
         """
         Create a replica object of a populated list. Lists should be different objects, but should be comparable and should be the same.
@@ -0,0 +1,331 @@
+import random
+import unittest
+from cache import *
+
+
+class FakeClock:
+    """
+    Clock that only moves when told to, so that expiry can be tested without sleeping.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+
+    def __call__(self) -> float:
+        return self.now
+
+
+
+class TestCache(unittest.TestCase):
+
+    def test_initializeCache(self):
+        """
+        Initialize a new cache. Result should be an empty `Cache` with provided capacity.
+        """
+        cache = Cache(3)
+
+        self.assertEqual(type(cache), Cache)
+        self.assertEqual(cache.size(), 0)
+        self.assertEqual(cache.capacity(), 3)
+        self.assertEqual(cache.stats(), {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0})
+
+
+    def test_initializeCacheWithInvalidArguments(self):
+        """
+        Attempt to initialize a cache without capacity, with an unknown policy, a non-positive time to live, or the ttl policy without a time to live. Should raise a `ValueError` exception.
+        """
+        with self.assertRaises(ValueError):
+            Cache(0)
+
+        with self.assertRaises(ValueError):
+            Cache(3, "mru")
+
+        with self.assertRaises(ValueError):
+            Cache(3, ttl=0)
+
+        with self.assertRaises(ValueError):
+            Cache(3, "ttl")
+
+
+    def test_getAndPut(self):
+        """
+        Cache a few values, including `None`, and read them back. Hits and misses should be counted.
+        """
+        cache = Cache(3)
+        cache.put('a', 1)
+        cache.put('b', None)
+
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b', 'default'))
+        self.assertEqual(cache.get('c', 'default'), 'default')
+        self.assertIn('a', cache)
+        self.assertNotIn('c', cache)
+        self.assertEqual(len(cache), 2)
+
+        cache.put('a', 2)
+
+        self.assertEqual(cache.get('a'), 2)
+        self.assertEqual(cache.stats(), {"hits": 3, "misses": 1, "evictions": 0, "expirations": 0})
+
+
+    def test_evictLeastRecentlyUsed(self):
+        """
+        Overfill an LRU cache. The key used longest ago should be evicted, and reads as well as writes should count as uses.
+        """
+        cache = Cache(3, "lru")
+
+        for key in "abc":
+            cache.put(key, key)
+
+        cache.get('a')
+        cache.put('b', 'B')
+        cache.put('d', 'd')
+
+        self.assertNotIn('c', cache)
+
+        cache.put('e', 'e')
+
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.get('b'), 'B')
+        self.assertEqual(cache.size(), 3)
+        self.assertEqual(cache.stats()["evictions"], 2)
+
+
+    def test_evictLeastFrequentlyUsed(self):
+        """
+        Overfill an LFU cache. The key used the fewest times should be evicted, the least recently used one among ties.
+        """
+        cache = Cache(3, "lfu")
+
+        for key in "abc":
+            cache.put(key, key)
+
+        for i in range(3):
+            cache.get('a')
+
+        cache.get('b')
+        cache.get('c')
+        cache.put('d', 'd')
+
+        self.assertNotIn('b', cache)
+
+        cache.put('e', 'e')
+
+        self.assertNotIn('d', cache)
+        self.assertEqual(sorted(key for key in "abcde" if key in cache), ['a', 'c', 'e'])
+
+
+    def test_evictOldestWrite(self):
+        """
+        Overfill a cache with the ttl policy. The key written longest ago should be evicted, regardless of reads.
+        """
+        cache = Cache(2, "ttl", ttl=60, clock=FakeClock())
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        self.assertNotIn('a', cache)
+
+        cache.put('b', 4)
+        cache.put('d', 5)
+
+        self.assertNotIn('c', cache)
+        self.assertEqual(cache.get('b'), 4)
+
+
+    def test_expireEntries(self):
+        """
+        Let entries of a cache outlive their time to live. They should be gone and counted as expired, while rewritten entries should live on.
+        """
+        clock = FakeClock()
+        cache = Cache(10, "lru", ttl=5, clock=clock)
+        cache.put('a', 1)
+        clock.now = 2
+        cache.put('b', 2)
+        clock.now = 4
+        cache.put('a', 3)
+        clock.now = 7
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 3)
+
+        clock.now = 9
+
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.size(), 0)
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 1, "evictions": 0, "expirations": 2})
+
+
+    def test_countExpiredEntries(self):
+        """
+        Count and delete entries once they have outlived their time to live, without reading them first. Expired entries should neither be counted nor deleted.
+        """
+        clock = FakeClock()
+        cache = Cache(10, "lru", ttl=5, clock=clock)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        clock.now = 3
+        cache.put('c', 3)
+        clock.now = 6
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.size(), 1)
+        self.assertFalse(cache.delete('a'))
+        self.assertTrue(cache.delete('c'))
+
+        cache.put('d', 4)
+        clock.now = 11
+
+        self.assertFalse(cache.delete('d'))
+        self.assertEqual(cache.size(), 0)
+        self.assertEqual(cache.stats()["expirations"], 3)
+
+
+    def test_deleteKey(self):
+        """
+        Delete keys from a cache, then clear it. Deleted keys should no longer be cached or evicted.
+        """
+        for policy in ("lru", "lfu"):
+            cache = Cache(3, policy)
+
+            for key in "abc":
+                cache.put(key, key)
+
+            self.assertTrue(cache.delete('b'))
+            self.assertFalse(cache.delete('b'))
+
+            cache.put('d', 'd')
+            cache.put('e', 'e')
+
+            self.assertEqual(cache.size(), 3)
+            self.assertEqual(cache.stats()["evictions"], 1)
+
+            cache.clear()
+
+            self.assertEqual(cache.size(), 0)
+            self.assertEqual(cache.stats()["evictions"], 0)
+            cache.put('a', 'a')
+            self.assertEqual(cache.get('a'), 'a')
+
+
+    def test_policiesMatchReferenceModels(self):
+        """
+        Run the same random workload on LRU and LFU caches and on straightforward models of both policies. The same keys should be cached throughout.
+        """
+        rng = random.Random(3)
+        capacity = 8
+
+        for policy in ("lru", "lfu"):
+            cache = Cache(capacity, policy)
+            model = {}
+            uses = {}
+            clock = 0
+
+            for i in range(3000):
+                key = rng.randrange(20)
+                clock += 1
+
+                if rng.random() < 0.5:
+                    self.assertEqual(cache.get(key), model.get(key))
+
+                    if key in model:
+                        uses[key] = (uses[key][0] + 1, clock)
+                else:
+                    if key not in model and len(model) == capacity:
+                        if policy == "lru":
+                            victim = min(model, key=lambda k: uses[k][1])
+                        else:
+                            victim = min(model, key=lambda k: uses[k])
+
+                        del model[victim]
+                        del uses[victim]
+
+                    count = uses[key][0] + 1 if key in model else 1
+                    model[key] = i
+                    uses[key] = (count, clock)
+                    cache.put(key, i)
+
+                self.assertEqual(sorted(key for key in range(20) if key in cache), sorted(model))
+
+
+    def test_customPolicy(self):
+        """
+        Use a cache with a user-defined `EvictionPolicy`. The cache should evict the keys the policy returns.
+        """
+        class LargestKeyPolicy(EvictionPolicy):
+            def __init__(self):
+                self.keys = set()
+
+            def insert(self, key):
+                self.keys.add(key)
+
+            def remove(self, key):
+                self.keys.discard(key)
+
+            def evict(self):
+                key = max(self.keys)
+                self.keys.remove(key)
+                return key
+
+        cache = Cache(2, LargestKeyPolicy())
+        cache.put(1, 'a')
+        cache.put(5, 'b')
+        cache.put(3, 'c')
+
+        self.assertNotIn(5, cache)
+        self.assertIn(1, cache)
+
+
+
+class TestMemoize(unittest.TestCase):
+
+    def test_memoize(self):
+        """
+        Memoize a function and call it repeatedly. The function should only run on misses, keyed by both positional and keyword arguments.
+        """
+        calls = []
+
+        @memoize(capacity=2)
+        def add(a, b=0):
+            calls.append((a, b))
+            return a + b
+
+        self.assertEqual(add(1, b=2), 3)
+        self.assertEqual(add(1, b=2), 3)
+        self.assertEqual(add(1, 2), 3)
+        self.assertEqual(add(2), 2)
+        self.assertEqual(add(2), 2)
+
+        self.assertEqual(calls, [(1, 2), (1, 2), (2, 0)])
+        self.assertEqual(add.__name__, "add")
+        self.assertEqual(add.cache.stats(), {"hits": 2, "misses": 3, "evictions": 1, "expirations": 0})
+
+
+    def test_memoizeWithExpiry(self):
+        """
+        Memoize a function with a time to live. Results should be recomputed once they have expired.
+        """
+        clock = FakeClock()
+        calls = []
+
+        @memoize(ttl=10, clock=clock)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        square(3)
+        clock.now = 5
+        square(3)
+        clock.now = 10
+        square(3)
+
+        self.assertEqual(calls, [3, 3])
+        self.assertEqual(square.cache.stats()["expirations"], 1)
+
+
+
+
+if __name__ == "__main__":
+    unittest.main()